@@ -0,0 +1,74 @@
+'''
+Measure the throughput of the layout detector for several batch sizes.
+
+The pages are rendered once up front, so only the detection is timed. Each batch size is run after a
+warm-up batch, on the same pages, and the throughput is reported in pages per second. The equation
+detector is not measured: cnstd runs it one image at a time, so the batch size does not change it.
+
+Usage:
+    python benchmarks/detection_batching.py paper.pdf --batch-sizes 1 2 4 8 --device cpu --threads 8
+'''
+
+import argparse
+import time
+from typing import Callable, List
+
+import torch
+from PIL import Image
+
+from scanipy.deeplearning.inferenceprofile import InferenceProfile
+from scanipy.deeplearning.models import LayoutDetector
+from scanipy.pdfhandler import PDFDocument
+
+
+def measure(detector: Callable, images: List[Image.Image], batch_size: int) -> float:
+    """
+    Run a detector over the images in batches and measure its throughput.
+
+    Args:
+        detector (Callable): The detector, called with a list of images.
+        images (List[PIL.Image.Image]): The page images.
+        batch_size (int): The number of images given to the detector at once.
+
+    Returns:
+        float: The throughput, in pages per second.
+    """
+    # Warm up with a first batch, so that lazy initializations are not timed
+    detector(images[:batch_size])
+
+    start = time.perf_counter()
+    for index in range(0, len(images), batch_size):
+        detector(images[index:index + batch_size])
+    return len(images) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('path', help='PDF file whose pages are detected')
+    parser.add_argument('--pages', default=None, help='pages to use, e.g. "1-16"')
+    parser.add_argument('--batch-sizes', type=int, nargs='+', default=[1, 2, 4, 8], help='batch sizes to measure')
+    parser.add_argument('--resolution', type=int, default=200, help='rendering resolution (DPI)')
+    parser.add_argument('--device', default='cpu', help='device of the models')
+    parser.add_argument('--threads', type=int, default=None, help='number of threads (default: every available CPU)')
+    args = parser.parse_args()
+
+    # Use the CPU-tuned profile, or the given number of threads
+    profile = InferenceProfile.cpu() if args.device == 'cpu' else InferenceProfile.cuda(args.device)
+    if args.threads is not None:
+        profile = InferenceProfile(args.device, args.threads, 1, args.threads)
+    profile.apply()
+
+    # Render the pages once, outside of the measurements
+    with PDFDocument(args.path, resolution=args.resolution, pages=args.pages) as document:
+        images = [page.get_image() for page in document]
+
+    detector = LayoutDetector(device=args.device)
+
+    print(f"{len(images)} pages at {args.resolution} DPI on {args.device}, {torch.get_num_threads()} threads")
+    print(f"{'batch size':>10}{'layout (pages/s)':>20}")
+    for batch_size in args.batch_sizes:
+        print(f"{batch_size:>10}{measure(detector, images, batch_size):>20.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,230 @@
+'''
+Report the accuracy and the latency of the int8 quantized LaTeX and table structure models on local samples.
+
+The samples are images in two directories: equation crops (with an optional reference LaTeX file next to
+each image, e.g. sum.png and sum.tex) and table crops. Each model runs on every sample in fp32 and in int8,
+after a warm-up sample:
+
+- equations: the share of the int8 LaTeX identical to the fp32 LaTeX, their mean normalized edit distance,
+  and the exact matches of both with the reference LaTeX when there is one;
+- tables: the share of the fp32 cells (rows, columns, headers) found by the int8 model with the same label
+  and an intersection over union of at least --iou, and the other way round.
+
+The time to load each model is reported too, in fp32 and in int8 (quantizing it at load time).
+
+Usage:
+    python benchmarks/quantization.py --equations samples/equations --tables samples/tables
+'''
+
+import argparse
+import glob
+import os
+import time
+from typing import Callable, List, Tuple
+
+import numpy as np
+import torch
+from PIL import Image
+
+from scanipy.deeplearning.inferenceprofile import InferenceProfile
+from scanipy.deeplearning.models import EquationToLatex, TableStructureAnalyzer
+from scanipy.elements import geometry
+
+
+def load_samples(directory: str) -> List[Tuple[str, Image.Image]]:
+    """
+    Load the images of a sample directory.
+
+    Args:
+        directory (str): The directory of the samples.
+
+    Returns:
+        List[Tuple[str, PIL.Image.Image]]: The path and the RGB image of each sample, sorted by path.
+    """
+    paths = sorted(path for extension in ('png', 'jpg', 'jpeg')
+                   for path in glob.glob(os.path.join(directory, f'*.{extension}')))
+    return [(path, Image.open(path).convert('RGB')) for path in paths]
+
+
+def run(model: Callable, images: List[Image.Image]) -> Tuple[list, float]:
+    """
+    Run a model on every image and measure its latency.
+
+    Args:
+        model (Callable): The model, called with an image.
+        images (List[PIL.Image.Image]): The images.
+
+    Returns:
+        Tuple[list, float]: The output for each image, and the mean time per image in seconds.
+    """
+    # Warm up with the first image, so that lazy initializations are not timed
+    model(images[0])
+
+    start = time.perf_counter()
+    outputs = [model(image) for image in images]
+    return outputs, (time.perf_counter() - start) / len(images)
+
+
+def timed(factory: Callable) -> Tuple[object, float]:
+    """
+    Build a model and measure the time it takes.
+
+    Args:
+        factory (Callable): The function building the model.
+
+    Returns:
+        Tuple[object, float]: The model, and the loading time in seconds.
+    """
+    start = time.perf_counter()
+    model = factory()
+    return model, time.perf_counter() - start
+
+
+def edit_distance(text: str, other_text: str) -> float:
+    """
+    Compute the Levenshtein distance between two strings, normalized by the length of the longest one.
+
+    Args:
+        text (str): A string.
+        other_text (str): Another string.
+
+    Returns:
+        float: The normalized distance (range: 0 to 1).
+    """
+    if not text and not other_text:
+        return 0.0
+    previous = list(range(len(other_text) + 1))
+    for index, character in enumerate(text, 1):
+        current = [index]
+        for other_index, other_character in enumerate(other_text, 1):
+            current.append(min(previous[other_index] + 1, current[other_index - 1] + 1,
+                               previous[other_index - 1] + (character != other_character)))
+        previous = current
+    return previous[-1] / max(len(text), len(other_text))
+
+
+def cell_boxes(cells: List[dict]) -> Tuple[np.ndarray, List[str]]:
+    """
+    Get the boxes and the labels of the cells detected by the table structure pipeline.
+
+    Args:
+        cells (List[dict]): The detections, with their 'label' and 'box'.
+
+    Returns:
+        Tuple[np.ndarray, List[str]]: The (x_min, y_min, x_max, y_max) boxes, shaped (n, 4), and their labels.
+    """
+    boxes = np.array([[cell['box']['xmin'], cell['box']['ymin'], cell['box']['xmax'], cell['box']['ymax']]
+                      for cell in cells], dtype=np.float64).reshape(-1, 4)
+    return boxes, [cell['label'] for cell in cells]
+
+
+def found(cells: List[dict], other_cells: List[dict], iou_threshold: float) -> int:
+    """
+    Count the cells matched by a cell with the same label in the other detections.
+
+    Args:
+        cells (List[dict]): The cells detected by one model.
+        other_cells (List[dict]): The cells detected in the same table by the other model.
+        iou_threshold (float): The intersection over union above which two cells match.
+
+    Returns:
+        int: The number of cells with a match.
+    """
+    if not cells or not other_cells:
+        return 0
+    boxes, labels = cell_boxes(cells)
+    other_boxes, other_labels = cell_boxes(other_cells)
+    same_label = np.array(labels)[:, None] == np.array(other_labels)[None, :]
+    return int(((geometry.intersection_over_union(boxes, other_boxes) >= iou_threshold) & same_label).any(axis=1).sum())
+
+
+def report_equations(directory: str) -> None:
+    """
+    Report the accuracy and the latency of the quantized LaTeX model on the equation samples.
+
+    Args:
+        directory (str): The directory of the equation images and reference LaTeX files.
+    """
+    samples = load_samples(directory)
+    if not samples:
+        print(f"No equation images in {directory}")
+        return
+    images = [image for _, image in samples]
+
+    fp32_model, fp32_time = timed(lambda: EquationToLatex(device='cpu'))
+    int8_model, int8_time = timed(lambda: EquationToLatex(device='cpu', quantize=True))
+
+    fp32_latex, fp32_latency = run(fp32_model, images)
+    int8_latex, int8_latency = run(int8_model, images)
+
+    # Compare the quantized outputs with the fp32 ones, and both with the references when there are some
+    identical = sum(latex == other for latex, other in zip(fp32_latex, int8_latex)) / len(images) * 100
+    distance = np.mean([edit_distance(latex, other) for latex, other in zip(fp32_latex, int8_latex)])
+    references = {}
+    for index, (path, _) in enumerate(samples):
+        reference_path = os.path.splitext(path)[0] + '.tex'
+        if os.path.exists(reference_path):
+            with open(reference_path) as file:
+                references[index] = file.read().strip()
+
+    print(f"Equations: {len(images)} samples, loading the model: fp32 {fp32_time:.1f}s, int8 {int8_time:.1f}s")
+    print(f"  int8 LaTeX identical to fp32: {identical:.1f}%, mean normalized edit distance {distance:.4f}")
+    if references:
+        for name, outputs in (('fp32', fp32_latex), ('int8', int8_latex)):
+            exact = sum(outputs[index].strip() == reference for index, reference in references.items())
+            print(f"  {name} exact matches with the {len(references)} references: {exact / len(references) * 100:.1f}%")
+    print(f"  latency: fp32 {fp32_latency * 1000:.1f} ms, int8 {int8_latency * 1000:.1f} ms ({fp32_latency / int8_latency:.2f}x)")
+
+
+def report_tables(directory: str, iou_threshold: float) -> None:
+    """
+    Report the accuracy and the latency of the quantized table structure model on the table samples.
+
+    Args:
+        directory (str): The directory of the table images.
+        iou_threshold (float): The intersection over union above which two cells match.
+    """
+    samples = load_samples(directory)
+    if not samples:
+        print(f"No table images in {directory}")
+        return
+    images = [image for _, image in samples]
+
+    fp32_model, fp32_time = timed(lambda: TableStructureAnalyzer(device='cpu'))
+    int8_model, int8_time = timed(lambda: TableStructureAnalyzer(device='cpu', quantize=True))
+
+    fp32_cells, fp32_latency = run(fp32_model, images)
+    int8_cells, int8_latency = run(int8_model, images)
+
+    # Count the cells of each model found by the other one
+    fp32_count = sum(len(cells) for cells in fp32_cells)
+    int8_count = sum(len(cells) for cells in int8_cells)
+    recall = sum(found(cells, other, iou_threshold) for cells, other in zip(fp32_cells, int8_cells)) / max(fp32_count, 1) * 100
+    precision = sum(found(other, cells, iou_threshold) for cells, other in zip(fp32_cells, int8_cells)) / max(int8_count, 1) * 100
+
+    print(f"Tables: {len(images)} samples, loading the model: fp32 {fp32_time:.1f}s, int8 {int8_time:.1f}s")
+    print(f"  fp32 cells found by int8: {recall:.1f}% of {fp32_count}, int8 cells found by fp32: {precision:.1f}% of {int8_count} (IoU >= {iou_threshold})")
+    print(f"  latency: fp32 {fp32_latency * 1000:.1f} ms, int8 {int8_latency * 1000:.1f} ms ({fp32_latency / int8_latency:.2f}x)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--equations', default=None, help='directory of equation images (and reference .tex files)')
+    parser.add_argument('--tables', default=None, help='directory of table images')
+    parser.add_argument('--iou', type=float, default=0.5, help='intersection over union of matching table cells')
+    parser.add_argument('--threads', type=int, default=None, help='number of threads (default: every available CPU)')
+    args = parser.parse_args()
+
+    # Quantized models run on the CPU
+    profile = InferenceProfile.cpu() if args.threads is None else InferenceProfile('cpu', args.threads, 1, args.threads)
+    profile.apply()
+    print(f"{torch.get_num_threads()} threads")
+
+    if args.equations is not None:
+        report_equations(args.equations)
+    if args.tables is not None:
+        report_tables(args.tables, args.iou)
+
+
+if __name__ == '__main__':
+    main()
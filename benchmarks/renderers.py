@@ -0,0 +1,77 @@
+'''
+Compare the rasterization backends of scanipy on the same PDF files.
+
+For each backend, the pages are rendered in a fresh process, so that the peak memory
+(maximum resident set size) of one backend does not pollute the other.
+
+Usage:
+    python benchmarks/renderers.py paper.pdf book.pdf --resolution 200
+'''
+
+import argparse
+import multiprocessing
+import resource
+import sys
+import time
+from typing import List, Dict
+
+from scanipy.renderers import RENDERERS
+
+
+def run_backend(name: str, paths: List[str], resolution: int) -> Dict:
+    """
+    Render every page of the given PDF files with a backend.
+
+    Args:
+        name (str): The name of the backend, see scanipy.renderers.RENDERERS.
+        paths (List[str]): The PDF files to render.
+        resolution (int): The resolution (DPI) of the images.
+
+    Returns:
+        Dict: The number of pages, the elapsed time, the peak memory and the size of the images.
+    """
+    pages = 0
+    sizes = []
+    start = time.perf_counter()
+    for path in paths:
+        renderer = RENDERERS[name](path)
+        for page_number in range(1, renderer.page_count() + 1):
+            image = renderer.render(page_number, resolution)
+            sizes.append(image.size)
+            pages += 1
+        renderer.close()
+    elapsed = time.perf_counter() - start
+
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    peak_mb = peak / 1024 ** 2 if sys.platform == 'darwin' else peak / 1024
+
+    return {'pages': pages, 'seconds': elapsed, 'peak_mb': peak_mb, 'sizes': sizes}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('paths', nargs='+', help='PDF files to render')
+    parser.add_argument('--resolution', type=int, default=200, help='rendering resolution (DPI)')
+    args = parser.parse_args()
+
+    context = multiprocessing.get_context('spawn')
+    results = {}
+    for name in RENDERERS:
+        with context.Pool(1) as pool:
+            results[name] = pool.apply(run_backend, (name, args.paths, args.resolution))
+
+    print(f"{'backend':<12}{'pages':>8}{'pages/s':>10}{'peak RSS (MB)':>16}")
+    for name, result in results.items():
+        pages_per_second = result['pages'] / result['seconds'] if result['seconds'] else float('inf')
+        print(f"{name:<12}{result['pages']:>8}{pages_per_second:>10.2f}{result['peak_mb']:>16.1f}")
+
+    # The normalized coordinates of the elements are only valid if every backend has the same geometry
+    reference = results['pdfplumber']['sizes']
+    for name, result in results.items():
+        if result['sizes'] != reference:
+            print(f"WARNING: {name} produced page sizes different from pdfplumber")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,135 @@
+'''
+Soak test: parse the same PDF files over and over in one process and check that memory stays flat.
+
+By default every page of each document is rendered and its text extracted through the character
+index, which exercises the PDF handling without the deep learning models. With --parser, the full
+scanipy.Parser is run instead.
+
+The resident set size (RSS), the open file descriptors, the threads and the child processes are sampled
+after each document. The test fails (exit status 1) if, between the end of the warm-up and the last
+document, the RSS grows by more than --max-growth-mb or the number of any of the handles grows by more
+than --max-handle-growth. With --output, the measurements and the verdict are written as JSON, to keep
+the result of each run and compare them.
+
+Usage:
+    python benchmarks/soak.py paper.pdf book.pdf --documents 1000 --output soak.json
+'''
+
+import argparse
+import gc
+import itertools
+import json
+import multiprocessing
+import sys
+import threading
+import time
+
+import psutil
+
+from scanipy.pdfhandler import PDFDocument
+
+
+def parse_document(path: str, args: argparse.Namespace, parser=None) -> None:
+    """
+    Parse one document, releasing everything before returning.
+
+    Args:
+        path (str): The PDF file to parse.
+        args (argparse.Namespace): The command line arguments.
+        parser (scanipy.Parser, optional): The parser to run, or None to only render the pages and extract their text.
+    """
+    if parser is not None:
+        parser.extract(path)
+        return
+
+    with PDFDocument(path, lazy=True, renderer=args.renderer, resolution=args.resolution) as document:
+        for page in document:
+            page.get_image()
+            pdf_page = page.get_pdf()
+            page.get_char_index().extract_text((0, 0, pdf_page.width, pdf_page.height))
+            page.release()
+
+
+def sample(process: psutil.Process) -> dict:
+    """
+    Measure the resources held by the current process.
+
+    Args:
+        process (psutil.Process): The current process.
+
+    Returns:
+        dict: The RSS in MB, and the number of open file descriptors, threads and child processes.
+    """
+    return {
+        'rss_mb': process.memory_info().rss / 1024 ** 2,
+        'open_files': process.num_fds() if hasattr(process, 'num_fds') else process.num_handles(),
+        'threads': threading.active_count(),
+        'children': len(multiprocessing.active_children()),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('paths', nargs='+', help='PDF files to parse, in turn')
+    parser.add_argument('--documents', type=int, default=1000, help='number of documents to parse')
+    parser.add_argument('--warmup', type=int, default=50, help='number of documents parsed before the reference RSS is taken')
+    parser.add_argument('--max-growth-mb', type=float, default=50.0, help='allowed RSS growth after the warm-up')
+    parser.add_argument('--max-handle-growth', type=int, default=0,
+                        help='allowed growth of the open files, threads and child processes after the warm-up')
+    parser.add_argument('--report-every', type=int, default=100, help='print the RSS every N documents')
+    parser.add_argument('--renderer', default='pdfplumber', help='rasterization backend')
+    parser.add_argument('--resolution', type=int, default=200, help='rendering resolution (DPI)')
+    parser.add_argument('--parser', action='store_true', help='run the full scanipy.Parser (loads the models)')
+    parser.add_argument('--output', default=None, help='JSON file where the measurements and the verdict are written')
+    args = parser.parse_args()
+
+    if args.warmup >= args.documents:
+        parser.error('--warmup must be smaller than --documents')
+
+    scanipy_parser = None
+    if args.parser:
+        from scanipy import Parser
+        scanipy_parser = Parser(renderer=args.renderer, resolution=args.resolution)
+
+    process = psutil.Process()
+    reference = None
+    samples = []
+    start = time.perf_counter()
+    for number, path in enumerate(itertools.islice(itertools.cycle(args.paths), args.documents), start=1):
+        parse_document(path, args, scanipy_parser)
+
+        # Collect cycles so that the RSS only reflects memory that is actually retained
+        gc.collect()
+        current = sample(process)
+        if number == args.warmup:
+            reference = current
+        if number % args.report_every == 0 or number == args.documents:
+            samples.append(dict(current, documents=number, seconds=time.perf_counter() - start))
+            print(f"{number:>6} documents  {current['rss_mb']:>9.1f} MB RSS  {current['open_files']:>5} files  "
+                  f"{current['threads']:>4} threads  {current['children']:>3} children  {time.perf_counter() - start:>8.1f} s")
+
+    # Compare the last measurements with the ones taken at the end of the warm-up
+    growth = {name: current[name] - reference[name] for name in current}
+    failures = []
+    if growth['rss_mb'] > args.max_growth_mb:
+        failures.append(f"RSS grew by {growth['rss_mb']:+.1f} MB (allowed: {args.max_growth_mb} MB)")
+    for name in ('open_files', 'threads', 'children'):
+        if growth[name] > args.max_handle_growth:
+            failures.append(f"{name} grew by {growth[name]:+d} (allowed: {args.max_handle_growth})")
+
+    print(f"Growth after the warm-up: RSS {growth['rss_mb']:+.1f} MB, open files {growth['open_files']:+d}, "
+          f"threads {growth['threads']:+d}, children {growth['children']:+d}")
+    if args.output is not None:
+        with open(args.output, 'w') as file:
+            json.dump({'paths': args.paths, 'documents': args.documents, 'warmup': args.warmup,
+                       'max_growth_mb': args.max_growth_mb, 'max_handle_growth': args.max_handle_growth,
+                       'reference': reference, 'samples': samples, 'growth': growth,
+                       'passed': not failures, 'failures': failures}, file, indent=2)
+    if failures:
+        for failure in failures:
+            print(f"FAILED: {failure}")
+        sys.exit(1)
+    print("PASSED")
+
+if __name__ == '__main__':
+    main()
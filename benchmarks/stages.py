@@ -0,0 +1,46 @@
+'''
+Compare the parsing time of a full run with runs restricted to some element types.
+
+Each configuration is warmed up (its models loaded) before the document is parsed, so only the parsing is
+timed. Disabled element types skip their stages: a text-only run needs neither the equation detector, the
+LaTeX conversion nor the table structure model.
+
+Usage:
+    python benchmarks/stages.py book.pdf --pages 1-300
+'''
+
+import argparse
+import time
+
+import scanipy
+
+# The element types of each configuration, None for every type
+CONFIGURATIONS = {
+    'full': None,
+    'text and titles': ['text', 'title'],
+    'text, titles and images': ['text', 'title', 'image'],
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('path', help='PDF file to parse')
+    parser.add_argument('--pages', default=None, help='pages to parse, e.g. "1-300"')
+    parser.add_argument('--batch-size', type=int, default=1, help='number of pages given to the detectors at once')
+    args = parser.parse_args()
+
+    durations = {}
+    for name, elements in CONFIGURATIONS.items():
+        with scanipy.Parser(elements=elements, batch_size=args.batch_size) as document_parser:
+            document_parser.warmup()
+            start = time.perf_counter()
+            document_parser.extract(args.path, pages=args.pages)
+            durations[name] = time.perf_counter() - start
+
+    print(f"{'elements':>25}{'time (s)':>12}{'speed-up':>10}")
+    for name, duration in durations.items():
+        print(f"{name:>25}{duration:>12.2f}{durations['full'] / duration:>10.2f}")
+
+
+if __name__ == '__main__':
+    main()
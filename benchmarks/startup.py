@@ -0,0 +1,91 @@
+'''
+Compare the startup cost of lazy and eager model loading.
+
+Each run happens in a fresh Python process, like a worker cold start. A run builds a scanipy.Parser,
+then, in eager mode, loads every model with Parser.warmup(). It reports the time until the parser is
+ready, the time until the first document is parsed, and the resident set size (RSS) at both points.
+
+With lazy loading, the first document pays for the models its pages need, and only for those: a
+document without tables or equations never loads the table and LaTeX models.
+
+Usage:
+    python benchmarks/startup.py paper.pdf --runs 3
+'''
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+import psutil
+
+
+def run_once(path: str, mode: str, pages) -> dict:
+    """
+    Build a parser and parse one document, in the current process.
+
+    Args:
+        path (str): The PDF file to parse.
+        mode (str): 'lazy' or 'eager'.
+        pages: The pages to parse, or None for every page.
+
+    Returns:
+        dict: The timings, in seconds, and the RSS, in MB, once the parser is ready and after the document.
+    """
+    process = psutil.Process()
+    start = time.perf_counter()
+
+    # The import is timed as well, it is part of the cold start
+    import scanipy
+    parser = scanipy.Parser()
+    if mode == 'eager':
+        parser.warmup()
+    ready = time.perf_counter()
+    ready_rss = process.memory_info().rss / 2**20
+
+    parser.extract(path, pages=pages)
+    done = time.perf_counter()
+
+    return {
+        'ready_s': ready - start,
+        'ready_rss_mb': ready_rss,
+        'first_document_s': done - start,
+        'first_document_rss_mb': process.memory_info().rss / 2**20,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('path', help='PDF file parsed after startup')
+    parser.add_argument('--pages', default=None, help='pages to parse, e.g. "1-4"')
+    parser.add_argument('--runs', type=int, default=3, help='number of cold starts per mode')
+    parser.add_argument('--mode', choices=['lazy', 'eager'], default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    # A child process measures a single cold start and prints it as JSON
+    if args.mode is not None:
+        print(json.dumps(run_once(args.path, args.mode, args.pages)))
+        return
+
+    results = {}
+    for mode in ('lazy', 'eager'):
+        runs = []
+        for _ in range(args.runs):
+            command = [sys.executable, __file__, args.path, '--mode', mode]
+            if args.pages is not None:
+                command += ['--pages', args.pages]
+            output = subprocess.run(command, check=True, capture_output=True, text=True).stdout
+            runs.append(json.loads(output.strip().splitlines()[-1]))
+        results[mode] = {key: statistics.median(run[key] for run in runs) for key in runs[0]}
+
+    print(f"median of {args.runs} cold starts")
+    print(f"{'mode':>6}{'ready (s)':>12}{'ready RSS (MB)':>16}{'first doc (s)':>15}{'first doc RSS (MB)':>20}")
+    for mode, result in results.items():
+        print(f"{mode:>6}{result['ready_s']:>12.2f}{result['ready_rss_mb']:>16.0f}"
+              f"{result['first_document_s']:>15.2f}{result['first_document_rss_mb']:>20.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1 +1,4 @@
-from scanipy.parser import Parser
\ No newline at end of file
+from scanipy.parser import Parser
+from scanipy.parseresult import ParseResult
+from scanipy.deeplearning.inferenceprofile import InferenceProfile
+from scanipy.markdownwriter import MarkdownWriter
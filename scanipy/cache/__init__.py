@@ -0,0 +1,3 @@
+from .diskcache import DiskCache
+from .rendercache import RenderCache
+from .resultcache import ResultCache
@@ -0,0 +1,198 @@
+import os
+import tempfile
+from filelock import FileLock
+from typing import Callable, List, Tuple, Union, BinaryIO
+
+
+class DiskCache:
+    """
+    A size-bounded directory of cache entries, evicted in least recently used order.
+
+    Entries are written to a temporary file and atomically renamed, so several processes can share the
+    same directory: a reader never sees a partially written entry. Reading an entry refreshes its
+    modification time, which is used as the LRU clock. Evictions are serialized with a lock file.
+
+    The total size is scanned once, then tracked as entries are written, and the directory is only walked
+    to evict when the tracked size goes over max_bytes. The eviction then frees a tenth of the budget, so
+    that a full cache is not walked again on the next write. Since other processes may write to the same
+    directory, the size is also scanned again every rescan_interval writes.
+
+    Attributes:
+        directory (str): The directory where the entries are stored.
+        max_bytes (int): The maximum total size of the entries, in bytes.
+        rescan_interval (int): The number of writes after which the size of the directory is scanned again.
+    """
+
+    def __init__(self, directory: str, max_bytes: int, rescan_interval: int = 100):
+        """
+        Initialize the cache, creating its directory if needed.
+
+        Args:
+            directory (str): The directory where the entries are stored.
+            max_bytes (int): The maximum total size of the entries, in bytes.
+            rescan_interval (int, optional): The number of writes after which the size of the directory is
+                scanned again, to account for the entries written by other processes. Defaults to 100.
+
+        Raises:
+            TypeError: If the types of the arguments are not as expected.
+            ValueError: If max_bytes or rescan_interval is not positive.
+        """
+        # Verify the input variable types
+        if not isinstance(directory, (str, os.PathLike)):
+            raise TypeError("directory must be a string or a path")
+        if not isinstance(max_bytes, int):
+            raise TypeError("max_bytes must be an integer")
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        if not isinstance(rescan_interval, int) or rescan_interval <= 0:
+            raise ValueError("rescan_interval must be a positive integer")
+
+        self.directory = os.fspath(directory)
+        self.max_bytes = max_bytes
+        self.rescan_interval = rescan_interval
+        self._tracked_size = None
+        self._writes = 0
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, key: str, suffix: str) -> str:
+        """
+        Get the path of an entry. Entries are spread in subdirectories named after the key prefix.
+
+        Args:
+            key (str): The hexadecimal key of the entry.
+            suffix (str): The file extension of the entry.
+
+        Returns:
+            str: The path of the entry.
+        """
+        return os.path.join(self.directory, key[:2], key + suffix)
+
+    def _lookup(self, path: str) -> bool:
+        """
+        Check whether an entry exists and mark it as recently used.
+
+        Args:
+            path (str): The path of the entry.
+
+        Returns:
+            bool: True if the entry exists.
+        """
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return False
+        return True
+
+    def _write(self, path: str, write: Callable[[BinaryIO], None]) -> None:
+        """
+        Atomically write an entry and evict old entries if the tracked size is over the budget.
+
+        Args:
+            path (str): The path of the entry.
+            write (Callable[[BinaryIO], None]): A function writing the entry content to a binary file.
+        """
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+
+        # Write to a temporary file in the same directory, then rename it over the entry
+        descriptor, temporary_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(descriptor, 'wb') as file:
+                write(file)
+            written = os.path.getsize(temporary_path)
+            replaced = os.path.getsize(path) if os.path.exists(path) else 0
+            os.replace(temporary_path, path)
+        except BaseException:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+            raise
+
+        # Track the size, scanning the directory only once in a while or when the budget is exceeded
+        self._writes += 1
+        if self._tracked_size is None or self._writes % self.rescan_interval == 0:
+            self._tracked_size = self.size()
+        else:
+            self._tracked_size += written - replaced
+        if self._tracked_size > self.max_bytes:
+            self.evict(self.max_bytes - self.max_bytes // 10)
+
+    def _entries(self) -> List[Tuple[float, int, str]]:
+        """
+        List the entries of the cache.
+
+        Returns:
+            List[Tuple[float, int, str]]: The modification time, size and path of each entry.
+        """
+        entries = []
+        for root, _, filenames in os.walk(self.directory):
+            for filename in filenames:
+                if filename.endswith('.tmp') or filename.endswith('.lock'):
+                    continue
+                path = os.path.join(root, filename)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def size(self) -> int:
+        """
+        Get the total size of the entries.
+
+        Returns:
+            int: The total size, in bytes.
+        """
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self, max_bytes: Union[int, None] = None) -> int:
+        """
+        Remove the least recently used entries until the cache fits in its size budget.
+
+        Args:
+            max_bytes (Union[int, None], optional): The size budget, in bytes. Defaults to None (max_bytes of the cache).
+
+        Returns:
+            int: The number of bytes freed.
+        """
+        max_bytes = self.max_bytes if max_bytes is None else max_bytes
+        freed = 0
+        with FileLock(os.path.join(self.directory, '.evict.lock')):
+            entries = sorted(self._entries())
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in entries:
+                if total <= max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+                total -= size
+                freed += size
+        self._tracked_size = total
+        return freed
+
+    def clear(self) -> None:
+        """
+        Remove every entry of the cache.
+        """
+        self.evict(max_bytes=0)
+
+    def __repr__(self) -> str:
+        """
+        Returns the official string representation of the cache.
+
+        Returns:
+            str: A string that can be used to recreate the cache.
+        """
+        return (f"{type(self).__name__}(directory='{self.directory}', max_bytes={self.max_bytes}, "
+                f"rescan_interval={self.rescan_interval})")
+
+    def __str__(self) -> str:
+        """
+        Returns a string representation of the cache, which is the same as its official representation.
+
+        Returns:
+            str: A string that can be used to recreate the cache.
+        """
+        return self.__repr__()
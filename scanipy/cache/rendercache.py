@@ -0,0 +1,115 @@
+import hashlib
+import numpy as np
+from PIL import Image
+from typing import Union
+from .diskcache import DiskCache
+
+
+class RenderCache(DiskCache):
+    """
+    A persistent, content-addressed cache of rendered page images.
+
+    Entries are keyed by the hash of the PDF content, the page number, the resolution and the colour mode.
+    The raw pixel buffers are stored as .npy files, so they are memory-mapped back without any decoding.
+
+    Example:
+        >>> cache = RenderCache('/tmp/scanipy-renders', max_bytes=4 * 1024 ** 3)
+        >>> parser = Parser(render_cache=cache)
+    """
+
+    def __init__(self, directory: str, max_bytes: int = 2 * 1024 ** 3):
+        """
+        Initialize the render cache.
+
+        Args:
+            directory (str): The directory where the page images are stored.
+            max_bytes (int): The maximum total size of the page images, in bytes. Defaults to 2 GiB.
+        """
+        super().__init__(directory, max_bytes)
+
+    @staticmethod
+    def hash_file(filepath: str) -> str:
+        """
+        Compute the hash identifying the content of a PDF file.
+
+        Args:
+            filepath (str): The path to the PDF file.
+
+        Returns:
+            str: The hexadecimal SHA-256 digest of the file.
+        """
+        digest = hashlib.sha256()
+        with open(filepath, 'rb') as file:
+            for chunk in iter(lambda: file.read(1024 * 1024), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _entry_path(self, pdf_hash: str, page_number: int, resolution: int, mode: str) -> str:
+        """
+        Get the path of the entry of a page image.
+
+        Args:
+            pdf_hash (str): The hash of the PDF content, see hash_file.
+            page_number (int): The number of the page, starting at 1.
+            resolution (int): The resolution (DPI) of the image.
+            mode (str): The PIL colour mode of the image.
+
+        Returns:
+            str: The path of the entry.
+        """
+        key = hashlib.sha256(f'{pdf_hash}:{page_number}:{resolution}:{mode}'.encode()).hexdigest()
+        return self._path(key, '.npy')
+
+    def get_array(self, pdf_hash: str, page_number: int, resolution: int, mode: str = 'RGB') -> Union[np.ndarray, None]:
+        """
+        Get a cached page image as a read-only memory-mapped array.
+
+        Args:
+            pdf_hash (str): The hash of the PDF content, see hash_file.
+            page_number (int): The number of the page, starting at 1.
+            resolution (int): The resolution (DPI) of the image.
+            mode (str): The PIL colour mode of the image. Defaults to 'RGB'.
+
+        Returns:
+            Union[np.ndarray, None]: The pixels (height x width x channels), or None if the page is not cached.
+        """
+        path = self._entry_path(pdf_hash, page_number, resolution, mode)
+        if not self._lookup(path):
+            return None
+        try:
+            return np.load(path, mmap_mode='r')
+        except FileNotFoundError:
+            # The entry was evicted by another process in the meantime
+            return None
+
+    def get(self, pdf_hash: str, page_number: int, resolution: int, mode: str = 'RGB') -> Union[Image.Image, None]:
+        """
+        Get a cached page image.
+
+        Args:
+            pdf_hash (str): The hash of the PDF content, see hash_file.
+            page_number (int): The number of the page, starting at 1.
+            resolution (int): The resolution (DPI) of the image.
+            mode (str): The PIL colour mode of the image. Defaults to 'RGB'.
+
+        Returns:
+            Union[PIL.Image.Image, None]: The page image, or None if the page is not cached.
+        """
+        array = self.get_array(pdf_hash, page_number, resolution, mode)
+        if array is None:
+            return None
+        return Image.fromarray(array, mode)
+
+    def put(self, pdf_hash: str, page_number: int, resolution: int, image: Image.Image) -> None:
+        """
+        Store a page image in the cache.
+
+        Args:
+            pdf_hash (str): The hash of the PDF content, see hash_file.
+            page_number (int): The number of the page, starting at 1.
+            resolution (int): The resolution (DPI) of the image.
+            image (PIL.Image.Image): The page image.
+        """
+        path = self._entry_path(pdf_hash, page_number, resolution, image.mode)
+        array = np.asarray(image)
+        self._write(path, lambda file: np.save(file, array, allow_pickle=False))
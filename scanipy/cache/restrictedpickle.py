@@ -0,0 +1,85 @@
+import importlib
+import pickle
+from typing import Any, BinaryIO
+
+# The globals a pickled parsing result refers to, besides the element classes: the Document, the numpy arrays
+# and scalars (numpy 1 and 2 module names), the pandas DataFrames of the tables and the PIL images of the figures
+_ALLOWED_GLOBALS = {
+    ('builtins', 'slice'),
+    ('scanipy.document', 'Document'),
+    ('numpy', 'dtype'),
+    ('numpy', 'ndarray'),
+    ('numpy.core.multiarray', '_reconstruct'),
+    ('numpy.core.multiarray', 'scalar'),
+    ('numpy.core.numeric', '_frombuffer'),
+    ('numpy._core.multiarray', '_reconstruct'),
+    ('numpy._core.multiarray', 'scalar'),
+    ('numpy._core.numeric', '_frombuffer'),
+    ('pandas.core.frame', 'DataFrame'),
+    ('pandas.core.internals.managers', 'BlockManager'),
+    ('pandas._libs.internals', '_unpickle_block'),
+    ('pandas.core.indexes.base', 'Index'),
+    ('pandas.core.indexes.base', '_new_Index'),
+    ('pandas.core.indexes.range', 'RangeIndex'),
+    ('pandas.core.indexes.numeric', 'Int64Index'),
+    ('PIL.Image', 'Image'),
+}
+
+# The package of the element classes, any subclass of Element in it is allowed
+_ELEMENTS_PACKAGE = 'scanipy.elements'
+
+
+class RestrictedUnpickler(pickle.Unpickler):
+    """
+    An unpickler that only rebuilds parsing results: the scanipy elements and documents, numpy arrays,
+    pandas DataFrames and PIL images. Any other class or function, such as os.system, raises an
+    UnpicklingError instead of being called, so a forged file in a shared cache or checkpoint directory
+    cannot run code in the parser. It can still hold wrong results, so the directory should only be
+    writable by trusted users.
+
+    Example:
+        >>> with open(path, 'rb') as file:
+        ...     elements, equations = RestrictedUnpickler(file).load()
+    """
+
+    def find_class(self, module: str, name: str) -> Any:
+        """
+        Get a class or a function referred to by the pickle, if it is allowed.
+
+        Args:
+            module (str): The module of the global.
+            name (str): The name of the global.
+
+        Returns:
+            Any: The class or function.
+
+        Raises:
+            pickle.UnpicklingError: If the global is not allowed in a parsing result.
+        """
+        if (module, name) in _ALLOWED_GLOBALS:
+            return super().find_class(module, name)
+
+        # Allow the element classes, looked up without importing anything outside the elements package
+        if module == _ELEMENTS_PACKAGE or module.startswith(_ELEMENTS_PACKAGE + '.'):
+            from scanipy.elements import Element
+
+            value = getattr(importlib.import_module(module), name, None)
+            if isinstance(value, type) and issubclass(value, Element):
+                return value
+        raise pickle.UnpicklingError(f"{module}.{name} is not allowed in a parsing result")
+
+
+def restricted_load(file: BinaryIO) -> Any:
+    """
+    Read a pickled parsing result with a RestrictedUnpickler.
+
+    Args:
+        file (BinaryIO): The file, opened in binary mode.
+
+    Returns:
+        Any: The parsing result.
+
+    Raises:
+        pickle.UnpicklingError: If the pickle refers to a global that is not allowed in a parsing result.
+    """
+    return RestrictedUnpickler(file).load()
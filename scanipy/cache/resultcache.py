@@ -0,0 +1,157 @@
+import hashlib
+import importlib.metadata
+import logging
+import pickle
+from typing import Any, Iterable, List, Tuple, Union
+from .diskcache import DiskCache
+from .restrictedpickle import restricted_load
+
+# The packages whose versions can change the parsing results: the models and the PDF backends
+MODEL_PACKAGES = ('torch', 'torchvision', 'layoutparser', 'detectron2', 'cnstd', 'pix2text', 'pix2tex',
+                  'transformers', 'easyocr', 'pytesseract', 'pdfplumber', 'pdfminer.six', 'PyMuPDF', 'pypdfium2')
+
+# The version of the format of the cached results, to increase when the parsing code changes its results
+RESULT_FORMAT = 3
+
+
+class ResultCache(DiskCache):
+    """
+    A persistent, content-addressed cache of parsing results, for whole documents and for single pages.
+
+    Documents are keyed by the hash of the PDF content and the page selection, pages by the hash of their
+    content (see PDFPage.content_hash), so a page is found again even in another PDF file. Both keys
+    include a fingerprint of the parser settings and of the versions of the models, so changing either
+    never returns stale results.
+
+    The results are stored pickled, and read back with a RestrictedUnpickler, which only rebuilds elements,
+    documents, numpy arrays, pandas DataFrames and PIL images, so that an entry forged in a shared directory
+    cannot run code in the parser. A forged entry can still hold wrong results: the directory should only be
+    writable by trusted users.
+
+    Example:
+        >>> cache = ResultCache('/tmp/scanipy-results', max_bytes=4 * 1024 ** 3)
+        >>> parser = Parser(result_cache=cache)
+    """
+
+    def __init__(self, directory: str, max_bytes: int = 1024 ** 3):
+        """
+        Initialize the result cache.
+
+        Args:
+            directory (str): The directory where the results are stored.
+            max_bytes (int): The maximum total size of the results, in bytes. Defaults to 1 GiB.
+        """
+        super().__init__(directory, max_bytes)
+
+    @staticmethod
+    def key(*parts: Any) -> str:
+        """
+        Compute a key from its parts.
+
+        Args:
+            *parts (Any): The parts of the key, converted to strings.
+
+        Returns:
+            str: The hexadecimal SHA-256 digest of the parts.
+        """
+        return hashlib.sha256(':'.join(str(part) for part in parts).encode()).hexdigest()
+
+    @classmethod
+    def fingerprint(cls, settings: dict, packages: Iterable[str] = MODEL_PACKAGES) -> str:
+        """
+        Compute the fingerprint of a parser configuration: its settings and the versions of the packages it uses.
+
+        Args:
+            settings (dict): The settings affecting the results, with printable values.
+            packages (Iterable[str]): The packages whose versions affect the results. Defaults to MODEL_PACKAGES.
+
+        Returns:
+            str: The fingerprint.
+        """
+        versions = []
+        for package in packages:
+            try:
+                versions.append((package, importlib.metadata.version(package)))
+            except importlib.metadata.PackageNotFoundError:
+                versions.append((package, None))
+        return cls.key(RESULT_FORMAT, sorted(settings.items()), versions)
+
+    def _get(self, key: str, suffix: str) -> Any:
+        """
+        Get a cached result.
+
+        Args:
+            key (str): The key of the result.
+            suffix (str): The file extension of the kind of result.
+
+        Returns:
+            Any: The result, or None if it is not cached or cannot be read.
+        """
+        path = self._path(key, suffix)
+        if not self._lookup(path):
+            return None
+        try:
+            with open(path, 'rb') as file:
+                return restricted_load(file)
+        except FileNotFoundError:
+            # The entry was evicted by another process in the meantime
+            return None
+        except Exception as error:
+            logging.warning(f"Ignoring the unreadable cached result {path}: {error}")
+            return None
+
+    def _put(self, key: str, suffix: str, result: Any) -> None:
+        """
+        Store a result.
+
+        Args:
+            key (str): The key of the result.
+            suffix (str): The file extension of the kind of result.
+            result (Any): The result, which must be picklable.
+        """
+        self._write(self._path(key, suffix), lambda file: pickle.dump(result, file, protocol=pickle.HIGHEST_PROTOCOL))
+
+    def get_document(self, key: str) -> Any:
+        """
+        Get a cached Document.
+
+        Args:
+            key (str): The key of the document.
+
+        Returns:
+            Union[Document, None]: The document, or None if it is not cached.
+        """
+        return self._get(key, '.document.pkl')
+
+    def put_document(self, key: str, document: Any) -> None:
+        """
+        Store a Document.
+
+        Args:
+            key (str): The key of the document.
+            document (Document): The parsed document.
+        """
+        self._put(key, '.document.pkl', document)
+
+    def get_page(self, key: str) -> Union[Tuple[List, List], None]:
+        """
+        Get the cached elements of a page.
+
+        Args:
+            key (str): The key of the page.
+
+        Returns:
+            Union[Tuple[List, List], None]: The extracted elements and equations of the page, or None if it is not cached.
+        """
+        return self._get(key, '.page.pkl')
+
+    def put_page(self, key: str, elements: List, equations: List) -> None:
+        """
+        Store the elements of a page.
+
+        Args:
+            key (str): The key of the page.
+            elements (List): The extracted elements of the page.
+            equations (List): The extracted equations of the page.
+        """
+        self._put(key, '.page.pkl', (elements, equations))
@@ -0,0 +1,126 @@
+import math
+from collections import defaultdict
+from typing import Dict, List, Tuple, Union
+from pdfplumber import utils
+
+
+class CharIndex:
+    """
+    A spatial grid over the characters of a PDF page, to extract the text of many regions of the page.
+
+    Cropping a pdfplumber page filters every character of the page, so extracting the text of N regions
+    scans the character list N times. The index buckets the characters in square cells once, and each
+    region only looks at the characters of the cells it covers. The text is the same as the one of
+    pdf_page.crop(bbox).extract_text(**kwargs).
+
+    Attributes:
+        chars (List[Dict]): The pdfplumber characters of the page.
+        cell_size (float): The size of the cells of the grid, in PDF points.
+    """
+
+    def __init__(self, chars: List[Dict], cell_size: float = 50.0):
+        """
+        Build the index over the characters of a page.
+
+        Args:
+            chars (List[Dict]): The pdfplumber characters of the page (pdf_page.chars).
+            cell_size (float): The size of the cells of the grid, in PDF points. Defaults to 50.
+
+        Raises:
+            ValueError: If cell_size is not positive.
+        """
+        if cell_size <= 0:
+            raise ValueError("cell_size must be positive")
+
+        self.chars = chars
+        self.cell_size = cell_size
+
+        # Bucket the position of each character in every cell it overlaps
+        self._grid = defaultdict(list)
+        for position, char in enumerate(chars):
+            for cell in self._cells((char['x0'], char['top'], char['x1'], char['bottom'])):
+                self._grid[cell].append(position)
+
+    def _cells(self, bbox: Tuple[float, float, float, float]) -> List[Tuple[int, int]]:
+        """
+        List the cells of the grid overlapped by a bounding box.
+
+        Args:
+            bbox (Tuple[float, float, float, float]): The bounding box (x0, top, x1, bottom), in PDF points.
+
+        Returns:
+            List[Tuple[int, int]]: The (column, row) of each cell.
+        """
+        x0, top, x1, bottom = bbox
+        columns = range(math.floor(x0 / self.cell_size), math.floor(x1 / self.cell_size) + 1)
+        rows = range(math.floor(top / self.cell_size), math.floor(bottom / self.cell_size) + 1)
+        return [(column, row) for column in columns for row in rows]
+
+    def crop(self, bbox: Tuple[float, float, float, float]) -> List[Dict]:
+        """
+        Get the characters of a region, clipped to it as pdfplumber does when cropping a page.
+
+        Args:
+            bbox (Tuple[float, float, float, float]): The region (x0, top, x1, bottom), in PDF points.
+
+        Returns:
+            List[Dict]: The characters overlapping the region, in page order.
+        """
+        positions = set()
+        for cell in self._cells(bbox):
+            positions.update(self._grid.get(cell, ()))
+        candidates = [self.chars[position] for position in sorted(positions)]
+        return utils.crop_to_bbox(candidates, bbox)
+
+    def extract_text(self, bbox: Tuple[float, float, float, float], **kwargs) -> str:
+        """
+        Extract the text of a region, like pdf_page.crop(bbox).extract_text(**kwargs).
+
+        Args:
+            bbox (Tuple[float, float, float, float]): The region (x0, top, x1, bottom), in PDF points.
+            **kwargs: The text extraction settings of pdfplumber (x_tolerance, y_tolerance, layout...).
+
+        Returns:
+            str: The text of the region.
+        """
+        x0, top, x1, bottom = bbox
+        settings = dict(x_shift=x0, y_shift=top, layout_width=x1 - x0, layout_height=bottom - top)
+        settings.update(kwargs)
+        return utils.chars_to_textmap(self.crop(bbox), **settings).as_string
+
+    @staticmethod
+    def intersect(bbox: Tuple[float, float, float, float],
+                  other: Tuple[float, float, float, float]) -> Union[Tuple[float, float, float, float], None]:
+        """
+        Intersect two bounding boxes, as nested pdfplumber crops do.
+
+        Args:
+            bbox (Tuple[float, float, float, float]): A bounding box (x0, top, x1, bottom).
+            other (Tuple[float, float, float, float]): Another bounding box (x0, top, x1, bottom).
+
+        Returns:
+            Union[Tuple[float, float, float, float], None]: The intersection, or None if the boxes do not overlap.
+        """
+        x0, top = max(bbox[0], other[0]), max(bbox[1], other[1])
+        x1, bottom = min(bbox[2], other[2]), min(bbox[3], other[3])
+        if x0 > x1 or top > bottom:
+            return None
+        return x0, top, x1, bottom
+
+    def __repr__(self) -> str:
+        """
+        Returns the official string representation of the CharIndex object.
+
+        Returns:
+            str: A string representation of the object.
+        """
+        return f"CharIndex(chars={len(self.chars)}, cell_size={self.cell_size}, cells={len(self._grid)})"
+
+    def __str__(self) -> str:
+        """
+        Returns a string representation of the CharIndex object, which is the same as its official representation.
+
+        Returns:
+            str: A string representation of the object.
+        """
+        return self.__repr__()
@@ -0,0 +1,135 @@
+import logging
+import os
+import pickle
+import re
+import shutil
+import tempfile
+from typing import Dict, List, Tuple
+from .cache.restrictedpickle import restricted_load
+
+# The file of the results of a page in a checkpoint directory
+_PAGE_FILE = re.compile(r'page-(\d+)\.pkl')
+
+
+class Checkpoint:
+    """
+    The results of the pages of a document parsed so far, persisted as each page is finished.
+
+    Each page is stored in a file of its own, written to a temporary file and atomically renamed, so a
+    crash leaves either the complete page or nothing. Parsing the same document again with the same
+    configuration loads the finished pages instead of parsing them.
+
+    Pages are stored pickled and read back with a RestrictedUnpickler (see scanipy.cache.restrictedpickle), so a
+    forged page file cannot run code in the parser. It can still hold wrong results, so the directory should
+    only be writable by trusted users.
+
+    Example:
+        >>> checkpoint = Checkpoint('/tmp/scanipy-checkpoints', document_key)
+        >>> finished_pages = checkpoint.load()
+        >>> checkpoint.save(page_number, elements, equations)
+        >>> checkpoint.remove()  # once the document is complete
+
+    Attributes:
+        directory (str): The directory of the checkpoint of the document.
+    """
+
+    def __init__(self, root: str, key: str):
+        """
+        Initialize the checkpoint of a document.
+
+        Args:
+            root (str): The directory holding the checkpoints of every document.
+            key (str): The key identifying the document and the configuration parsing it.
+
+        Raises:
+            TypeError: If the types of the arguments are not as expected.
+        """
+        # Verify the input variable types
+        if not isinstance(root, (str, os.PathLike)):
+            raise TypeError("root must be a string or a path")
+        if not isinstance(key, str):
+            raise TypeError("key must be a string")
+
+        self.directory = os.path.join(os.fspath(root), key)
+
+    def _page_path(self, page_number: int) -> str:
+        """
+        Get the path of the file of a page.
+
+        Args:
+            page_number (int): The number of the page, starting at 1.
+
+        Returns:
+            str: The path of the file.
+        """
+        return os.path.join(self.directory, f'page-{page_number:06d}.pkl')
+
+    def load(self) -> Dict[int, Tuple[List, List]]:
+        """
+        Load the finished pages.
+
+        Returns:
+            Dict[int, Tuple[List, List]]: The extracted elements and equations of each finished page, by page number.
+        """
+        if not os.path.isdir(self.directory):
+            return {}
+
+        pages = {}
+        for filename in os.listdir(self.directory):
+            match = _PAGE_FILE.fullmatch(filename)
+            if match is None:
+                continue
+            path = os.path.join(self.directory, filename)
+            try:
+                with open(path, 'rb') as file:
+                    pages[int(match.group(1))] = restricted_load(file)
+            except Exception as error:
+                # The page is parsed again
+                logging.warning(f"Ignoring the unreadable checkpoint {path}: {error}")
+        return pages
+
+    def save(self, page_number: int, elements: List, equations: List) -> None:
+        """
+        Persist the results of a finished page.
+
+        Args:
+            page_number (int): The number of the page, starting at 1.
+            elements (List): The extracted elements of the page, with their content.
+            equations (List): The extracted equations of the page.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+
+        # Write to a temporary file in the same directory, then rename it over the page file
+        descriptor, temporary_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(descriptor, 'wb') as file:
+                pickle.dump((elements, equations), file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary_path, self._page_path(page_number))
+        except BaseException:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+            raise
+
+    def remove(self) -> None:
+        """
+        Remove the checkpoint, once the document is complete.
+        """
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def __repr__(self) -> str:
+        """
+        Returns the official string representation of the Checkpoint object.
+
+        Returns:
+            str: A string representation of the object.
+        """
+        return f"Checkpoint(directory='{self.directory}')"
+
+    def __str__(self) -> str:
+        """
+        Returns a string representation of the Checkpoint object, which is the same as its official representation.
+
+        Returns:
+            str: A string representation of the object.
+        """
+        return self.__repr__()
@@ -0,0 +1,224 @@
+import logging
+import os
+from typing import Union
+
+import torch
+from threadpoolctl import threadpool_limits
+
+# Environment variables read by the native thread pools when they start (OpenMP, MKL, OpenBLAS, numexpr)
+_NATIVE_THREAD_VARIABLES = ('OMP_NUM_THREADS', 'MKL_NUM_THREADS', 'OPENBLAS_NUM_THREADS', 'NUMEXPR_NUM_THREADS')
+
+
+def available_cpus() -> int:
+    """
+    Get the number of CPUs the current process may run on.
+
+    Unlike os.cpu_count(), this accounts for the CPU affinity of the process (taskset, container cpusets).
+
+    Returns:
+        int: The number of usable CPUs.
+    """
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+class InferenceProfile:
+    """
+    The device and the threading configuration used to run every model of scanipy.
+
+    The device is given to each model wrapper. The thread counts are settings of the whole process: apply()
+    sets the intra-op and inter-op thread pools of torch, and limits the native thread pools (OpenMP, MKL,
+    OpenBLAS, OpenCV) and the OpenMP threads of the Tesseract processes.
+
+    Example:
+        >>> profile = InferenceProfile.cpu(processes=4)  # 4 worker processes sharing the CPUs
+        >>> parser = Parser(profile=profile)
+
+    Attributes:
+        device (str): The torch device of the models, 'cpu' or 'cuda' (optionally with an index, 'cuda:1').
+        intra_op_threads (Union[int, None]): The number of threads used inside an operator, or None to keep the default.
+        inter_op_threads (Union[int, None]): The number of threads running independent operators, or None to keep the default.
+        native_threads (Union[int, None]): The maximum number of threads of the native thread pools, or None for no limit.
+    """
+
+    def __init__(self, device: str = 'cpu', intra_op_threads: Union[int, None] = None,
+                 inter_op_threads: Union[int, None] = None, native_threads: Union[int, None] = None):
+        """
+        Initialize an inference profile.
+
+        Args:
+            device (str): The torch device of the models, 'cpu' or 'cuda' (optionally with an index). Defaults to 'cpu'.
+            intra_op_threads (Union[int, None]): The number of threads used inside an operator. Defaults to None (torch default).
+            inter_op_threads (Union[int, None]): The number of threads running independent operators. Defaults to None (torch default).
+            native_threads (Union[int, None]): The maximum number of threads of the native thread pools. Defaults to None (no limit).
+
+        Raises:
+            TypeError: If device is not a string.
+            ValueError: If device is not a CPU or CUDA device, or a thread count is not a positive integer.
+        """
+        # Verify the input variable types
+        if not isinstance(device, str):
+            raise TypeError("device must be a string")
+        if device != 'cpu' and device.split(':')[0] != 'cuda':
+            raise ValueError("device must be 'cpu', 'cuda' or 'cuda:<index>'")
+        for name, threads in (('intra_op_threads', intra_op_threads), ('inter_op_threads', inter_op_threads),
+                              ('native_threads', native_threads)):
+            if threads is not None and (not isinstance(threads, int) or threads < 1):
+                raise ValueError(f"{name} must be a positive integer or None")
+
+        self.device = device
+        self.intra_op_threads = intra_op_threads
+        self.inter_op_threads = inter_op_threads
+        self.native_threads = native_threads
+        self._native_limits = None
+
+    @classmethod
+    def cpu(cls, processes: int = 1) -> 'InferenceProfile':
+        """
+        Get the CPU-tuned profile: the available CPUs are shared evenly between the processes, and each
+        process runs one operator at a time over its share of the CPUs, without oversubscribing them.
+
+        Args:
+            processes (int): The number of processes running models on the same CPUs. Defaults to 1.
+
+        Returns:
+            InferenceProfile: The CPU profile of one process.
+
+        Raises:
+            ValueError: If processes is not a positive integer.
+        """
+        if not isinstance(processes, int) or processes < 1:
+            raise ValueError("processes must be a positive integer")
+
+        threads = max(1, available_cpus() // processes)
+        return cls('cpu', intra_op_threads=threads, inter_op_threads=1, native_threads=threads)
+
+    @classmethod
+    def cuda(cls, device: str = 'cuda') -> 'InferenceProfile':
+        """
+        Get a GPU profile. The thread pools keep their defaults, since the models run on the GPU.
+
+        Args:
+            device (str): The CUDA device, 'cuda' or 'cuda:<index>'. Defaults to 'cuda'.
+
+        Returns:
+            InferenceProfile: The GPU profile.
+        """
+        return cls(device)
+
+    @classmethod
+    def default(cls) -> 'InferenceProfile':
+        """
+        Get the profile of a parser created without one: CUDA if available, the CPU otherwise, with every
+        thread count left as it is. Applying it changes nothing in the process.
+
+        Returns:
+            InferenceProfile: The default profile.
+        """
+        return cls('cuda' if torch.cuda.is_available() else 'cpu')
+
+    @classmethod
+    def auto(cls) -> 'InferenceProfile':
+        """
+        Get the GPU profile if CUDA is available, the CPU-tuned profile otherwise.
+
+        Returns:
+            InferenceProfile: The profile suited to the current machine.
+        """
+        return cls.cuda() if torch.cuda.is_available() else cls.cpu()
+
+    @property
+    def uses_cuda(self) -> bool:
+        """
+        Whether the models run on a CUDA device.
+
+        Returns:
+            bool: True for a CUDA device, False for the CPU.
+        """
+        return self.device != 'cpu'
+
+    def split(self, processes: int) -> 'InferenceProfile':
+        """
+        Get the profile of one of several processes sharing the thread budget of this profile.
+
+        Args:
+            processes (int): The number of processes.
+
+        Returns:
+            InferenceProfile: The profile of each process, with the thread counts divided between the processes.
+
+        Raises:
+            ValueError: If processes is not a positive integer.
+        """
+        if not isinstance(processes, int) or processes < 1:
+            raise ValueError("processes must be a positive integer")
+
+        def share(threads: Union[int, None]) -> Union[int, None]:
+            return None if threads is None else max(1, threads // processes)
+
+        return InferenceProfile(self.device, share(self.intra_op_threads), self.inter_op_threads,
+                                share(self.native_threads))
+
+    def apply(self) -> None:
+        """
+        Apply the thread configuration to the current process.
+
+        The environment variables only affect the native thread pools started afterwards (and the Tesseract
+        processes), so the profile is best applied before the models are loaded. The inter-op thread count
+        of torch can only be set before its first parallel work; a later change is ignored with a warning.
+        """
+        # Configure the thread pools of torch
+        if self.intra_op_threads is not None:
+            torch.set_num_threads(self.intra_op_threads)
+        if self.inter_op_threads is not None and torch.get_num_interop_threads() != self.inter_op_threads:
+            try:
+                torch.set_num_interop_threads(self.inter_op_threads)
+            except RuntimeError:
+                logging.warning("The inter-op thread count of torch can no longer be changed in this process, "
+                                f"keeping {torch.get_num_interop_threads()} threads")
+
+        if self.native_threads is None:
+            return
+
+        # Limit the native thread pools that are not started yet, then the ones already loaded
+        for variable in _NATIVE_THREAD_VARIABLES:
+            os.environ[variable] = str(self.native_threads)
+        # Tesseract runs in subprocesses, which read this variable
+        os.environ['OMP_THREAD_LIMIT'] = str(self.native_threads)
+        self._native_limits = threadpool_limits(limits=self.native_threads)
+        try:
+            import cv2
+            cv2.setNumThreads(self.native_threads)
+        except ImportError:
+            pass
+
+    def __getstate__(self) -> dict:
+        """
+        Get the state sent to other processes, without the limits applied to the current one.
+
+        Returns:
+            dict: The picklable state of the profile.
+        """
+        state = self.__dict__.copy()
+        state['_native_limits'] = None
+        return state
+
+    def __repr__(self) -> str:
+        """
+        Returns the official string representation of the InferenceProfile object.
+
+        Returns:
+            str: A string that can be used to recreate the InferenceProfile object.
+        """
+        return (f"InferenceProfile(device='{self.device}', intra_op_threads={self.intra_op_threads}, "
+                f"inter_op_threads={self.inter_op_threads}, native_threads={self.native_threads})")
+
+    def __str__(self) -> str:
+        """
+        Returns a string representation of the InferenceProfile object, which is the same as its official representation.
+
+        Returns:
+            str: A string that can be used to recreate the InferenceProfile object.
+        """
+        return self.__repr__()
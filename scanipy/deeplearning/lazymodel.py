@@ -0,0 +1,118 @@
+import threading
+from typing import Any, Callable
+
+
+class LazyModel:
+    """
+    A model loaded on first use.
+
+    Calling the holder, or reading an attribute it does not have, loads the model once and forwards to it,
+    so a LazyModel can stand in for the model it builds. Loading is thread-safe: when several threads need
+    the model at the same time, the first one loads it and the others wait for it. If loading fails, the
+    error is raised to the caller and the next use tries again.
+
+    Example:
+        >>> detector = LazyModel(functools.partial(LayoutDetector, device='cpu'))
+        >>> detector.loaded
+        False
+        >>> elements = detector(image, page_number)  # loads the model, then runs it
+
+    Attributes:
+        factory (Callable[[], Any]): The function building the model.
+    """
+
+    def __init__(self, factory: Callable[[], Any]):
+        """
+        Initialize the holder, without loading the model.
+
+        Args:
+            factory (Callable[[], Any]): The function building the model, called without arguments.
+
+        Raises:
+            TypeError: If factory is not callable.
+        """
+        # Verify the input variable types
+        if not callable(factory):
+            raise TypeError("factory must be callable")
+
+        self.factory = factory
+        self._model = None
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        """
+        Whether the model is loaded.
+
+        Returns:
+            bool: True if the model was built, False otherwise.
+        """
+        return self._model is not None
+
+    def get(self) -> Any:
+        """
+        Get the model, loading it if it is not loaded yet.
+
+        Returns:
+            Any: The model.
+        """
+        # Only take the lock until the model is loaded
+        model = self._model
+        if model is None:
+            with self._lock:
+                if self._model is None:
+                    self._model = self.factory()
+                model = self._model
+        return model
+
+    def unload(self) -> None:
+        """
+        Drop the model, freeing its memory once the callers running it are done. The next use loads it again.
+        """
+        with self._lock:
+            self._model = None
+
+    def __call__(self, *args, **kwargs) -> Any:
+        """
+        Run the model, loading it if needed.
+
+        Returns:
+            Any: The output of the model.
+        """
+        return self.get()(*args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        """
+        Get an attribute of the model, loading it if needed. Only called for the attributes the holder lacks.
+
+        Args:
+            name (str): The name of the attribute.
+
+        Returns:
+            Any: The attribute of the model.
+        """
+        # The attributes of the holder itself are missing while it is being built or copied
+        if name in ('factory', '_model', '_lock'):
+            raise AttributeError(name)
+        return getattr(self.get(), name)
+
+    def __repr__(self) -> str:
+        """
+        Returns the official string representation of the LazyModel object, without loading the model.
+
+        Returns:
+            str: A string representation of the object.
+        """
+        if self._model is not None:
+            return f"LazyModel({self._model!r})"
+        factory = getattr(self.factory, 'func', self.factory)
+        return f"LazyModel({getattr(factory, '__name__', type(factory).__name__)}, loaded=False)"
+
+    def __str__(self) -> str:
+        """
+        Returns a string representation of the LazyModel object, which is the same as its official representation.
+
+        Returns:
+            str: A string representation of the object.
+        """
+        return self.__repr__()
@@ -0,0 +1,155 @@
+import functools
+import threading
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+from .lazymodel import LazyModel
+
+
+class ModelRegistry:
+    """
+    Hands out shared instances of the models, so that identical models are loaded once per process.
+
+    A model is identified by its type (the factory building it) and the arguments given to the factory,
+    such as its device and language. Every acquire returns the same LazyModel for the same key and counts
+    a reference, which release gives back. When the last reference is released, the model is unloaded
+    and removed from the registry.
+
+    Example:
+        >>> ocr = MODEL_REGISTRY.acquire(TextOCR, 'en', 'cpu')
+        >>> ocr is MODEL_REGISTRY.acquire(TextOCR, 'en', 'cpu')
+        True
+        >>> MODEL_REGISTRY.release(ocr)
+        >>> MODEL_REGISTRY.release(ocr)  # the last reference, the model is unloaded
+    """
+
+    def __init__(self):
+        """
+        Initialize an empty registry.
+        """
+        self._models: Dict[Hashable, LazyModel] = {}
+        self._references: Dict[Hashable, int] = {}
+        self._keys: Dict[int, Hashable] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(factory: Callable[..., Any], *args, **kwargs) -> Tuple:
+        """
+        Get the key identifying a model.
+
+        Args:
+            factory (Callable[..., Any]): The function or class building the model.
+            *args: The positional arguments of the factory.
+            **kwargs: The keyword arguments of the factory.
+
+        Returns:
+            Tuple: The key of the model.
+        """
+        return (factory, args, tuple(sorted(kwargs.items())))
+
+    def acquire(self, factory: Callable[..., Any], *args, **kwargs) -> LazyModel:
+        """
+        Get the shared model built by factory(*args, **kwargs), and count a reference to it.
+
+        The model itself is loaded on first use, see LazyModel.
+
+        Args:
+            factory (Callable[..., Any]): The function or class building the model.
+            *args: The positional arguments of the factory, which must be hashable.
+            **kwargs: The keyword arguments of the factory, which must be hashable.
+
+        Returns:
+            LazyModel: The shared model.
+
+        Raises:
+            TypeError: If factory is not callable or an argument is not hashable.
+        """
+        # Verify the input variable types
+        if not callable(factory):
+            raise TypeError("factory must be callable")
+
+        key = self.key(factory, *args, **kwargs)
+        with self._lock:
+            model = self._models.get(key)
+            if model is None:
+                model = LazyModel(functools.partial(factory, *args, **kwargs))
+                self._models[key] = model
+                self._references[key] = 0
+                self._keys[id(model)] = key
+            self._references[key] += 1
+        return model
+
+    def release(self, model: LazyModel) -> None:
+        """
+        Give back a reference to a shared model, unloading the model if it was the last one.
+
+        Args:
+            model (LazyModel): A model returned by acquire.
+
+        Raises:
+            ValueError: If the model is not in the registry.
+        """
+        with self._lock:
+            key = self._keys.get(id(model))
+            if key is None or self._models[key] is not model:
+                raise ValueError("The model is not in the registry")
+            self._references[key] -= 1
+            if self._references[key] > 0:
+                return
+            del self._models[key], self._references[key], self._keys[id(model)]
+        model.unload()
+
+    def unload(self) -> None:
+        """
+        Unload every model, without removing them: the models still referenced are loaded again on their next use.
+        """
+        with self._lock:
+            models = list(self._models.values())
+        for model in models:
+            model.unload()
+
+    def references(self, model: LazyModel) -> int:
+        """
+        Get the number of references to a shared model.
+
+        Args:
+            model (LazyModel): A model returned by acquire.
+
+        Returns:
+            int: The number of references, 0 if the model is not in the registry.
+        """
+        with self._lock:
+            key = self._keys.get(id(model))
+            return 0 if key is None else self._references[key]
+
+    def __len__(self) -> int:
+        """
+        Get the number of models in the registry.
+
+        Returns:
+            int: The number of distinct models referenced.
+        """
+        return len(self._models)
+
+    def __repr__(self) -> str:
+        """
+        Returns the official string representation of the ModelRegistry object.
+
+        Returns:
+            str: A string representation of the object.
+        """
+        with self._lock:
+            loaded = sum(model.loaded for model in self._models.values())
+            return f"ModelRegistry(models={len(self._models)}, loaded={loaded})"
+
+    def __str__(self) -> str:
+        """
+        Returns a string representation of the ModelRegistry object, which is the same as its official representation.
+
+        Returns:
+            str: A string representation of the object.
+        """
+        return self.__repr__()
+
+
+# The registry shared by every parser of the process
+MODEL_REGISTRY = ModelRegistry()
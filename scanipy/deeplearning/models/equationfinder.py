@@ -1,7 +1,9 @@
 import PIL
+import numpy as np
 from typing import Union, List
 from cnstd import LayoutAnalyzer
 from scanipy.elements import EquationElement
+from scanipy.elements import geometry
 
 class EquationFinder:
     """
@@ -23,16 +25,42 @@ class EquationFinder:
         """
         Initialize the EquationFinder class by loading the pre-trained model for equation detection.
         Args:
-            device: The device on which the Yolov7 model will run.
+            device: The device on which the Yolov7 model will run: 'cpu', or 'cuda' (or 'cuda:0'), given to cnstd
+                as 'gpu'. cnstd only runs on the first GPU, and selects it with CUDA_VISIBLE_DEVICES.
         """
 
-        # Verify the type of the device argument
-        if not isinstance(device, str):
-            raise TypeError("Device must be a string.")
+        # Verify the device, and get the name cnstd gives to it
+        cnstd_device = self.cnstd_device(device)
           
         # Load the pre-trained Layout Analyzer from CNSTD
         self.model = LayoutAnalyzer(model_name='mfd',
-                                    device=device)
+                                    device=cnstd_device)
+
+    @staticmethod
+    def cnstd_device(device: str) -> str:
+        """
+        Get the name cnstd gives to a device, checking that the equation finder can run on it.
+
+        The Parser calls it when it is built, since the finder itself is only built on first use.
+
+        Args:
+            device (str): The torch device, 'cpu', 'cuda' or 'cuda:0'.
+
+        Returns:
+            str: The cnstd device, 'cpu' or 'gpu'.
+
+        Raises:
+            TypeError: If the device is not a string.
+            ValueError: If the device is another GPU than the first one.
+        """
+        # Verify the type of the device argument
+        if not isinstance(device, str):
+            raise TypeError("Device must be a string.")
+        if device.split(':')[0] != 'cuda':
+            return device
+        if device not in ('cuda', 'cuda:0'):
+            raise ValueError("The equation finder only runs on the first GPU, 'cuda' or 'cuda:0'.")
+        return 'gpu'
 
     def __str__(self):
         """
@@ -57,9 +85,12 @@ class EquationFinder:
         return f"EquationFinder(device='{self.model.device}')"
 
 
-    def __call__(self, image: PIL.Image, pipeline_step: Union[int, None] = None) -> List[EquationElement]:
+    def __call__(self, image: PIL.Image.Image, pipeline_step: Union[int, None] = None) -> List[EquationElement]:
         """
         Detects equation elements in the given image and returns them as a list.
+
+        cnstd's Layout Analyzer runs one image at a time (given a list, it loops over the images), so pages
+        are not batched here: the Parser calls the finder once per page, whatever its batch_size.
         
         Args:
             image (PIL.Image): The image in which to detect layout elements.
@@ -68,38 +99,42 @@ class EquationFinder:
         Returns:
             empty_elements (List[EquationElement]): A list of detected layout elements, but only with its positions (no extracted content yet).
         """
+        # Verify the type of the image argument
+        if not isinstance(image, PIL.Image.Image):
+            raise TypeError("Image must be a PIL.Image object.")
+
         # Use the loaded model to detect equations in the given image
         equations = self.model(image)
-        empty_elements = []
 
-        # Getting image width and height 
-        width, height = image.size
-        
-        for equation in equations:
-          
-            # Getting position values
-            x_min, y_min = equation['box'][0]
-            x_max, y_max = equation['box'][2]
-
-            # Verify if x_min is less than x_max and y_min is less than y_max
-            if x_min >= x_max or y_min >= y_max:
-                raise ValueError("Invalid coordinates: x_min should be less than x_max and y_min should be less than y_max")
+        return self._to_elements(equations, image.size, pipeline_step)
 
+    def _to_elements(self, equations: List[dict], image_size: tuple, pipeline_step: Union[int, None]) -> List[EquationElement]:
+        """
+        Converts the equations detected by the Layout Analyzer to elements with normalized coordinates.
 
-            # Normalizing coordinates to be in range [0,1]
-            x_min = x_min/width
-            x_max = x_max/width
-            y_min = y_min/height
-            y_max = y_max/height
+        Args:
+            equations (List[dict]): The detected equations, with their 'box' and 'type'.
+            image_size (tuple): The width and height of the image the equations were detected in.
+            pipeline_step (int or None): An optional integer representing the step in a pipeline.
 
-            # Verifying if the equation is in the middle of  text
-            is_inside_text = bool(equation['type']=='embedding')
+        Returns:
+            List[EquationElement]: The detected equations.
+        """
+        # Take the top-left and bottom-right corners of the boxes as one array
+        corners = np.array([equation['box'] for equation in equations], dtype=np.float64).reshape(-1, 4, 2)
+        boxes = np.concatenate([corners[:, 0], corners[:, 2]], axis=1)
 
-            # Creating element
-            element = EquationElement(x_min, y_min, x_max, y_max, pipeline_step, is_inside_text=is_inside_text)
+        # Normalizing coordinates to be in range [0,1], verifying that x_min < x_max and y_min < y_max
+        width, height = image_size
+        boxes = geometry.normalize_boxes(boxes, width, height)
 
-            # Adding EquationElement in the list
+        # Creating the elements, verifying if each equation is in the middle of text
+        empty_elements = []
+        for (x_min, y_min, x_max, y_max), equation in zip(boxes.tolist(), equations):
+            score = equation.get('score')
+            element = EquationElement.from_trusted(x_min, y_min, x_max, y_max, pipeline_step,
+                                                   is_inside_text=equation['type'] == 'embedding',
+                                                   score=None if score is None else float(score))
             empty_elements.append(element)
-          
+
         return empty_elements
-        
@@ -1,5 +1,7 @@
 import pickle
+from munch import Munch
 from pix2tex.cli import LatexOCR
+from scanipy.deeplearning.quantization import quantize_linear_layers
 
 
 class EquationToLatex:
@@ -13,6 +15,8 @@ class EquationToLatex:
 
     Attributes:
         model (object): The loaded pix2tex model for LaTeX OCR.
+        device (str): The device of the model, 'cpu' or 'cuda'.
+        quantize (bool): Whether the linear layers of the model run in int8.
 
     Example:
         >>> equation_to_latex = EquationToLatex()
@@ -20,12 +24,36 @@ class EquationToLatex:
         >>> latex_code = equation_to_latex(image)
     """
 
-    def __init__(self):
+    def __init__(self, device: str = 'cpu', quantize: bool = False):
         """
         Initialize the EquationToLatex class by loading the pre-trained pix2tex model.
+
+        Args:
+            device (str): The device of the model, 'cpu' or 'cuda'. Defaults to 'cpu'.
+            quantize (bool): Whether to quantize the linear layers of the encoder and the decoder to int8
+                (dynamic quantization, CPU only). Defaults to False.
+
+        Raises:
+            TypeError: If the types of the arguments are not as expected.
+            ValueError: If quantize is True on another device than the CPU.
         """
-        # Load the pre-trained pix2tex model from a pickle file
-        self.model = LatexOCR()
+        # Verify the input variable types
+        if not isinstance(quantize, bool):
+            raise TypeError("quantize must be a boolean")
+        if quantize and device != 'cpu':
+            raise ValueError("Quantized models run on the CPU only")
+
+        self.device = device
+        self.quantize = quantize
+
+        # Load the pre-trained pix2tex model with its default settings, on the requested device
+        arguments = Munch({'config': 'settings/config.yaml', 'checkpoint': 'checkpoints/weights.pth',
+                           'no_cuda': device == 'cpu', 'no_resize': False})
+        self.model = LatexOCR(arguments)
+
+        # Replace the model with its int8 version, keeping the image resizer and the tokenizer
+        if quantize:
+            self.model.model = quantize_linear_layers(self.model.model.eval())
 
     def __call__(self, image):
         """
@@ -46,7 +74,7 @@ class EquationToLatex:
         Returns:
             str: A string that can be used to recreate the EquationToLatex object.
         """
-        return "EquationToLatex()"
+        return f"EquationToLatex(device='{self.device}', quantize={self.quantize})"
 
     def __str__(self):
         """
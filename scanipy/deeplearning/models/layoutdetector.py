@@ -2,9 +2,19 @@ import PIL
 import PIL.Image
 from PIL import Image, ImageDraw
 import fitz
-from typing import Union, List
+import numpy as np
+import torch
+from typing import Union, List, Iterable
 from layoutparser.models import Detectron2LayoutModel
 from scanipy.elements import TextElement,TitleElement,ImageElement,TableElement,EquationElement
+from scanipy.elements import geometry
+
+# The element class of each type of block detected by the model
+_ELEMENT_CLASSES = {"List": TextElement, #TODO
+                    "Text": TextElement,
+                    "Title": TitleElement,
+                    "Figure": ImageElement,
+                    "Table": TableElement}
 
 
 class LayoutDetector:
@@ -54,17 +64,33 @@ class LayoutDetector:
         """
         return self.__repr__()
 
-    def __call__(self, image: PIL.Image.Image, page_number: Union[int, None] = None) -> List[Union[TextElement, TitleElement, ImageElement, TableElement]]:
+    def __call__(self, image: Union[PIL.Image.Image, List[PIL.Image.Image]],
+                 page_number: Union[int, Iterable[Union[int, None]], None] = None
+                 ) -> Union[List[Union[TextElement, TitleElement, ImageElement, TableElement]],
+                            List[List[Union[TextElement, TitleElement, ImageElement, TableElement]]]]:
         """
-        Detects layout elements in the given image and returns them as a list.
-        
+        Detects layout elements in the given image, or in a batch of images, and returns them as a list.
+
+        A list of images is run through the model in a single forward pass, which makes better use of the
+        vectorized kernels than one call per page. Images of the same size give the same elements as when
+        they are detected one by one.
+
         Args:
-            image: The image in which to detect layout elements.
-            page_number: An optional integer representing the page number. Defaults to None.
-        
+            image: The image in which to detect layout elements, or a list of page images.
+            page_number: An optional integer representing the page number, or one page number per image
+                for a list of images. Defaults to None.
+
         Returns:
             empty_elements: A list of detected layout elements, but only with its positions (no extracted content yet).
+                For a list of images, one such list per image.
         """
+        # Detect the elements of a batch of images
+        if isinstance(image, list):
+            page_numbers = [None] * len(image) if page_number is None else list(page_number)
+            if len(page_numbers) != len(image):
+                raise ValueError("page_number must give one page number per image.")
+            return self._detect_batch(image, page_numbers)
+
         # Verify the type of the image argument
         if not isinstance(image, PIL.Image.Image):
             raise TypeError("Image must be a PIL.Image object.")
@@ -73,42 +99,95 @@ class LayoutDetector:
         if not (isinstance(page_number, int) or page_number is None):
             raise TypeError("page_number must be an integer or None.")
         
-        # Perform layout detection on the image and convert the result to a DataFrame
-        layout = self.model.detect(image).to_dataframe()
-        
-        # Initialize an empty list to store detected elements
+        # Perform layout detection on the image
+        layout = self.model.detect(image)
+
+        # Take the boxes, types and scores of the blocks as arrays
+        boxes = np.array([block.coordinates for block in layout], dtype=np.float64).reshape(-1, 4)
+        labels = [block.type for block in layout]
+        scores = np.array([block.score for block in layout], dtype=np.float64)
+
+        return self._to_elements(boxes, labels, scores, image.size, page_number)
+
+    def _detect_batch(self, images: List[PIL.Image.Image], page_numbers: List[Union[int, None]]
+                      ) -> List[List[Union[TextElement, TitleElement, ImageElement, TableElement]]]:
+        """
+        Detects the layout elements of a batch of images in a single forward pass of the Detectron2 model.
+
+        The images are prepared exactly as DefaultPredictor does for a single image, then given together
+        to the underlying model, which pads them into one tensor.
+
+        Args:
+            images (List[PIL.Image.Image]): The page images.
+            page_numbers (List[Union[int, None]]): The page number of each image.
+
+        Returns:
+            List[List[Union[TextElement, TitleElement, ImageElement, TableElement]]]: The elements detected in each image.
+        """
+        # Verify the types of the images and page numbers
+        for image, page_number in zip(images, page_numbers):
+            if not isinstance(image, PIL.Image.Image):
+                raise TypeError("Image must be a PIL.Image object.")
+            if not (isinstance(page_number, int) or page_number is None):
+                raise TypeError("page_number must be an integer or None.")
+        if not images:
+            return []
+
+        # Build the model inputs as DefaultPredictor does, from the arrays given by layoutparser
+        predictor = self.model.model
+        inputs = []
+        for image in images:
+            array = self.model.image_loader(image)
+            if predictor.input_format == "RGB":
+                array = array[:, :, ::-1]
+            height, width = array.shape[:2]
+            resized = predictor.aug.get_transform(array).apply_image(array)
+            tensor = torch.as_tensor(resized.astype("float32").transpose(2, 0, 1))
+            inputs.append({"image": tensor, "height": height, "width": width})
+
+        # Run the whole batch at once
+        with torch.no_grad():
+            outputs = predictor.model(inputs)
+
+        # Convert each prediction to elements, straight from the tensors of the predicted instances
+        batch_elements = []
+        for output, image, page_number in zip(outputs, images, page_numbers):
+            instances = output["instances"].to("cpu")
+            boxes = instances.pred_boxes.tensor.numpy().astype(np.float64)
+            labels = [self.model.label_map.get(label, label) for label in instances.pred_classes.tolist()]
+            scores = instances.scores.numpy().astype(np.float64)
+            batch_elements.append(self._to_elements(boxes, labels, scores, image.size, page_number))
+        return batch_elements
+
+    def _to_elements(self, boxes: np.ndarray, labels: List[str], scores: np.ndarray, image_size: tuple[int, int],
+                     page_number: Union[int, None]) -> List[Union[TextElement, TitleElement, ImageElement, TableElement]]:
+        """
+        Converts the blocks detected by the model to elements with normalized coordinates.
+
+        The boxes are normalized and checked all at once, then the elements are built without checking
+        each of their coordinates again (see Element.from_trusted).
+
+        Args:
+            boxes (np.ndarray): The (x_1, y_1, x_2, y_2) boxes of the blocks in pixels, shaped (n, 4).
+            labels (List[str]): The type of each block, e.g. "Text" or "Figure".
+            scores (np.ndarray): The detection score of each block, shaped (n,).
+            image_size (tuple[int, int]): The width and height of the image the blocks were detected in.
+            page_number (Union[int, None]): The page number of the image.
+
+        Returns:
+            List[Union[TextElement, TitleElement, ImageElement, TableElement]]: The detected elements.
+        """
+        # Normalizing coordinates to be in range [0,1]
+        width, height = image_size
+        boxes = geometry.normalize_boxes(boxes, width, height)
+
+        # Create the element of each block of a known type, in the order of detection
         elements = []
+        for (x_min, y_min, x_max, y_max), label, score in zip(boxes.tolist(), labels, scores.tolist()):
+            element_class = _ELEMENT_CLASSES.get(label)
+            if element_class is not None:
+                elements.append(element_class.from_trusted(x_min, y_min, x_max, y_max, page_number=page_number, score=score))
 
-        # Getting image width and height 
-        width, height = image.size
-        
-        # Iterate through each block in the DataFrame
-        for _, block in layout.iterrows():
-            # Extract coordinates of the bounding box
-            x_min, y_min, x_max, y_max = block.x_1, block.y_1, block.x_2, block.y_2
-
-            # Normalizing coordinates to be in range [0,1]
-            x_min = x_min/width
-            x_max = x_max/width
-            y_min = y_min/height
-            y_max = y_max/height
-            
-            # Use pattern matching to identify the type of the block and create the corresponding element
-            element = None # Make sure that a new element is assigned
-            match block.type:
-                case "List": #TODO
-                    element = TextElement(x_min, y_min, x_max, y_max, page_number=page_number)
-                case "Text":
-                    element = TextElement(x_min, y_min, x_max, y_max, page_number=page_number)
-                case "Title":
-                    element = TitleElement(x_min, y_min, x_max, y_max, page_number=page_number)
-                case "Figure":
-                    element = ImageElement(x_min, y_min, x_max, y_max, page_number=page_number)
-                case "Table":
-                    element = TableElement(x_min, y_min, x_max, y_max, page_number=page_number)
-            # Append the detected element to the list
-            elements.append(element)
-        
         # Return the list of detected elements
         return elements
 
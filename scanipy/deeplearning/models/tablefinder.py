@@ -20,6 +20,7 @@ class TableFinder:
     Source: https://github.com/microsoft/table-transformer
 
     Attributes:
+        device (str): The device of the model, 'cpu' or 'cuda'.
         model (object): The loaded fine-tuned Table Transformer model for table detection.
 
     Example:
@@ -27,12 +28,17 @@ class TableFinder:
         >>> detection_result = finder(image)
     """
 
-    def __init__(self):
+    def __init__(self, device: str = 'cpu'):
         """
         Initialize the TableFinder class by loading the pre-trained model for table detection.
+
+        Args:
+            device (str): The device of the model, 'cpu' or 'cuda'. Defaults to 'cpu'.
         """
+        self.device = device
+
         # Load the pre-trained Table Transformer model from a pickle file for table detection
-        self.model = pipeline("object-detection", model="microsoft/table-transformer-detection")
+        self.model = pipeline("object-detection", model="microsoft/table-transformer-detection", device=device)
 
     def __call__(self, image):
         """
@@ -1,5 +1,6 @@
 import pickle
 from transformers import pipeline
+from scanipy.deeplearning.quantization import quantize_linear_layers
 
 
 class TableStructureAnalyzer:
@@ -12,19 +13,43 @@ class TableStructureAnalyzer:
     Source: https://github.com/microsoft/table-transformer
 
     Attributes:
+        device (str): The device of the model, 'cpu' or 'cuda'.
         model (object): The loaded fine-tuned Table Transformer model.
+        quantize (bool): Whether the linear layers of the model run in int8.
 
     Example:
         >>> analyzer = TableStructureAnalyzer()
         >>> result = analyzer(image)
     """
 
-    def __init__(self):
+    def __init__(self, device: str = 'cpu', quantize: bool = False):
         """
         Initialize the TableStructureAnalyzer by loading the pre-trained model.
+
+        Args:
+            device (str): The device of the model, 'cpu' or 'cuda'. Defaults to 'cpu'.
+            quantize (bool): Whether to quantize the linear layers of the transformer and of the prediction
+                heads to int8 (dynamic quantization, CPU only). Defaults to False.
+
+        Raises:
+            TypeError: If the types of the arguments are not as expected.
+            ValueError: If quantize is True on another device than the CPU.
         """
+        # Verify the input variable types
+        if not isinstance(quantize, bool):
+            raise TypeError("quantize must be a boolean")
+        if quantize and device != 'cpu':
+            raise ValueError("Quantized models run on the CPU only")
+
+        self.device = device
+        self.quantize = quantize
+
         # Load the fine-tuned Table Transformer model from a pickle file
-        self.model = pipeline("object-detection", model="microsoft/table-transformer-structure-recognition")
+        self.model = pipeline("object-detection", model="microsoft/table-transformer-structure-recognition", device=device)
+
+        # Replace the model of the pipeline with its int8 version, keeping the image processor
+        if quantize:
+            self.model.model = quantize_linear_layers(self.model.model.eval())
 
     def __repr__(self):
         """
@@ -33,7 +58,7 @@ class TableStructureAnalyzer:
         Returns:
             str: A string that can be used to recreate the EquationToLatex object.
         """
-        return "TableStructureAnalyzer()"
+        return f"TableStructureAnalyzer(device='{self.device}', quantize={self.quantize})"
 
     def __str__(self):
         """
@@ -0,0 +1,15 @@
+import torch
+
+
+def quantize_linear_layers(model: torch.nn.Module) -> torch.nn.Module:
+    """
+    Quantize the linear layers of a model to int8, dynamically: the weights are stored in int8, and the
+    activations are quantized on the fly at each call. Only the CPU runs dynamically quantized layers.
+
+    Args:
+        model (torch.nn.Module): The model, in evaluation mode.
+
+    Returns:
+        torch.nn.Module: A quantized copy of the model.
+    """
+    return torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
@@ -4,4 +4,4 @@ from .table_element import TableElement
 from .title_element import TitleElement
 from .text_element import TextElement
 from .element import Element
-
+from .overlapsuppressor import OverlapSuppressor
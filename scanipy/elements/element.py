@@ -1,10 +1,10 @@
-from typing import Union
+from typing import Union, List
 
 # Define the Element class
 class Element:
     def __init__(self, x_min: float, y_min: float, x_max: float, y_max: float,
                  pipeline_step:Union[int, None]=None, page_number: Union[int, None] = None,
-                 intersection_percentage_threshold = 90):
+                 intersection_percentage_threshold = 90, *, validate: bool = True):
         """
         Initialize an Element object with normalized coordinates, an optional pipeline step, and an intersection percentage threshold.
 
@@ -16,6 +16,7 @@ class Element:
             pipeline_step (Union[int, None], optional): The processing step in the pipeline to which this element belongs. Defaults to None.
             page_number (int): Specifies the page number on which the element is located.
             intersection_percentage_threshold (int, optional): The minimum percentage of intersection required for two elements to be considered overlapping. Defaults to 90 (%).
+            validate (bool, optional): Whether to verify the arguments. Defaults to True, see from_trusted.
 
         Raises:
             ValueError:
@@ -25,25 +26,27 @@ class Element:
                 - If the coordinates are not floats.
                 - If pipeline_step is neither an integer nor None.
         """
-        # Verify the input variable types
-        if not isinstance(x_min, float) or not isinstance(y_min, float) or not isinstance(x_max, float) or not isinstance(y_max, float):
-            raise TypeError("Coordinates must be floats")
+        # Verify the arguments, unless the element is built from trusted coordinates (see from_trusted)
+        if validate:
+            # Verify the input variable types
+            if not isinstance(x_min, float) or not isinstance(y_min, float) or not isinstance(x_max, float) or not isinstance(y_max, float):
+                raise TypeError("Coordinates must be floats")
 
-        # Verify if coordinates are in the range 0 to 1
-        if not (0 <= x_min <= 1 and 0 <= y_min <= 1 and 0 <= x_max <= 1 and 0 <= y_max <= 1):
-            raise ValueError("Coordinates must be in the range from 0.0 to 1.0")
+            # Verify if coordinates are in the range 0 to 1
+            if not (0 <= x_min <= 1 and 0 <= y_min <= 1 and 0 <= x_max <= 1 and 0 <= y_max <= 1):
+                raise ValueError("Coordinates must be in the range from 0.0 to 1.0")
 
-        # Verify if x_min is less than x_max and y_min is less than y_max
-        if x_min >= x_max or y_min >= y_max:
-            raise ValueError("Invalid coordinates: x_min should be less than x_max and y_min should be less than y_max")
+            # Verify if x_min is less than x_max and y_min is less than y_max
+            if x_min >= x_max or y_min >= y_max:
+                raise ValueError("Invalid coordinates: x_min should be less than x_max and y_min should be less than y_max")
 
-        # Verify the pipeline_step type
-        if pipeline_step is not None and not isinstance(pipeline_step, int):
-            raise TypeError("pipeline_step must be an integer or None")
+            # Verify the pipeline_step type
+            if pipeline_step is not None and not isinstance(pipeline_step, int):
+                raise TypeError("pipeline_step must be an integer or None")
             
-        # Verify the page_number type
-        if pipeline_step is not None and not isinstance(page_number, int):
-            raise TypeError("page_number must be an integer or None")
+            # Verify the page_number type
+            if pipeline_step is not None and not isinstance(page_number, int):
+                raise TypeError("page_number must be an integer or None")
 
         # Initialize instance variables
         self._x_min = x_min
@@ -53,13 +56,63 @@ class Element:
         self._pipeline_step = pipeline_step
         self._page_number = page_number
         self._intersection_percentage_threshold = intersection_percentage_threshold
+        self._score = None
 
         # Calculate the center coordinates and width
-        self.x_center = (self.x_min + self.x_max) / 2
-        self.y_center = (self.y_min + self.y_max) / 2
+        self.x_center = (x_min + x_max) / 2
+        self.y_center = (y_min + y_max) / 2
         self.width = x_max - x_min
         self.height = y_max - y_min
 
+    @classmethod
+    def from_trusted(cls, *args, score: Union[float, None] = None, **kwargs) -> 'Element':
+        """
+        Build an element from coordinates produced by a model, skipping the type and range checks of __init__.
+
+        The detectors normalize, clip and check their boxes in bulk (see geometry.normalize_boxes), so checking
+        every coordinate of every element again is redundant. The arguments are the ones of the constructor of
+        the class, and must be valid.
+
+        Args:
+            *args: The positional arguments of the constructor, starting with x_min, y_min, x_max and y_max as floats.
+            score (Union[float, None], optional): The detection score of the element. Defaults to None.
+            **kwargs: The keyword arguments of the constructor.
+
+        Returns:
+            Element: The element, of the class it is called on.
+        """
+        element = cls(*args, validate=False, **kwargs)
+        element._score = score
+        return element
+
+    @property
+    def equations_inside(self) -> List['EquationElement']:
+        """
+        Get every equation inside the element, in the order they were added.
+
+        Returns:
+            List[EquationElement]: The equations inside the element, empty if there are none.
+        """
+        return getattr(self, '_equations_inside', [])
+
+    def add_equation_inside(self, equation: 'EquationElement') -> None:
+        """
+        Add an equation inside the element (a text, title, table or image element). The last one added is
+        the equation_inside of the element.
+
+        Args:
+            equation (EquationElement): The equation inside the element.
+
+        Raises:
+            TypeError: If the provided equation is not a EquationElement, or the element cannot hold equations.
+        """
+        if not hasattr(self, '_equations_inside'):
+            raise TypeError(f"{type(self).__name__} cannot contain equations")
+
+        self.equation_inside = equation
+        self._equations_inside.append(equation)
+        self.has_equation_inside = True
+
     def __repr__(self) -> str:
         """
         Provides a human-readable representation of the Element object.
@@ -347,3 +400,31 @@ class Element:
         if page_number is not None and not isinstance(page_number, int):
             raise TypeError("pipeline_step must be either an integer or None.")
         self._page_number = page_number
+
+    @property
+    def score(self) -> Union[float, None]:
+        """
+        Gets the detection score of the element.
+
+        Returns:
+            Union[float, None]: The confidence of the detector in the element (range: 0 to 1), or None if unknown.
+        """
+        return self._score
+
+    @score.setter
+    def score(self, score: Union[float, None]):
+        """
+        Sets the detection score of the element.
+
+        Args:
+            score (Union[float, None]): The new detection score (range: 0 to 1), or None if unknown.
+
+        Raises:
+            TypeError: If score is neither a float nor None.
+            ValueError: If score is not in the range [0, 1].
+        """
+        if score is not None and not isinstance(score, float):
+            raise TypeError("score must be either a float or None.")
+        if score is not None and not 0 <= score <= 1:
+            raise ValueError("score must be in the range [0, 1].")
+        self._score = score
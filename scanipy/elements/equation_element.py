@@ -14,7 +14,7 @@ class EquationElement(Element):
 
     def __init__(self, x_min: float, y_min: float, x_max: float, y_max: float, 
                  pipeline_step: Union[int, None] = None, page_number: Union[int, None] = None,
-                 is_inside_text: bool = False):
+                 is_inside_text: bool = False, *, validate: bool = True):
         """
         Initialize an EquationElement object.
 
@@ -25,13 +25,14 @@ class EquationElement(Element):
             y_max (float): The maximum y-coordinate of the element, normalized to the image height (range: 0 to 1).
             pipeline_step (Union[int, None], optional): The pipeline step, can be None.
             page_number (int): Specifies the page number on which the element is located.
+            validate (bool, optional): Whether to verify the arguments, skipped by Element.from_trusted. Defaults to True.
 
         Raises:
             TypeError: If the types of the arguments are not as expected.
         """
 
         # Initialize instance variables by calling the parent class constructor
-        super().__init__(x_min, y_min, x_max, y_max, pipeline_step, page_number)
+        super().__init__(x_min, y_min, x_max, y_max, pipeline_step, page_number, validate=validate)
 
         # Initialize additional instance variables specific to EquationElement
         self._latex_content = None
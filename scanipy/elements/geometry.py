@@ -0,0 +1,115 @@
+import numpy as np
+from typing import Sequence
+from .element import Element
+
+
+def element_boxes(elements: Sequence[Element]) -> np.ndarray:
+    """
+    Get the bounding boxes of elements as an array.
+
+    Args:
+        elements (Sequence[Element]): The elements.
+
+    Returns:
+        np.ndarray: The boxes, one (x_min, y_min, x_max, y_max) row per element, shaped (len(elements), 4).
+    """
+    boxes = np.empty((len(elements), 4), dtype=np.float64)
+    for index, element in enumerate(elements):
+        boxes[index] = (element.x_min, element.y_min, element.x_max, element.y_max)
+    return boxes
+
+
+def normalize_boxes(boxes: np.ndarray, width: int, height: int) -> np.ndarray:
+    """
+    Normalize the pixel boxes detected in an image to the range 0 to 1, all at once.
+
+    Args:
+        boxes (np.ndarray): The (x_min, y_min, x_max, y_max) boxes in pixels, shaped (n, 4).
+        width (int): The width of the image.
+        height (int): The height of the image.
+
+    Returns:
+        np.ndarray: The normalized boxes, shaped (n, 4), clipped to the image.
+
+    Raises:
+        ValueError: If a box has x_min >= x_max or y_min >= y_max.
+    """
+    boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 4)
+    normalized = np.clip(boxes / np.array([width, height, width, height], dtype=np.float64), 0.0, 1.0)
+    if np.any(normalized[:, 0] >= normalized[:, 2]) or np.any(normalized[:, 1] >= normalized[:, 3]):
+        raise ValueError("Invalid coordinates: x_min should be less than x_max and y_min should be less than y_max")
+    return normalized
+
+
+def intersection_areas(boxes: np.ndarray, other_boxes: np.ndarray) -> np.ndarray:
+    """
+    Compute the area of intersection of every box with every other box, see Element._intersection_area.
+
+    Args:
+        boxes (np.ndarray): The boxes, shaped (n, 4).
+        other_boxes (np.ndarray): The other boxes, shaped (m, 4).
+
+    Returns:
+        np.ndarray: The areas of intersection, shaped (n, m), 0 for disjoint boxes.
+    """
+    x_min = np.maximum(boxes[:, None, 0], other_boxes[None, :, 0])
+    y_min = np.maximum(boxes[:, None, 1], other_boxes[None, :, 1])
+    x_max = np.minimum(boxes[:, None, 2], other_boxes[None, :, 2])
+    y_max = np.minimum(boxes[:, None, 3], other_boxes[None, :, 3])
+    return np.clip(x_max - x_min, 0, None) * np.clip(y_max - y_min, 0, None)
+
+
+def intersection_over_union(boxes: np.ndarray, other_boxes: np.ndarray) -> np.ndarray:
+    """
+    Compute the intersection over union of every box with every other box.
+
+    Args:
+        boxes (np.ndarray): The boxes, shaped (n, 4).
+        other_boxes (np.ndarray): The other boxes, shaped (m, 4).
+
+    Returns:
+        np.ndarray: The intersections over unions (range: 0 to 1), shaped (n, m).
+    """
+    areas = (boxes[:, 2] - boxes[:, 0]) * (boxes[:, 3] - boxes[:, 1])
+    other_areas = (other_boxes[:, 2] - other_boxes[:, 0]) * (other_boxes[:, 3] - other_boxes[:, 1])
+    intersections = intersection_areas(boxes, other_boxes)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return intersections / (areas[:, None] + other_areas[None, :] - intersections)
+
+
+def intersection_percentages(boxes: np.ndarray, other_boxes: np.ndarray) -> np.ndarray:
+    """
+    Compute the percentage of the area of every box covered by every other box, see Element._intersection_percentage.
+
+    Args:
+        boxes (np.ndarray): The boxes, shaped (n, 4).
+        other_boxes (np.ndarray): The other boxes, shaped (m, 4).
+
+    Returns:
+        np.ndarray: The percentages, shaped (n, m). The rows of empty boxes are NaN.
+    """
+    areas = (boxes[:, 2] - boxes[:, 0]) * (boxes[:, 3] - boxes[:, 1])
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return intersection_areas(boxes, other_boxes) / areas[:, None] * 100
+
+
+def is_in(elements: Sequence[Element], other_elements: Sequence[Element]) -> np.ndarray:
+    """
+    Check whether every element is inside every other element at once, with the semantics of Element.is_in:
+    more than the intersection percentage threshold of the element is covered by the other element.
+
+    Args:
+        elements (Sequence[Element]): The elements, e.g. the equations of a page.
+        other_elements (Sequence[Element]): The other elements, e.g. the layout blocks of the page.
+
+    Returns:
+        np.ndarray: A boolean matrix, shaped (len(elements), len(other_elements)), True where an element is inside
+            an other element.
+    """
+    if not elements or not other_elements:
+        return np.zeros((len(elements), len(other_elements)), dtype=bool)
+
+    thresholds = np.array([element._intersection_percentage_threshold for element in elements], dtype=np.float64)
+    percentages = intersection_percentages(element_boxes(elements), element_boxes(other_elements))
+    with np.errstate(invalid='ignore'):
+        return percentages > thresholds[:, None]
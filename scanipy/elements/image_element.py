@@ -18,7 +18,8 @@ class ImageElement(Element):
     """
 
     def __init__(self, x_min: float, y_min: float, x_max: float, y_max: float,
-                 pipeline_step: Union[int, None] = None, page_number: Union[int, None] = None):
+                 pipeline_step: Union[int, None] = None, page_number: Union[int, None] = None, *,
+                 validate: bool = True):
         """
         Initialize an ImageElement object.
 
@@ -29,6 +30,7 @@ class ImageElement(Element):
             y_max (float): The maximum y-coordinate of the element, normalized to the image height (range: 0 to 1).
             pipeline_step (Union[int, None], optional): The pipeline step, can be None.
             page_number (int): Specifies the page number on which the element is located.
+            validate (bool, optional): Whether to verify the arguments, skipped by Element.from_trusted. Defaults to True.
 
         Raises:
             ValueError: If x_min >= x_max or y_min >= y_max.
@@ -36,7 +38,7 @@ class ImageElement(Element):
         """
 
         # Initialize instance variables by calling the parent class constructor
-        super().__init__(x_min, y_min, x_max, y_max, pipeline_step, page_number)
+        super().__init__(x_min, y_min, x_max, y_max, pipeline_step, page_number, validate=validate)
 
         # Initialize additional instance variables specific to ImageElement
         self._unique_key = None
@@ -44,6 +46,7 @@ class ImageElement(Element):
         self._image_extension = None
         self._has_equation_inside = False
         self._equation_inside = None
+        self._equations_inside = []
         
     @property
     def equation_inside(self) -> Union[EquationElement,None]:
@@ -0,0 +1,215 @@
+import numpy as np
+from collections import Counter
+from typing import List
+from .element import Element
+from . import geometry
+
+
+class OverlapSuppressor:
+    """
+    Suppress the duplicate and nested layout elements of a page before their content is extracted.
+
+    The layout detector often gives several boxes for the same region (e.g. a text block also detected
+    as a title, or a paragraph detected inside a larger one), and each of them would be cropped, read
+    and converted on its own. The overlaps of all the elements of a page are computed at once:
+
+    - Duplicates: of two elements whose intersection over union is above iou_threshold, the one with
+      the lower detection score is dropped, or both are merged into their union when merge is True.
+    - Nested elements: an element covered by more than containment_threshold percent of its area by a
+      larger kept element is dropped, since the larger one already holds its content. With merge, the
+      nesting is checked on the merged boxes.
+
+    With across_types False, only elements of the same type suppress each other. The counts of the
+    detected and suppressed elements are kept, see report.
+
+    Example:
+        >>> suppressor = OverlapSuppressor(iou_threshold=0.7)
+        >>> elements = suppressor(elements)
+        >>> print(suppressor.report())
+
+    Attributes:
+        iou_threshold (float): The intersection over union above which two elements are duplicates.
+        containment_threshold (float): The percentage of its area above which an element is inside another.
+        across_types (bool): Whether elements of different types suppress each other.
+        merge (bool): Whether duplicates of the same type are merged into their union instead of dropped.
+        detected (int): The number of elements given so far.
+        suppressed (Counter): The number of elements suppressed so far, by type name.
+        suppressed_area (float): The total normalized area of the suppressed elements, i.e. the page area
+            that is not extracted again.
+    """
+
+    def __init__(self, iou_threshold: float = 0.8, containment_threshold: float = 90, across_types: bool = True,
+                 merge: bool = False):
+        """
+        Initialize the suppressor.
+
+        Args:
+            iou_threshold (float): The intersection over union (range: 0 to 1) above which two elements are
+                duplicates. Defaults to 0.8.
+            containment_threshold (float): The percentage of its area (range: 0 to 100) covered by a larger
+                element above which an element is nested in it. Defaults to 90 (%), as Element.is_in.
+            across_types (bool): Whether elements of different types suppress each other. Defaults to True.
+            merge (bool): Whether duplicates of the same type are merged into their union. Defaults to False.
+
+        Raises:
+            TypeError: If the types of the arguments are not as expected.
+            ValueError: If a threshold is out of its range.
+        """
+        # Verify the input variable types and ranges
+        if not isinstance(iou_threshold, (int, float)) or not 0 <= iou_threshold <= 1:
+            raise ValueError("iou_threshold must be a number in the range [0, 1]")
+        if not isinstance(containment_threshold, (int, float)) or not 0 <= containment_threshold <= 100:
+            raise ValueError("containment_threshold must be a number in the range [0, 100]")
+        if not isinstance(across_types, bool):
+            raise TypeError("across_types must be a boolean")
+        if not isinstance(merge, bool):
+            raise TypeError("merge must be a boolean")
+
+        self.iou_threshold = iou_threshold
+        self.containment_threshold = containment_threshold
+        self.across_types = across_types
+        self.merge = merge
+        self.detected = 0
+        self.suppressed = Counter()
+        self.suppressed_area = 0.0
+
+    def __call__(self, elements: List[Element]) -> List[Element]:
+        """
+        Suppress the duplicate and nested elements of a page.
+
+        Args:
+            elements (List[Element]): The detected elements of a page.
+
+        Returns:
+            List[Element]: The kept elements, in the same order. Merged elements are new elements covering
+                the union of the duplicates.
+        """
+        self.detected += len(elements)
+        if len(elements) < 2:
+            return list(elements)
+
+        # Compute the overlaps of every pair of elements at once
+        boxes = geometry.element_boxes(elements)
+        areas = (boxes[:, 2] - boxes[:, 0]) * (boxes[:, 3] - boxes[:, 1])
+        intersections = geometry.intersection_areas(boxes, boxes)
+        iou = intersections / (areas[:, None] + areas[None, :] - intersections)
+
+        # Only the elements of the same type compete, unless across_types
+        types = np.array([type(element).__name__ for element in elements])
+        same_type = types[:, None] == types[None, :]
+        compatible = np.ones_like(same_type) if self.across_types else same_type
+
+        # Drop the duplicates, the highest scores first (ties broken by the larger area)
+        scores = np.array([1.0 if element.score is None else element.score for element in elements])
+        order = np.lexsort((-areas, -scores))
+        duplicates = (iou > self.iou_threshold) & compatible
+        np.fill_diagonal(duplicates, False)
+        kept = np.zeros(len(elements), dtype=bool)
+        removed = np.zeros(len(elements), dtype=bool)
+        merged_into = {}
+        for index in order:
+            if removed[index]:
+                continue
+            kept[index] = True
+            victims = duplicates[index] & ~kept & ~removed
+            removed |= victims
+            if self.merge:
+                merged_into[index] = np.flatnonzero(victims & same_type[index])
+
+        # Grow the kept elements into the union of their merged duplicates
+        merged_into = {index: victims for index, victims in merged_into.items() if len(victims)}
+        for index, victims in merged_into.items():
+            union = boxes[[index, *victims]]
+            boxes[index] = [*union[:, :2].min(axis=0), *union[:, 2:].max(axis=0)]
+        if merged_into:
+            areas = (boxes[:, 2] - boxes[:, 0]) * (boxes[:, 3] - boxes[:, 1])
+            intersections = geometry.intersection_areas(boxes, boxes)
+
+        # Drop the elements nested in a larger kept element
+        coverage = intersections / areas[:, None] * 100
+        nested = (coverage > self.containment_threshold) & compatible & (areas[None, :] > areas[:, None]) & kept[None, :]
+        kept &= ~nested.any(axis=1)
+
+        # Keep the elements in their order, merging the duplicates into the kept ones
+        result = []
+        for index, element in enumerate(elements):
+            if not kept[index]:
+                self.suppressed[type(element).__name__] += 1
+                self.suppressed_area += float(areas[index])
+                continue
+            if index in merged_into:
+                x_min, y_min, x_max, y_max = boxes[index].tolist()
+                merged = type(element)(x_min, y_min, x_max, y_max,
+                                       element.pipeline_step, element.page_number)
+                merged.score = element.score
+                element = merged
+            result.append(element)
+        return result
+
+    @property
+    def suppressed_count(self) -> int:
+        """
+        Get the number of elements suppressed so far.
+
+        Returns:
+            int: The number of suppressed elements, of every type.
+        """
+        return sum(self.suppressed.values())
+
+    def report(self) -> str:
+        """
+        Summarize the extraction work avoided so far.
+
+        Returns:
+            str: The number of suppressed elements (by type), their share of the detected elements, and
+                their total area in pages.
+        """
+        share = self.suppressed_count / self.detected * 100 if self.detected else 0.0
+        by_type = ', '.join(f'{name}: {count}' for name, count in sorted(self.suppressed.items())) or 'none'
+        return (f"Suppressed {self.suppressed_count} of {self.detected} detected elements ({share:.1f}%; {by_type}), "
+                f"{self.suppressed_area:.2f} pages of area not extracted")
+
+    def add_counts(self, other: 'OverlapSuppressor') -> None:
+        """
+        Add the counts of the detected and suppressed elements of another suppressor, e.g. the one of a worker
+        process of Parser.extract_many.
+
+        Args:
+            other (OverlapSuppressor): The suppressor whose counts are added.
+
+        Raises:
+            TypeError: If other is not an OverlapSuppressor.
+        """
+        if not isinstance(other, OverlapSuppressor):
+            raise TypeError("other must be an OverlapSuppressor")
+
+        self.detected += other.detected
+        self.suppressed.update(other.suppressed)
+        self.suppressed_area += other.suppressed_area
+
+    def reset(self) -> None:
+        """
+        Reset the counts of the detected and suppressed elements.
+        """
+        self.detected = 0
+        self.suppressed = Counter()
+        self.suppressed_area = 0.0
+
+    def __repr__(self) -> str:
+        """
+        Returns the official string representation of the OverlapSuppressor object.
+
+        Returns:
+            str: A string representation of the object.
+        """
+        return (f"OverlapSuppressor(iou_threshold={self.iou_threshold}, containment_threshold={self.containment_threshold}, "
+                f"across_types={self.across_types}, merge={self.merge})")
+
+    def __str__(self) -> str:
+        """
+        Returns a string representation of the OverlapSuppressor object, which is the same as its official representation.
+
+        Returns:
+            str: A string representation of the object.
+        """
+        return self.__repr__()
@@ -15,7 +15,8 @@ class TitleElement(Element):
     """
 
     def __init__(self, x_min: float, y_min: float, x_max: float, y_max: float, 
-                 pipeline_step: Union[int, None] = None, page_number: Union[int, None] = None):
+                 pipeline_step: Union[int, None] = None, page_number: Union[int, None] = None, *,
+                 validate: bool = True):
         """
         Initialize a TitleElement object.
 
@@ -26,18 +27,20 @@ class TitleElement(Element):
             y_max (float): The maximum y-coordinate of the element, normalized to the image height (range: 0 to 1).
             pipeline_step (Union[int, None], optional): The pipeline step, can be None.
             page_number (int): Specifies the page number on which the element is located.
+            validate (bool, optional): Whether to verify the arguments, skipped by Element.from_trusted. Defaults to True.
 
         Raises:
             TypeError: If the types of the arguments are not as expected.
         """
 
         # Initialize instance variables by calling the parent class constructor
-        super().__init__(x_min, y_min, x_max, y_max, pipeline_step, page_number)
+        super().__init__(x_min, y_min, x_max, y_max, pipeline_step, page_number, validate=validate)
 
         # Initialize additional instance variable specific to TitleElement
         self._title_content = None
         self._has_equation_inside = False
         self._equation_inside = None
+        self._equations_inside = []
         
     @property
     def equation_inside(self) -> Union[EquationElement,None]:
@@ -63,6 +66,7 @@ class TitleElement(Element):
         if not isinstance(value, EquationElement):
             raise TypeError("equation_inside must be a EquationElement")
         self._equation_inside = value
+
     @property
     def has_equation_inside(self) -> bool:
         """
@@ -15,12 +15,16 @@ class EquationExtractor(Extractor):
         latex_ocr (str): Deep Learning Model to extract equations from images.
     """
 
-    def __init__(self):
+    def __init__(self, device: str = 'cpu', quantize: bool = False):
         """
         Initialize an EquationExtractor object.
+
+        Args:
+            device (str): The device of the model, 'cpu' or 'cuda'. Defaults to 'cpu'.
+            quantize (bool): Whether the model runs with int8 linear layers (CPU only), see EquationToLatex. Defaults to False.
         """
-        # Initialize the OCR model for converting equation images to LaTeX
-        self.latex_ocr = EquationToLatex()
+        # Initialize the OCR model for converting equation images to LaTeX, shared with the other extractors and loaded on first use
+        self.latex_ocr = self._acquire_model(EquationToLatex, device=device, quantize=quantize)
 
     def extract(self, page: PDFPage, equation_element: EquationElement) -> EquationElement:
         """
@@ -36,24 +40,17 @@ class EquationExtractor(Extractor):
         Raises:
             TypeError: If the types of the arguments are not as expected.
         """
-        # Separate PIL and pdfplumber elements from the page
-        pdf_page = page.get_pdf()
-        page_image = page.get_image()
-
         # Verify the input variable types
-        if not isinstance(page_image, Image.Image):
-            raise TypeError("page_image must be a PIL.Image object")
+        if not isinstance(page, PDFPage):
+            raise TypeError("page must be a PDFPage object")
         if not isinstance(equation_element, EquationElement):
             raise TypeError("equation_element must be an EquationElement object")
 
         # Extract the coordinates from the equation element
-        left = int(equation_element.x_min * page_image.width)
-        upper = int(equation_element.y_min * page_image.height)
-        right = int(equation_element.x_max * page_image.width)
-        lower = int(equation_element.y_max * page_image.height)
+        region = (equation_element.x_min, equation_element.y_min, equation_element.x_max, equation_element.y_max)
 
-        # Crop the image based on the coordinates
-        equation_image = page_image.crop((left, upper, right, lower))
+        # Get the image of the region, rendered again from the PDF if a region resolution is set
+        equation_image = page.get_region_image(region)
 
         # Convert the cropped equation image to LaTeX using the OCR model
         latex = self.latex_ocr(equation_image)
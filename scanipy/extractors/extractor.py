@@ -1,5 +1,32 @@
+from typing import Any, Callable
 from scanipy.pdfhandler import PDFPage
+from scanipy.deeplearning.lazymodel import LazyModel
+from scanipy.deeplearning.modelregistry import MODEL_REGISTRY
 
 class Extractor:
     def extract(self, page: PDFPage):
         raise NotImplementedError
+
+    def _acquire_model(self, factory: Callable[..., Any], *args, **kwargs) -> LazyModel:
+        """
+        Get a model shared with the other extractors of the process, see ModelRegistry.acquire.
+
+        Args:
+            factory (Callable[..., Any]): The function or class building the model.
+            *args: The positional arguments of the factory.
+            **kwargs: The keyword arguments of the factory.
+
+        Returns:
+            LazyModel: The shared model, loaded on first use.
+        """
+        model = MODEL_REGISTRY.acquire(factory, *args, **kwargs)
+        self.__dict__.setdefault('_shared_models', []).append(model)
+        return model
+
+    def close(self) -> None:
+        """
+        Release the shared models of the extractor, unloading those no other extractor uses.
+        The extractor must not be used afterwards.
+        """
+        for model in self.__dict__.pop('_shared_models', []):
+            MODEL_REGISTRY.release(model)
@@ -61,13 +61,9 @@ class ImageExtractor(Extractor):
         Raises:
             TypeError: If the unique_key is not unique.
         """
-        # Separate PIL and pdfplumber elements from the page
-        pdf_page = page.get_pdf()
-        page_image = page.get_image()
-
         # Verify the input variable types
-        if not isinstance(page_image, Image.Image):
-            raise TypeError("page_image must be a PIL.Image object")
+        if not isinstance(page, PDFPage):
+            raise TypeError("page must be a PDFPage object")
         if not isinstance(image_element, ImageElement):
             raise TypeError("image_element must be an ImageElement object")
         if not isinstance(unique_key, str) and unique_key is not None:
@@ -76,13 +72,10 @@ class ImageExtractor(Extractor):
             raise TypeError("image_extension must be an string or None")
         
         # Extract the coordinates from the image element
-        left = int(image_element.x_min * page_image.width)
-        upper = int(image_element.y_min * page_image.height)
-        right = int(image_element.x_max * page_image.width)
-        lower = int(image_element.y_max * page_image.height)
+        region = (image_element.x_min, image_element.y_min, image_element.x_max, image_element.y_max)
 
-        # Crop the image based on the coordinates
-        image_content = page_image.crop((left, upper, right, lower))
+        # Get the image of the region, rendered again from the PDF if a region resolution is set
+        image_content = page.get_region_image(region)
 
         # Generate a unique key if not provided
         if unique_key is None:
@@ -21,12 +21,19 @@ class TableDataExtractor(Extractor):
         latex_ocr (str): Deep Learning Model to extract tables from images.
     """
 
-    def __init__(self, table_expansion_margin=10, threshold_percentage=0.10):
+    def __init__(self, table_expansion_margin=10, threshold_percentage=0.10, device: str = 'cpu',
+                 quantize: bool = False):
         """
         Initialize an TableDataExtractor object.
+
+        Args:
+            table_expansion_margin (int): The margin, in pixels, added around the table before cropping it. Defaults to 10.
+            threshold_percentage (float): The fraction of the average cell height that starts a new row. Defaults to 0.10.
+            device (str): The device of the table structure model, 'cpu' or 'cuda'. Defaults to 'cpu'.
+            quantize (bool): Whether the model runs with int8 linear layers (CPU only), see TableStructureAnalyzer. Defaults to False.
         """
-        # Initialize the model for identifying table structures
-        self.model = TableStructureAnalyzer()
+        # Initialize the model for identifying table structures, shared with the other extractors and loaded on first use
+        self.model = self._acquire_model(TableStructureAnalyzer, device=device, quantize=quantize)
 
         # Expand the bounding box slightly for better cropping
         self._table_expansion_margin = table_expansion_margin
@@ -35,30 +42,17 @@ class TableDataExtractor(Extractor):
         self._threshold_percentage = threshold_percentage
         self.test = []
 
-    def _get_cell_coordinates(self, page_image, table_element):
+    def _get_cell_coordinates(self, table_image):
         """
         Obtains the coordinates of cells based on the analyzed table structure.
 
         Args:
-            analyzed_structure (List[Dict]): Analyzed table structure.
+            table_image (PIL.Image): The image of the table.
 
         Returns:
-            List[Dict]: List of cell coordinates.
+            List[Dict]: List of cell coordinates, in pixels of the table image.
         """
-        # Convert PIL image to OpenCV format
-        image_cv = cv2.cvtColor(np.array(page_image), cv2.COLOR_RGB2BGR)
-
-        # Get image dimensions
-        img_height, img_width = image_cv.shape[:2]
-
-        # Expand the bounding box slightly for better cropping
-        xmin, ymin = max(0, table_element.x_min - self._table_expansion_margin), max(0, table_element.y_min - self._table_expansion_margin)
-        xmax, ymax = min(img_width, table_element.x_max + self._table_expansion_margin), min(img_height, table_element.y_max + self._table_expansion_margin)
-
-        # Crop the image based on the coordinates
-        table_image = page_image.crop((xmin, ymin, xmax, ymax))
-
-        # Extract the structure from the cropped table image
+        # Extract the structure from the table image
         table_structure = self.model(table_image)
 
         # Verify if table structure is empty
@@ -89,23 +83,25 @@ class TableDataExtractor(Extractor):
                 # Add the cell only if it has a non-zero area
                 if cell_xmin < cell_xmax and cell_ymin < cell_ymax:
                     cells.append({
-                        'xmin': xmin + cell_xmin,
-                        'ymin': ymin + cell_ymin,
-                        'xmax': xmin + cell_xmax,
-                        'ymax': ymin + cell_ymax
+                        'xmin': cell_xmin,
+                        'ymin': cell_ymin,
+                        'xmax': cell_xmax,
+                        'ymax': cell_ymax
                     })
         # print(cells)
         return cells
     
-    def _get_dataframe(self, rows, page_image):
+    def _get_dataframe(self, rows, table_image):
         # Initialize an empty DataFrame
         df = pd.DataFrame()
 
+        # Convert PIL image to OpenCV format
+        image_cv = cv2.cvtColor(np.array(table_image), cv2.COLOR_RGB2BGR)
+
         # Populate the DataFrame
         for row_idx, row_boxes in enumerate(rows):
             row_data = []
             for col_idx, box in enumerate(row_boxes):
-                image_cv = cv2.cvtColor(np.array(page_image), cv2.COLOR_RGB2BGR)
                 text = self.get_text_from_image(image_cv, box)
                 row_data.append(text)
 
@@ -226,22 +222,22 @@ class TableDataExtractor(Extractor):
         Raises:
             TypeError: If the types of the arguments are not as expected.
         """
-        # Separate PIL and pdfplumber elements from the page
-        pdf_page = page.get_pdf()
-        page_image = page.get_image()
-
         # Verify the input variable types
-        if not isinstance(page_image, Image.Image):
-            raise TypeError("page_image must be a PIL.Image object")
+        if not isinstance(page, PDFPage):
+            raise TypeError("page must be a PDFPage object")
         if not isinstance(table_element, TableElement):
             raise TypeError("table_element must be an TableElement object") #TODO
 
+        # Get the image of the table, expanded slightly for better cropping
+        region = (table_element.x_min, table_element.y_min, table_element.x_max, table_element.y_max)
+        table_image = page.get_region_image(region, margin=self._table_expansion_margin)
+
         # Gather the individual cells from the table
-        cell_coordinates = self._get_cell_coordinates(page_image, table_element)
+        cell_coordinates = self._get_cell_coordinates(table_image)
 
         rows = self._separate_rows(cell_coordinates)
 
-        dataframe = self._get_dataframe(rows, page_image)
+        dataframe = self._get_dataframe(rows, table_image)
 
         # Update the table element with the extracted LaTeX content
         table_element._table_data = dataframe
@@ -6,6 +6,7 @@ from .extractor import Extractor
 from scanipy.elements import TextElement 
 from scanipy.deeplearning.models import TextOCR
 from scanipy.pdfhandler import PDFPage
+from scanipy.charindex import CharIndex
 from typing import Union, Tuple, List, Dict
 
 # Define the TextExtractor class
@@ -14,7 +15,7 @@ class TextExtractor(Extractor):
     Represents a text extractor for extracting text from a document.
     """
 
-    def __init__(self, use_ocr: bool, lang: str = 'en', tolerance: float = 1.5):
+    def __init__(self, use_ocr: bool, lang: str = 'en', tolerance: float = 1.5, device: Union[str, None] = None):
       """
       Initialize a TextExtractor object.
 
@@ -22,6 +23,7 @@ class TextExtractor(Extractor):
           use_ocr (bool): Whether to use OCR for text extraction or not.
           lang (str): The language of the text. Defaults to english.
           tolerance (float): The tolerance level for text extraction. Default is 1.5.
+          device (Union[str, None]): The device of the OCR models, 'cpu' or 'cuda'. Defaults to None (CUDA if available).
 
       Raises:
           TypeError: If the types of the arguments are not as expected.
@@ -34,22 +36,24 @@ class TextExtractor(Extractor):
       # Initialize OCR settings and OCR model
       self.use_ocr = use_ocr
 
-      # Check if CUDA is available and set the device accordingly
-      self.device = 'cuda' if torch.cuda.is_available() else 'cpu'
+      # Use the requested device, or CUDA if it is available
+      if device is None:
+          device = 'cuda' if torch.cuda.is_available() else 'cpu'
+      self.device = device
 
-      # Initialize OCR model for text and equations
-      self.text_equations_ocr = pix2text.Pix2Text(device=self.device)
+      # Initialize OCR model for text and equations, shared with the other extractors and loaded on first use
+      self.text_equations_ocr = self._acquire_model(pix2text.Pix2Text, device=self.device)
 
       # Set the language for OCR
       self.lang = lang
 
-      # Initialize the TextOCR object
-      self.text_ocr = TextOCR(self.lang, self.device)
+      # Initialize the TextOCR object, shared with the other extractors and loaded on first use
+      self.text_ocr = self._acquire_model(TextOCR, self.lang, self.device)
 
       # Set the tolerance level for text extraction
       self.tolerance = tolerance
 
-    def _process_text_image(self, text_element: TextElement, text_image: Image.Image, pdf_page: Page) -> str:
+    def _process_text_image(self, text_element: TextElement, text_image: Image.Image, pdf_page: Page, char_index: CharIndex) -> str:
       """
       Process the text image based on OCR settings and equation presence.
 
@@ -57,6 +61,7 @@ class TextExtractor(Extractor):
           text_element (TextElement): The text element containing the coordinates for extraction.
           text_image (Image): The cropped text image.
           pdf_page (Page): The PDF page containing the text element.
+          char_index (CharIndex): The index over the characters of the PDF page.
 
       Returns:
           str: The extracted text content.
@@ -69,9 +74,9 @@ class TextExtractor(Extractor):
               return self._get_text_with_ocr(text_image)
       else:
           if text_element.has_equation_inside:
-              return self._get_text_and_equations_without_ocr(text_element, text_image, pdf_page)
+              return self._get_text_and_equations_without_ocr(text_element, text_image, pdf_page, char_index)
           else:
-              return self._get_text_without_ocr(text_element, text_image, pdf_page)
+              return self._get_text_without_ocr(text_element, text_image, pdf_page, char_index)
 
     def extract(self, page: PDFPage, text_element: TextElement) -> TextElement:
         """
@@ -88,27 +93,24 @@ class TextExtractor(Extractor):
         Raises:
             TypeError: If the types of the arguments are not as expected.
         """
-        # Separate PIL and pdfplumber elements from the page
-        pdf_page = page.get_pdf()
-        page_image = page.get_image()
-      
         # Verify the input variable types
-        if not isinstance(page_image, Image.Image):
-            raise TypeError("page_image must be a PIL.Image object")
+        if not isinstance(page, PDFPage):
+            raise TypeError("page must be a PDFPage object")
         if not isinstance(text_element, TextElement):
             raise TypeError("text_element must be a TextElement object")
 
+        # Get the pdfplumber page and the index over its characters, built once per page
+        pdf_page = page.get_pdf()
+        char_index = page.get_char_index()
+
         # Extract the coordinates from the text element
-        left = int(text_element.x_min * page_image.width)
-        upper = int(text_element.y_min * page_image.height)
-        right = int(text_element.x_max * page_image.width)
-        lower = int(text_element.y_max * page_image.height)
+        region = (text_element.x_min, text_element.y_min, text_element.x_max, text_element.y_max)
 
-        # Crop the image based on the coordinates
-        text_image = page_image.crop((left, upper, right, lower))
+        # Get the image of the region, rendered again from the PDF if a region resolution is set
+        text_image = page.get_region_image(region)
 
         # Process the cropped text image and extract the text content
-        text_content = self._process_text_image(text_element, text_image, pdf_page)
+        text_content = self._process_text_image(text_element, text_image, pdf_page, char_index)
 
         # Update the text element with the extracted text content
         text_element.text_content = text_content
@@ -218,7 +220,7 @@ class TextExtractor(Extractor):
 
         return extracted_text
 
-    def _get_text_without_ocr(self, text_element: TextElement, cropped_image: Image.Image, pdf_page: Page) -> str:
+    def _get_text_without_ocr(self, text_element: TextElement, cropped_image: Image.Image, pdf_page: Page, char_index: CharIndex) -> str:
         """
         Extracts text from a given area in a PDF page without using OCR.
 
@@ -226,6 +228,7 @@ class TextExtractor(Extractor):
             text_element (TextElement): The text element containing the coordinates for text extraction.
             cropped_image (Image): The cropped image containing the text.
             pdf_page (Page): The PDF page from which the text is to be extracted.
+            char_index (CharIndex): The index over the characters of the PDF page.
 
         Returns:
             str: The extracted text content.
@@ -254,11 +257,8 @@ class TextExtractor(Extractor):
         # Define the bounding box for cropping the PDF page
         bounding_box = (x_min_coord, y_min_coord, x_max_coord, y_max_coord)
 
-        # Crop the PDF page based on the bounding box
-        cropped_pdf_page = pdf_page.crop(bounding_box)
-
-        # Extract text from the cropped PDF page
-        extracted_text = cropped_pdf_page.extract_text(x_tolerance=self.tolerance)
+        # Extract text from the bounding box, using only the characters indexed around it
+        extracted_text = char_index.extract_text(bounding_box, x_tolerance=self.tolerance)
 
         # Remove newline characters from the extracted text
         cleaned_text = extracted_text.replace('\n', '')
@@ -306,23 +306,23 @@ class TextExtractor(Extractor):
 
         return x_min, y_min, x_max, y_max
 
-    def _convert_to_cropped_page_referential(self, x_min: float, y_min: float, x_max: float, y_max: float, cropped_page: Page) -> Tuple[int, int, int, int]:
+    def _convert_to_cropped_page_referential(self, x_min: float, y_min: float, x_max: float, y_max: float, crop_box: Tuple[int, int, int, int]) -> Tuple[int, int, int, int]:
         """
         Convert normalized coordinates to cropped page's referential.
 
         Args:
             x_min, y_min, x_max, y_max (float): Normalized coordinates.
-            cropped_page (Page): The cropped PDF page.
+            crop_box (Tuple[int, int, int, int]): The bounding box of the cropped PDF page.
 
         Returns:
             Tuple[int, int, int, int]: Coordinates in the cropped page's referential.
         """
-        x_min = int(x_min * cropped_page.width)
-        y_min = int(y_min * cropped_page.height)
-        x_max = int(x_max * cropped_page.width)
-        y_max = int(y_max * cropped_page.height)
+        x0, y0, x1, y1 = crop_box
 
-        x0, y0, _, _ = cropped_page.bbox
+        x_min = int(x_min * (x1 - x0))
+        y_min = int(y_min * (y1 - y0))
+        x_max = int(x_max * (x1 - x0))
+        y_max = int(y_max * (y1 - y0))
 
         return x_min + int(x0), y_min + int(y0), x_max + int(x0), y_max + int(y0)
 
@@ -345,7 +345,7 @@ class TextExtractor(Extractor):
         text = pix2text.merge_line_texts(ocr_results)
         return text
 
-    def _get_text_and_equations_without_ocr(self, text_element: TextElement, text_image: Image.Image, pdf_page: Page) -> str:
+    def _get_text_and_equations_without_ocr(self, text_element: TextElement, text_image: Image.Image, pdf_page: Page, char_index: CharIndex) -> str:
         """
         Extracts text and equations from a given text image without using OCR to extract text.
 
@@ -353,6 +353,7 @@ class TextExtractor(Extractor):
             text_element (TextElement): The text element containing the coordinates for extraction.
             text_image (Image): The cropped text image.
             pdf_page (Page): The PDF page containing the text element.
+            char_index (CharIndex): The index over the characters of the PDF page.
 
         Returns:
             str: The extracted text content.
@@ -381,9 +382,6 @@ class TextExtractor(Extractor):
         # Define the PDF crop box
         pdf_box = (x_min_pdf, y_min_pdf, x_max_pdf, y_max_pdf)
 
-        # Crop the PDF page based on the calculated coordinates
-        cropped_page = pdf_page.crop(pdf_box)
-
         # Get OCR results for the text image
         ocr_results = self.text_equations_ocr(text_image)
 
@@ -394,11 +392,11 @@ class TextExtractor(Extractor):
                 x_min, y_min, x_max, y_max = self._extract_and_normalize_coordinates(box, text_image.size)
 
                 # Convert normalized coordinates to cropped page's referential
-                x_min, y_min, x_max, y_max = self._convert_to_cropped_page_referential(x_min, y_min, x_max, y_max, cropped_page)
+                x_min, y_min, x_max, y_max = self._convert_to_cropped_page_referential(x_min, y_min, x_max, y_max, pdf_box)
 
-                # Extract text from the cropped PDF page based on the calculated coordinates
-                segmentation = cropped_page.crop((x_min, y_min, x_max, y_max))
-                extracted_text = segmentation.extract_text(x_tolerance=self.tolerance)
+                # Extract text from the line box, clipped to the crop box like a nested pdfplumber crop
+                line_box = char_index.intersect(pdf_box, (x_min, y_min, x_max, y_max))
+                extracted_text = '' if line_box is None else char_index.extract_text(line_box, x_tolerance=self.tolerance)
                 extracted_text = extracted_text.replace('\n', '')
 
                 # Update the OCR box with the extracted text
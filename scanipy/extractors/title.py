@@ -4,6 +4,7 @@ from PIL import Image
 from pdfplumber.page import Page
 from .extractor import Extractor
 from scanipy.pdfhandler import PDFPage
+from scanipy.charindex import CharIndex
 from scanipy.elements import TitleElement 
 from scanipy.deeplearning.models import TextOCR
 from typing import Union, Tuple, List, Dict
@@ -15,7 +16,7 @@ class TitleExtractor(Extractor):
     Represents a title extractor for extracting title from a document.
     """
 
-    def __init__(self, use_ocr: bool, lang: str = 'en', tolerance: float = 1.5):
+    def __init__(self, use_ocr: bool, lang: str = 'en', tolerance: float = 1.5, device: Union[str, None] = None):
       """
       Initialize a TitleExtractor object.
 
@@ -23,6 +24,7 @@ class TitleExtractor(Extractor):
           use_ocr (bool): Whether to use OCR for title extraction or not.
           lang (str): The language of the title. Defaults to english.
           tolerance (float): The tolerance level for title extraction. Default is 1.5.
+          device (Union[str, None]): The device of the OCR models, 'cpu' or 'cuda'. Defaults to None (CUDA if available).
 
       Raises:
           TypeError: If the types of the arguments are not as expected.
@@ -35,22 +37,24 @@ class TitleExtractor(Extractor):
       # Initialize OCR settings and OCR model
       self.use_ocr = use_ocr
 
-      # Check if CUDA is available and set the device accordingly
-      self.device = 'cuda' if torch.cuda.is_available() else 'cpu'
+      # Use the requested device, or CUDA if it is available
+      if device is None:
+          device = 'cuda' if torch.cuda.is_available() else 'cpu'
+      self.device = device
 
-      # Initialize OCR model for title and equations
-      self.title_equations_ocr = pix2text.Pix2Text(device=self.device)
+      # Initialize OCR model for title and equations, shared with the other extractors and loaded on first use
+      self.title_equations_ocr = self._acquire_model(pix2text.Pix2Text, device=self.device)
 
       # Set the language for OCR
       self.lang = lang
 
-      # Initialize the TextOCR object
-      self.title_ocr = TextOCR(self.lang, self.device)
+      # Initialize the TextOCR object, shared with the other extractors and loaded on first use
+      self.title_ocr = self._acquire_model(TextOCR, self.lang, self.device)
 
       # Set the tolerance level for title extraction
       self.tolerance = tolerance
 
-    def _process_title_image(self, title_element: TitleElement, title_image: Image.Image, pdf_page: Page) -> str:
+    def _process_title_image(self, title_element: TitleElement, title_image: Image.Image, pdf_page: Page, char_index: CharIndex) -> str:
       """
       Process the title image based on OCR settings and equation presence.
 
@@ -58,6 +62,7 @@ class TitleExtractor(Extractor):
           title_element (TitleElement): The title element containing the coordinates for extraction.
           title_image (Image): The cropped title image.
           pdf_page (Page): The PDF page containing the title element.
+          char_index (CharIndex): The index over the characters of the PDF page.
 
       Returns:
           str: The extracted title content.
@@ -70,9 +75,9 @@ class TitleExtractor(Extractor):
               return self._get_title_with_ocr(title_image)
       else:
           if title_element.has_equation_inside:
-              return self._get_title_and_equations_without_ocr(title_element, title_image, pdf_page)
+              return self._get_title_and_equations_without_ocr(title_element, title_image, pdf_page, char_index)
           else:
-              return self._get_title_without_ocr(title_element, title_image, pdf_page)
+              return self._get_title_without_ocr(title_element, title_image, pdf_page, char_index)
 
     def extract(self, page: PDFPage, title_element: TitleElement) -> TitleElement:
         """
@@ -89,27 +94,24 @@ class TitleExtractor(Extractor):
         Raises:
             TypeError: If the types of the arguments are not as expected.
         """
-        # Separate PIL and pdfplumber elements from the 
-        pdf_page = page.get_pdf()
-        page_image = page.get_image()
-
         # Verify the input variable types
-        if not isinstance(page_image, Image.Image):
-            raise TypeError("page_image must be a PIL.Image object")
+        if not isinstance(page, PDFPage):
+            raise TypeError("page must be a PDFPage object")
         if not isinstance(title_element, TitleElement):
             raise TypeError("title_element must be a TitleElement object")
 
-        # Extract the coordinates from the equation element
-        left = int(title_element.x_min * page_image.width)
-        upper = int(title_element.y_min * page_image.height)
-        right = int(title_element.x_max * page_image.width)
-        lower = int(title_element.y_max * page_image.height)
+        # Get the pdfplumber page and the index over its characters, built once per page
+        pdf_page = page.get_pdf()
+        char_index = page.get_char_index()
+
+        # Extract the coordinates from the title element
+        region = (title_element.x_min, title_element.y_min, title_element.x_max, title_element.y_max)
 
-        # Crop the image based on the coordinates
-        title_image = page_image.crop((left, upper, right, lower))
+        # Get the image of the region, rendered again from the PDF if a region resolution is set
+        title_image = page.get_region_image(region)
 
         # Process the cropped title image and extract the title content
-        title_content = self._process_title_image(title_element, title_image, pdf_page)
+        title_content = self._process_title_image(title_element, title_image, pdf_page, char_index)
 
         # Update the title element with the extracted title content
         title_element.title_content = title_content
@@ -219,7 +221,7 @@ class TitleExtractor(Extractor):
 
         return extracted_title
 
-    def _get_title_without_ocr(self, title_element: TitleElement, cropped_image: Image.Image, pdf_page: Page) -> str:
+    def _get_title_without_ocr(self, title_element: TitleElement, cropped_image: Image.Image, pdf_page: Page, char_index: CharIndex) -> str:
         """
         Extracts title from a given area in a PDF page without using OCR.
 
@@ -227,6 +229,7 @@ class TitleExtractor(Extractor):
             title_element (TitleElement): The title element containing the coordinates for title extraction.
             cropped_image (Image): The cropped image containing the title.
             pdf_page (Page): The PDF page from which the title is to be extracted.
+            char_index (CharIndex): The index over the characters of the PDF page.
 
         Returns:
             str: The extracted title content.
@@ -255,11 +258,8 @@ class TitleExtractor(Extractor):
         # Define the bounding box for cropping the PDF page
         bounding_box = (x_min_coord, y_min_coord, x_max_coord, y_max_coord)
 
-        # Crop the PDF page based on the bounding box
-        cropped_pdf_page = pdf_page.crop(bounding_box)
-
-        # Extract title from the cropped PDF page
-        extracted_title = cropped_pdf_page.extract_text(x_tolerance=self.tolerance)
+        # Extract title from the bounding box, using only the characters indexed around it
+        extracted_title = char_index.extract_text(bounding_box, x_tolerance=self.tolerance)
 
         # Remove newline characters from the extracted title
         cleaned_title = extracted_title.replace('\n', '')
@@ -307,23 +307,23 @@ class TitleExtractor(Extractor):
 
         return x_min, y_min, x_max, y_max
 
-    def _convert_to_cropped_page_referential(self, x_min: float, y_min: float, x_max: float, y_max: float, cropped_page: Page) -> Tuple[int, int, int, int]:
+    def _convert_to_cropped_page_referential(self, x_min: float, y_min: float, x_max: float, y_max: float, crop_box: Tuple[int, int, int, int]) -> Tuple[int, int, int, int]:
         """
         Convert normalized coordinates to cropped page's referential.
 
         Args:
             x_min, y_min, x_max, y_max (float): Normalized coordinates.
-            cropped_page (Page): The cropped PDF page.
+            crop_box (Tuple[int, int, int, int]): The bounding box of the cropped PDF page.
 
         Returns:
             Tuple[int, int, int, int]: Coordinates in the cropped page's referential.
         """
-        x_min = int(x_min * cropped_page.width)
-        y_min = int(y_min * cropped_page.height)
-        x_max = int(x_max * cropped_page.width)
-        y_max = int(y_max * cropped_page.height)
+        x0, y0, x1, y1 = crop_box
 
-        x0, y0, _, _ = cropped_page.bbox
+        x_min = int(x_min * (x1 - x0))
+        y_min = int(y_min * (y1 - y0))
+        x_max = int(x_max * (x1 - x0))
+        y_max = int(y_max * (y1 - y0))
 
         return x_min + int(x0), y_min + int(y0), x_max + int(x0), y_max + int(y0)
 
@@ -346,7 +346,7 @@ class TitleExtractor(Extractor):
         text = pix2text.merge_line_texts(ocr_results)
         return text
 
-    def _get_title_and_equations_without_ocr(self, title_element: TitleElement, title_image: Image.Image, pdf_page: Page) -> str:
+    def _get_title_and_equations_without_ocr(self, title_element: TitleElement, title_image: Image.Image, pdf_page: Page, char_index: CharIndex) -> str:
         """
         Extracts title and equations from a given title image without using OCR to extract title.
 
@@ -354,6 +354,7 @@ class TitleExtractor(Extractor):
             title_element (TitleElement): The title element containing the coordinates for extraction.
             title_image (Image): The cropped title image.
             pdf_page (Page): The PDF page containing the title element.
+            char_index (CharIndex): The index over the characters of the PDF page.
 
         Returns:
             str: The extracted title content.
@@ -382,9 +383,6 @@ class TitleExtractor(Extractor):
         # Define the PDF crop box
         pdf_box = (x_min_pdf, y_min_pdf, x_max_pdf, y_max_pdf)
 
-        # Crop the PDF page based on the calculated coordinates
-        cropped_page = pdf_page.crop(pdf_box)
-
         # Get OCR results for the title image
         ocr_results = self.title_equations_ocr(title_image)
 
@@ -395,11 +393,11 @@ class TitleExtractor(Extractor):
                 x_min, y_min, x_max, y_max = self._extract_and_normalize_coordinates(box, title_image.size)
 
                 # Convert normalized coordinates to cropped page's referential
-                x_min, y_min, x_max, y_max = self._convert_to_cropped_page_referential(x_min, y_min, x_max, y_max, cropped_page)
+                x_min, y_min, x_max, y_max = self._convert_to_cropped_page_referential(x_min, y_min, x_max, y_max, pdf_box)
 
-                # Extract title from the cropped PDF page based on the calculated coordinates
-                segmentation = cropped_page.crop((x_min, y_min, x_max, y_max))
-                extracted_title = segmentation.extract_text(x_tolerance=self.tolerance)
+                # Extract title from the line box, clipped to the crop box like a nested pdfplumber crop
+                line_box = char_index.intersect(pdf_box, (x_min, y_min, x_max, y_max))
+                extracted_title = '' if line_box is None else char_index.extract_text(line_box, x_tolerance=self.tolerance)
                 extracted_title = extracted_title.replace('\n', '')
 
                 # Update the OCR box with the extracted title
@@ -0,0 +1,119 @@
+import os
+from typing import Iterable, List, Tuple
+
+
+class MarkdownWriter:
+    """
+    Write a Markdown document page by page, as the pages are parsed.
+
+    Each page is appended to the Markdown file (and its images saved) as soon as it is written, then
+    dropped, so memory does not grow with the number of pages and the file can be read while the rest
+    of the document is being parsed. The file is the same as the one written by Document.to_markdown.
+
+    Example:
+        >>> with MarkdownWriter('output') as writer:
+        ...     writer.write_pages(parser.iter_pages('book.pdf'))
+
+    Attributes:
+        output_folder (str): The folder of the Markdown file and of the images.
+        path (str): The path of the Markdown file.
+        pages_written (int): The number of pages written so far.
+    """
+
+    def __init__(self, output_folder: str, filename: str = 'output.md'):
+        """
+        Initialize the writer, creating the output folder and an empty Markdown file.
+
+        Args:
+            output_folder (str): The folder of the Markdown file and of the images.
+            filename (str): The name of the Markdown file. Defaults to 'output.md'.
+
+        Raises:
+            TypeError: If the types of the arguments are not as expected.
+        """
+        # Verify the input variable types
+        if not isinstance(output_folder, (str, os.PathLike)):
+            raise TypeError("output_folder must be a string or a path")
+        if not isinstance(filename, str):
+            raise TypeError("filename must be a string")
+
+        self.output_folder = os.fspath(output_folder)
+        os.makedirs(self.output_folder, exist_ok=True)
+        self.path = os.path.join(self.output_folder, filename)
+        self.pages_written = 0
+        self._file = open(self.path, 'w')
+
+    def write_page(self, page_number: int, elements: List) -> None:
+        """
+        Append a page to the Markdown file, and flush it to disk.
+
+        Args:
+            page_number (int): The number of the page.
+            elements (List): The extracted elements of the page, in reading order.
+
+        Raises:
+            ValueError: If the writer is closed.
+        """
+        if self._file is None:
+            raise ValueError("The writer is closed")
+
+        self._file.write(''.join(element.generate_markdown(self.output_folder) for element in elements))
+        self._file.flush()
+        self.pages_written += 1
+
+    def write_pages(self, pages: Iterable[Tuple[int, List]]) -> int:
+        """
+        Append every page of an iterable, each one as soon as it is available.
+
+        Args:
+            pages (Iterable[Tuple[int, List]]): The page numbers and elements of the pages, see Parser.iter_pages.
+
+        Returns:
+            int: The number of pages written.
+        """
+        count = 0
+        for page_number, elements in pages:
+            self.write_page(page_number, elements)
+            count += 1
+        return count
+
+    def close(self) -> None:
+        """
+        Close the Markdown file.
+        """
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> 'MarkdownWriter':
+        """
+        Use the writer as a context manager, closing it on exit.
+
+        Returns:
+            MarkdownWriter: The writer.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """
+        Close the writer when leaving the context.
+        """
+        self.close()
+
+    def __repr__(self) -> str:
+        """
+        Returns the official string representation of the MarkdownWriter object.
+
+        Returns:
+            str: A string representation of the object.
+        """
+        return f"MarkdownWriter(path='{self.path}', pages_written={self.pages_written})"
+
+    def __str__(self) -> str:
+        """
+        Returns a string representation of the MarkdownWriter object, which is the same as its official representation.
+
+        Returns:
+            str: A string representation of the object.
+        """
+        return self.__repr__()
@@ -1,58 +1,913 @@
+import asyncio
+import concurrent.futures
+import contextlib
 import fitz
+import functools
+import itertools
 import logging
+import multiprocessing
+import numpy as np
+import weakref
 
-from .pdfhandler import PDFDocument
+from .pdfhandler import PDFDocument, PDFPage, PageSelection, select_pages
+from .pdfsource import PDFInput, PDFSource
+from .parseresult import ParseResult
+from .checkpoint import Checkpoint
+from .markdownwriter import MarkdownWriter
+from .pipeline import Pipeline
 from .deeplearning.models import LayoutDetector, EquationFinder
-from .elements import TitleElement, TextElement, TableElement, EquationElement, TitleElement, ImageElement
+from .deeplearning.inferenceprofile import InferenceProfile
+from .deeplearning.modelregistry import MODEL_REGISTRY
+from .elements import TitleElement, TextElement, TableElement, EquationElement, ImageElement
+from .elements import OverlapSuppressor, geometry
 from .extractors import TitleExtractor, TextExtractor, TableDataExtractor, EquationExtractor, ImageExtractor
 from .document import Document
-from collections import defaultdict
+from .cache import RenderCache, ResultCache
+from collections import defaultdict, deque
+from concurrent.futures.process import BrokenProcessPool
+from typing import Union, Iterable, Iterator, AsyncIterator, List, Tuple
 import os
 
+# A page with its elements and its equations, as it goes through the parsing stages
+ParsedPage = Tuple[PDFPage, List, List[EquationElement]]
+
+# The name of the type of each detected element, see Parser.ELEMENT_TYPES
+_ELEMENT_TYPES = {TextElement: 'text', TitleElement: 'title', TableElement: 'table', ImageElement: 'image'}
+
 
 class Parser:
     """
-    Parses a PDF file using PyMuPDF (fitz) and extracts its content into a Markdown file.
+    Parses a PDF file, rendered with the selected renderer (pdfplumber or PyMuPDF), and extracts its content into
+    a Document or a Markdown file.
 
     Attributes:
-        pdf_file (PyMuPDF.Document): The PyMuPDF Document object representing the PDF file.
+        renderer (str): The rasterization backend of the pages, 'pdfplumber' or 'pymupdf'.
+        layout_detector (LazyModel): The shared LayoutDetector, loaded on first use.
+        equation_finder (LazyModel): The shared EquationFinder, loaded on first use.
     """
 
-    def __init__(self): #TODO define device here
+    # The stages whose models can be loaded ahead of time by warmup
+    STAGES = ('layout', 'equation', 'table', 'text', 'title')
+
+    # The types of elements a parser can extract
+    ELEMENT_TYPES = ('text', 'title', 'table', 'image', 'equation')
+
+    def __init__(self, streaming: bool = True, page_window: int = 2, render_workers: int = 1,
+                 renderer: str = 'pdfplumber', resolution: int = 200, region_resolution: Union[int, None] = None,
+                 render_cache: Union[RenderCache, None] = None, batch_size: int = 1, pipelined: bool = False,
+                 queue_size: int = 2, max_concurrent_documents: int = 4, profile: Union[InferenceProfile, None] = None,
+                 elements: Union[Iterable[str], None] = None, table_fallback: Union[str, None] = None,
+                 result_cache: Union[ResultCache, None] = None, checkpoint_dir: Union[str, os.PathLike, None] = None,
+                 overlap_suppressor: Union[OverlapSuppressor, None] = None, quantize: bool = False):
         """
         Initialize a new Parser instance.
 
-        :param path: The path to the PDF file to parse.
+        :param streaming: If True, pages are rasterized on demand and released once parsed,
+            so memory usage does not grow with the number of pages.
+        :param page_window: The number of pages kept resident in memory when streaming.
+        :param render_workers: The number of worker processes used to rasterize pages.
+        :param renderer: The rasterization backend, 'pdfplumber' or 'pymupdf' (faster).
+        :param resolution: The resolution (DPI) of the page images seen by the layout and equation detectors.
+        :param region_resolution: If set, the resolution (DPI) at which the detected regions are rendered
+            again from the PDF for the extractors. A low resolution for detection with a higher one for
+            the regions pushes far fewer pixels through the pipeline, best used with the 'pymupdf' renderer
+            that renders only the regions. Defaults to None (regions are cropped from the page images).
+        :param render_cache: A persistent cache of page images, so that parsing the same PDF again does not
+            rasterize its pages again. Defaults to None.
+        :param batch_size: The number of pages given together to the layout detector, which runs a batch in
+            one forward pass (the equation detector runs page by page). Larger batches raise the throughput
+            at the cost of keeping more page images in memory. Defaults to 1.
+        :param pipelined: If True, rendering, detection, element extraction and equation conversion run in
+            stages of their own, connected by bounded queues, so that they overlap across pages. The Document
+            is the same as with the sequential parsing. Defaults to False.
+        :param queue_size: When pipelined, the maximum number of pages (batches, before detection) waiting
+            between two stages. Defaults to 2.
+        :param max_concurrent_documents: The maximum number of documents parsed at once by aextract and
+            aiter_pages in an event loop. Defaults to 4.
+        :param profile: The device and the thread counts used by every model, applied to the process
+            before the models are loaded. Defaults to None (InferenceProfile.default(): CUDA if available,
+            otherwise the CPU, leaving the thread pools and the environment of the process untouched).
+            Extracting equations on CUDA needs the first GPU, 'cuda' or 'cuda:0' (see EquationFinder).
+        :param elements: The types of elements to extract, among Parser.ELEMENT_TYPES: 'text', 'title', 'table',
+            'image' and 'equation'. The stages only needed by the other types are skipped, and their models
+            are never loaded: without 'equation', neither the equation detector nor the LaTeX conversion
+            runs; without 'table', the table structure model does not run. Defaults to None (every type).
+        :param table_fallback: What becomes of the detected tables when 'table' is not in elements: 'image'
+            to extract them as image regions, or 'skip' to drop them. Defaults to None ('image' if 'image'
+            is in elements, 'skip' otherwise).
+        :param result_cache: A persistent cache of parsing results. Parsing a PDF file again returns its
+            cached Document, and pages already parsed (in any PDF file) are not parsed again. The results
+            are keyed by the content of the PDF file or page, the settings of the parser and the versions
+            of the models. Defaults to None.
+        :param checkpoint_dir: A directory where extract persists the results of each page as soon as it is
+            parsed. If parsing stops (e.g. the process is killed), extracting the same PDF file with the same
+            configuration again resumes from the unfinished pages, and returns the same Document as an
+            uninterrupted run. The checkpoint of a document is removed once it is complete. Defaults to None.
+        :param overlap_suppressor: Drops (or merges) the duplicate and nested layout elements of each page
+            before their content is extracted, so that a region detected twice is not cropped, read and
+            converted twice. Its report() tells how many elements were suppressed. Defaults to None (every
+            detected element is extracted).
+        :param quantize: If True, the LaTeX conversion and the table structure models run with their linear
+            layers quantized to int8 (dynamic quantization), faster on the CPU at a small cost in accuracy.
+            The models are quantized when they are loaded. The profile must use the CPU. Defaults to False.
         """
-        self.layout_detector = LayoutDetector(device='cuda')
-        self.table_extractor = TableDataExtractor()
-        self.text_extractor = TextExtractor(use_ocr=False)
-        self.title_extractor = TitleExtractor(use_ocr=False)
-        self.image_extractor = ImageExtractor()
-        self.equation_finder = EquationFinder(device='gpu')
-        self.equation_extractor = EquationExtractor()
-        # self.pipeline = [self.text_extractor, self.table_extractor, self.equation_extractor]
+        if not isinstance(batch_size, int) or batch_size < 1:
+            raise ValueError("batch_size must be an integer greater than or equal to 1")
+        if not isinstance(pipelined, bool):
+            raise TypeError("pipelined must be a boolean")
+        if not isinstance(queue_size, int) or queue_size < 1:
+            raise ValueError("queue_size must be an integer greater than or equal to 1")
+        if not isinstance(max_concurrent_documents, int) or max_concurrent_documents < 1:
+            raise ValueError("max_concurrent_documents must be an integer greater than or equal to 1")
+        elements = frozenset(self.ELEMENT_TYPES if elements is None else [elements] if isinstance(elements, str) else elements)
+        if not elements or not elements <= set(self.ELEMENT_TYPES):
+            raise ValueError(f"elements must be a non-empty collection of {', '.join(self.ELEMENT_TYPES)}")
+        if table_fallback is None:
+            table_fallback = 'image' if 'image' in elements else 'skip'
+        if table_fallback not in ('image', 'skip'):
+            raise ValueError("table_fallback must be 'image', 'skip' or None")
+        if result_cache is not None and not isinstance(result_cache, ResultCache):
+            raise TypeError("result_cache must be a ResultCache or None")
+        if checkpoint_dir is not None and not isinstance(checkpoint_dir, (str, os.PathLike)):
+            raise TypeError("checkpoint_dir must be a string, a path or None")
+        if overlap_suppressor is not None and not isinstance(overlap_suppressor, OverlapSuppressor):
+            raise TypeError("overlap_suppressor must be an OverlapSuppressor or None")
+        if profile is not None and not isinstance(profile, InferenceProfile):
+            raise TypeError("profile must be an InferenceProfile or None")
+        explicit_profile = profile
+        if profile is None:
+            profile = InferenceProfile.default()
+        if not isinstance(quantize, bool):
+            raise TypeError("quantize must be a boolean")
+        if quantize and profile.uses_cuda:
+            raise ValueError("quantized models run on the CPU, but the profile uses CUDA")
+        if 'equation' in elements:
+            # Check the device of the equation finder now, rather than when it is loaded in the middle of a parse
+            EquationFinder.cnstd_device(profile.device)
+
+        # Keep the settings, to build identical parsers in worker processes
+        self._config = dict(streaming=streaming, page_window=page_window, render_workers=render_workers,
+                            renderer=renderer, resolution=resolution, region_resolution=region_resolution,
+                            render_cache=render_cache, batch_size=batch_size, pipelined=pipelined,
+                            queue_size=queue_size, max_concurrent_documents=max_concurrent_documents,
+                            profile=explicit_profile, elements=elements, table_fallback=table_fallback,
+                            result_cache=result_cache, checkpoint_dir=checkpoint_dir,
+                            overlap_suppressor=overlap_suppressor,
+                            quantize=quantize)
+
+        self.streaming = streaming
+        self.page_window = page_window
+        self.render_workers = render_workers
+        self.renderer = renderer
+        self.resolution = resolution
+        self.region_resolution = region_resolution
+        self.render_cache = render_cache
+        self.batch_size = batch_size
+        self.pipelined = pipelined
+        self.queue_size = queue_size
+        self.max_concurrent_documents = max_concurrent_documents
+        self.profile = profile
+        self.elements = elements
+        self.table_fallback = table_fallback
+        self.result_cache = result_cache
+        self.checkpoint_dir = checkpoint_dir
+        self.overlap_suppressor = overlap_suppressor
+        self.quantize = quantize
+        self.closed = False
+
+        # Identify the configuration in the keys of the cached and checkpointed results
+        self._fingerprint = None if result_cache is None and checkpoint_dir is None else ResultCache.fingerprint(dict(
+            renderer=renderer, resolution=resolution, region_resolution=region_resolution,
+            elements=sorted(elements), table_fallback=table_fallback, device=profile.device,
+            overlap_suppressor=overlap_suppressor, quantize=quantize))
+        self._semaphores = weakref.WeakKeyDictionary()
+
+        # Configure the thread pools before any model is loaded, if asked to. Every model is loaded on the same device,
+        # on first use, so that the stages a corpus never needs cost nothing (see warmup), and is shared
+        # with the other parsers of the process using the same model on the same device
+        if explicit_profile is not None:
+            profile.apply()
+        self.layout_detector = MODEL_REGISTRY.acquire(LayoutDetector, device=profile.device)
+        self.table_extractor = TableDataExtractor(device=profile.device, quantize=quantize)
+        self.text_extractor = TextExtractor(use_ocr=False, device=profile.device)
+        self.title_extractor = TitleExtractor(use_ocr=False, device=profile.device)
+        self.equation_finder = MODEL_REGISTRY.acquire(EquationFinder, device=profile.device)
+        self.equation_extractor = EquationExtractor(device=profile.device, quantize=quantize)
     
-    def extract(self, path): #TODO add min and max pages
-        pdfdoc = PDFDocument(path)
-        elements_h = {}
+    def warmup(self, stages: Union[Iterable[str], None] = None) -> None:
+        """
+        Load the models of some stages now, instead of on their first use while parsing.
+
+        The models are otherwise loaded by the first page that needs them, which makes that page slow.
+        Deployments that prefer to pay the cost at startup (e.g. before accepting requests) call warmup.
+
+        :param stages: The stages to prepare, among Parser.STAGES: 'layout' (layout detection), 'equation'
+            (equation detection and conversion to LaTeX), 'table', 'text' and 'title'. Defaults to None
+            (every stage needed by the enabled element types).
+        :raises ValueError: If a stage is unknown.
+        """
+        stage_models = self._stage_models()
+        if stages is None:
+            stages = self._enabled_stages()
+        stages = [stages] if isinstance(stages, str) else list(stages)
+        for stage in stages:
+            if stage not in stage_models:
+                raise ValueError(f"Unknown stage '{stage}', expected one of {', '.join(self.STAGES)}")
+
+        for stage in stages:
+            for model in stage_models[stage]:
+                model.get()
+
+    def close(self) -> None:
+        """
+        Release the models of the parser. The models no other parser of the process uses are unloaded.
+        The parser must not be used afterwards.
+        """
+        if self.closed:
+            return
+        self.closed = True
+
+        MODEL_REGISTRY.release(self.layout_detector)
+        MODEL_REGISTRY.release(self.equation_finder)
+        for extractor in (self.table_extractor, self.text_extractor, self.title_extractor, self.equation_extractor):
+            extractor.close()
+
+    def __enter__(self) -> 'Parser':
+        """
+        Use the parser as a context manager, closing it on exit.
+
+        :return: The parser.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """
+        Close the parser when leaving the context.
+        """
+        self.close()
+
+    def _enabled_stages(self) -> List[str]:
+        """
+        Get the stages needed by the enabled element types.
+
+        :return: The names of the stages, among Parser.STAGES.
+        """
+        stages = ['layout'] if self._runs_layout() else []
+        return stages + [stage for stage in self.STAGES[1:] if stage in self.elements]
+
+    def _runs_layout(self) -> bool:
+        """
+        Whether the layout detector is needed, i.e. whether an element type other than equations is enabled.
+
+        :return: True if the layout detector runs.
+        """
+        return not self.elements <= {'equation'}
+
+    def _stage_models(self) -> dict:
+        """
+        Get the models used by each stage.
+
+        :return: The lazily loaded models of each stage, by stage name.
+        """
+        text_models = [self.text_extractor.text_equations_ocr]
+        if self.text_extractor.use_ocr:
+            text_models.append(self.text_extractor.text_ocr)
+        title_models = [self.title_extractor.title_equations_ocr]
+        if self.title_extractor.use_ocr:
+            title_models.append(self.title_extractor.title_ocr)
+
+        return {
+            'layout': [self.layout_detector],
+            'equation': [self.equation_finder, self.equation_extractor.latex_ocr],
+            'table': [self.table_extractor.model],
+            'text': text_models,
+            'title': title_models,
+        }
+
+    def extract(self, path: PDFInput, pages: PageSelection = None):
+        """
+        Parse a PDF file and extract its elements into a Document.
+
+        :param path: The PDF file to parse: a path, or the PDF held in memory as bytes, a bytearray,
+            a memoryview, an mmap or a seekable binary file object (e.g. an HTTP upload), without
+            writing it to disk first.
+        :param pages: The pages to parse, e.g. 7, range(40, 46), [1, 3, 5] or "1-10,20-40:2".
+            Pages outside the selection are neither rendered nor analyzed, and the Document keeps
+            the original page numbers. Defaults to None (every page).
+        :return: The Document with the extracted elements.
+        """
+        # The source created here to hash the PDF is closed here, a source given by the caller is left open
+        with contextlib.ExitStack() as stack:
+            if self._fingerprint is not None and not isinstance(path, PDFSource):
+                path = PDFSource(path)
+                stack.callback(path.close)
+            return self._extract(path, pages)
+
+    def _extract(self, path: Union[PDFInput, PDFSource], pages: PageSelection) -> Document:
+        """
+        Parse a PDF file and extract its elements into a Document, see extract.
+
+        :param path: The PDF file, as a PDFSource when results are cached or checkpointed.
+        :param pages: The pages to parse.
+        :return: The Document with the extracted elements.
+        """
+        # Return the cached document, or resume from the pages finished by a previous, interrupted run
+        document_key, checkpoint, finished_pages = None, None, {}
+        if self._fingerprint is not None:
+            pages, document_key, document, checkpoint, finished_pages = self._find_results(path, pages)
+            if document is not None:
+                return document
+
+        document = Document()
+
+        # The PDF file, the page caches and the render workers are released when leaving the blocks,
+        # and the stages are stopped before the document is closed, even if parsing fails
+        with self._open_document(path, pages, unrendered_pages=finished_pages) as pdfdoc:
+            with contextlib.closing(self._parse_pages(pdfdoc, finished_pages)) as parsed_pages:
+                for page, elements, equations in parsed_pages:
+                    for element in [*elements, *equations]:
+                        document.add_element(page.page_number, element)
+
+                    # Persist the page before moving on
+                    if checkpoint is not None and page.page_number not in finished_pages:
+                        checkpoint.save(page.page_number, elements, equations)
+
+                    # Release the page image and pdfplumber objects as soon as the page is parsed
+                    page.release()
+
+        self._store_results(document_key, document, checkpoint)
+        return document
+
+    def _find_results(self, path: PDFSource, pages: PageSelection) -> Tuple[List[int], str, Union[Document, None],
+                                                                         Union[Checkpoint, None], dict]:
+        """
+        Look up the known results of a PDF file in the result cache and the checkpoint directory, for extract and
+        aextract.
+
+        :param path: The PDF file.
+        :param pages: The pages to parse.
+        :return: The selected page numbers, the key of the document, the cached Document (or None), the
+            checkpoint of the document (or None) and the elements and equations of the pages it holds, by page
+            number.
+        """
+        # Identify the PDF content, selected pages and configuration, equivalent selections sharing their key
+        pages = select_pages(path, pages)
+        document_key = ResultCache.key(self._fingerprint, path.hash(), pages)
+
+        # Return the cached document
+        if self.result_cache is not None:
+            document = self.result_cache.get_document(document_key)
+            if document is not None:
+                return pages, document_key, document, None, {}
+
+        # Resume from the pages finished by a previous, interrupted run
+        checkpoint = None if self.checkpoint_dir is None else Checkpoint(self.checkpoint_dir, document_key)
+        finished_pages = {} if checkpoint is None else checkpoint.load()
+        return pages, document_key, None, checkpoint, finished_pages
+
+    def _store_results(self, document_key: Union[str, None], document: Document,
+                       checkpoint: Union[Checkpoint, None]) -> None:
+        """
+        Cache a complete document and remove its checkpoint, for extract and aextract.
+
+        :param document_key: The key of the document, see _find_results.
+        :param document: The Document with the extracted elements.
+        :param checkpoint: The checkpoint of the document, or None.
+        """
+        if self.result_cache is not None:
+            self.result_cache.put_document(document_key, document)
+        if checkpoint is not None:
+            checkpoint.remove()
+
+    def iter_pages(self, path: PDFInput, pages: PageSelection = None) -> Iterator[Tuple[int, List]]:
+        """
+        Parse a PDF file page by page, yielding the elements of each page as soon as it is parsed.
+
+        Unlike extract, nothing is kept once a page is yielded, so memory does not grow with the number of
+        pages, and the first page is available after a single page is parsed. Closing the iterator stops the
+        parsing and closes the document. See MarkdownWriter to write the pages to disk as they come.
+
+        :param path: The PDF file to parse, see extract.
+        :param pages: The pages to parse, see extract. Defaults to None (every page).
+        :return: An iterator over the page number and the extracted elements and equations of each page, in
+            reading order, page after page.
+        """
+        with self._open_document(path, pages) as pdfdoc:
+            with contextlib.closing(self._parse_pages(pdfdoc)) as parsed_pages:
+                for page, elements, equations in parsed_pages:
+                    # Release the page image and pdfplumber objects before handing the page out
+                    page.release()
+                    yield page.page_number, sorted([*elements, *equations])
+
+    def to_markdown(self, path: PDFInput, output_folder: str, filename: str = 'output.md',
+                    pages: PageSelection = None) -> int:
+        """
+        Parse a PDF file into a Markdown file, writing each page as soon as it is parsed.
+
+        The Markdown file is the same as the one of extract(path).to_markdown(output_folder, filename), but
+        it grows page by page, and memory stays constant whatever the number of pages.
+
+        :param path: The PDF file to parse, see extract.
+        :param output_folder: The folder where the Markdown file and the images are saved.
+        :param filename: The name of the Markdown file. Defaults to 'output.md'.
+        :param pages: The pages to parse, see extract. Defaults to None (every page).
+        :return: The number of pages written.
+        """
+        with MarkdownWriter(output_folder, filename) as writer:
+            with contextlib.closing(self.iter_pages(path, pages)) as parsed_pages:
+                return writer.write_pages(parsed_pages)
+
+    async def aextract(self, path: PDFInput, pages: PageSelection = None) -> Document:
+        """
+        Parse a PDF file and extract its elements into a Document, without blocking the event loop.
+
+        The Document is the same as the one of extract, and the result cache and the checkpoints are used as in
+        extract. See aiter_pages for the execution and the cancellation.
+
+        :param path: The PDF file to parse, see extract.
+        :param pages: The pages to parse, see extract. Defaults to None (every page).
+        :return: The Document with the extracted elements.
+        """
+        # The known results are looked up in the thread of the document, before it is opened
+        state = {'use_results': True}
         document = Document()
-        image_number = 0
-
-        for page in pdfdoc:
-            elements = self.layout_detector(page.get_image())
-            equations = self.equation_finder(page.get_image())
-
-            logging.info(f'Detected {len(elements)} elements and {len(equations)} equations')
-
-            for equation in equations:
-                if equation.is_inside_text:
-                    for element in elements:
-                        if equation.is_in(element):
-                            element.has_equation_inside = True
-                            element.equation_inside = equation
-                            break #TODO: what if two elements have the same equation? #BUG
-            
+        async with contextlib.aclosing(self._aparse_pages(path, pages, state)) as parsed_pages:
+            async for page_number, elements, equations in parsed_pages:
+                for element in [*elements, *equations]:
+                    document.add_element(page_number, element)
+
+        if state.get('cached_document') is not None:
+            return state['cached_document']
+        if self._fingerprint is not None:
+            await asyncio.to_thread(self._store_results, state['document_key'], document, state['checkpoint'])
+        return document
+
+    async def aiter_pages(self, path: PDFInput, pages: PageSelection = None) -> AsyncIterator[Tuple[int, List]]:
+        """
+        Parse a PDF file page by page, without blocking the event loop.
+
+        The rendering, the model inference and the OCR of a document run in a thread of its own, one page at
+        a time, while the event loop keeps serving other tasks. At most max_concurrent_documents documents are
+        parsed at once per event loop; the others wait for a free slot.
+
+        Cancelling the task (or closing the iterator) stops the parsing after the page being parsed, and the
+        document is then closed in its thread.
+
+        :param path: The PDF file to parse, see extract.
+        :param pages: The pages to parse, see extract. Defaults to None (every page).
+        :return: An asynchronous iterator over the page number and the extracted elements and equations of each
+            page, in reading order as with iter_pages, page after page.
+        """
+        async with contextlib.aclosing(self._aparse_pages(path, pages)) as parsed_pages:
+            async for page_number, elements, equations in parsed_pages:
+                yield page_number, sorted([*elements, *equations])
+
+    async def _aparse_pages(self, path: PDFInput, pages: PageSelection, state: Union[dict, None] = None
+                            ) -> AsyncIterator[Tuple[int, List, List[EquationElement]]]:
+        """
+        Parse a PDF file page by page in a thread of its own, see aiter_pages.
+
+        :param path: The PDF file to parse.
+        :param pages: The pages to parse.
+        :param state: The state of the parsing, see _open_parsing. Defaults to None (a new state).
+        :return: An asynchronous iterator over the page number, the extracted elements and the extracted
+            equations of each page, in order.
+        """
+        loop = asyncio.get_running_loop()
+        async with self._document_slots(loop):
+            # A single thread per document runs its steps one after the other, the closing step last
+            executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix='scanipy')
+            state = {} if state is None else state
+            try:
+                await asyncio.wrap_future(executor.submit(self._open_parsing, state, path, pages))
+                while True:
+                    parsed_page = await asyncio.wrap_future(executor.submit(self._parse_next_page, state))
+                    if parsed_page is None:
+                        break
+                    yield parsed_page
+            finally:
+                # Do not wait for a page still being parsed: the closing step runs as soon as it is done
+                executor.submit(self._close_parsing, state)
+                executor.shutdown(wait=False)
+
+    def _document_slots(self, loop: asyncio.AbstractEventLoop) -> asyncio.Semaphore:
+        """
+        Get the semaphore limiting the number of documents parsed at once in an event loop.
+
+        :param loop: The event loop.
+        :return: The semaphore of the event loop.
+        """
+        if loop not in self._semaphores:
+            self._semaphores[loop] = asyncio.Semaphore(self.max_concurrent_documents)
+        return self._semaphores[loop]
+
+    def _open_parsing(self, state: dict, path: PDFInput, pages: PageSelection) -> None:
+        """
+        Open a document and start its parsing, in the thread of the document.
+
+        With 'use_results' in the state, the known results are first looked up as in extract: the document is
+        not opened if it is cached, and the finished pages of its checkpoint are not parsed again.
+
+        :param state: The state of the parsing, filled with the document and its parsed pages, and with the
+            source, the key, the cached Document, the checkpoint and the finished pages of the document when
+            the known results are looked up.
+        :param path: The PDF file to parse.
+        :param pages: The pages to parse.
+        """
+        # Hash the PDF through a source of its own, closed with the document
+        finished_pages = {}
+        if state.get('use_results') and self._fingerprint is not None:
+            if not isinstance(path, PDFSource):
+                path = state['source'] = PDFSource(path)
+            pages, state['document_key'], state['cached_document'], state['checkpoint'], finished_pages = \
+                self._find_results(path, pages)
+            state['finished_pages'] = finished_pages
+            if state['cached_document'] is not None:
+                return
+
+        state['document'] = self._open_document(path, pages, threaded=True, unrendered_pages=finished_pages)
+        state['parsed_pages'] = self._parse_pages(state['document'], finished_pages)
+
+    @staticmethod
+    def _parse_next_page(state: dict) -> Union[Tuple[int, List, List[EquationElement]], None]:
+        """
+        Parse the next page of a document, in the thread of the document.
+
+        :param state: The state of the parsing.
+        :return: The page number, the extracted elements and the extracted equations of the page, or None at
+            the end.
+        """
+        # A cached document is not parsed
+        if 'parsed_pages' not in state:
+            return None
+        parsed_page = next(state['parsed_pages'], None)
+        if parsed_page is None:
+            return None
+        page, elements, equations = parsed_page
+
+        # Persist the page before moving on
+        checkpoint = state.get('checkpoint')
+        if checkpoint is not None and page.page_number not in state['finished_pages']:
+            checkpoint.save(page.page_number, elements, equations)
+
+        # Release the page image and pdfplumber objects as soon as the page is parsed
+        page.release()
+        return page.page_number, elements, equations
+
+    @staticmethod
+    def _close_parsing(state: dict) -> None:
+        """
+        Stop the parsing of a document and close it, in the thread of the document.
+
+        :param state: The state of the parsing.
+        """
+        if 'parsed_pages' in state:
+            state['parsed_pages'].close()
+        if 'document' in state:
+            state['document'].close()
+        if 'source' in state:
+            state['source'].close()
+
+    def _open_document(self, path: Union[PDFInput, PDFSource], pages: PageSelection, threaded: bool = False,
+                       unrendered_pages: Iterable[int] = ()) -> PDFDocument:
+        """
+        Open a PDF file with the settings of the parser.
+
+        Sequentially, the resident window holds at least a batch, so that no page is released before it is
+        parsed. Pipelined, pages are only released once parsed, since several of them are in flight.
+
+        :param path: The PDF file.
+        :param pages: The pages to parse.
+        :param threaded: Whether the pages are used from other threads than the one opening the document.
+            Defaults to False.
+        :param unrendered_pages: The pages not to render, whose results are already known (the finished pages
+            of a checkpoint). Defaults to () (every page).
+        :return: The opened document.
+        """
+        return PDFDocument(path, lazy=self.streaming, pages=pages,
+                           window_size=None if self.pipelined else max(self.page_window, self.batch_size),
+                           render_workers=self.render_workers, renderer=self.renderer,
+                           resolution=self.resolution, region_resolution=self.region_resolution,
+                           render_cache=self.render_cache, threaded=threaded or self.pipelined,
+                           unrendered_pages=unrendered_pages)
+
+    def _parse_pages(self, pdfdoc: PDFDocument, finished_pages: Union[dict, None] = None) -> Iterator[ParsedPage]:
+        """
+        Run the pages of a document through the parsing stages, sequentially or as a pipeline.
+
+        :param pdfdoc: The opened document.
+        :param finished_pages: The elements and equations of the pages already parsed, by page number. These
+            pages are neither rendered nor analyzed. Defaults to None.
+        :return: An iterator over the parsed pages, in order.
+        """
+        # The finished pages and the pages found in the result cache, with their key and their results,
+        # skip the other stages
+        cached_pages = {page_number: (None, result) for page_number, result in (finished_pages or {}).items()}
+
+        # The images of a document are numbered from 0, with an extractor of its own
+        render_stage = functools.partial(self._render_stage, cached_pages=cached_pages)
+        detect_stage = functools.partial(self._detect_stage, cached_pages=cached_pages)
+        extract_stage = functools.partial(self._extract_stage, image_extractor=ImageExtractor(),
+                                          image_numbers=itertools.count(), cached_pages=cached_pages)
+        equation_stage = functools.partial(self._equation_stage, cached_pages=cached_pages)
+        stages = [render_stage, detect_stage, extract_stage, equation_stage]
+        if self.pipelined:
+            return Pipeline(stages, queue_size=self.queue_size).run(self._batches(pdfdoc))
+        return equation_stage(extract_stage(detect_stage(render_stage(self._batches(pdfdoc)))))
+
+    def extract_many(self, paths: Iterable[PDFInput], workers: int = 1, pages: PageSelection = None,
+                     max_pending: Union[int, None] = None) -> Iterator[ParseResult]:
+        """
+        Parse a corpus of PDF files, yielding the result of each document as soon as it is parsed.
+
+        With several workers, each worker process builds its own parser (and loads every model) once, then
+        parses documents one after the other; the documents are handed out to whichever worker is free.
+        An error while parsing a document only fails that document. If a worker process dies (e.g. a crash
+        of a native library on a corrupt PDF), the documents it may have been parsing are parsed again one
+        at a time, so that only the document that kills a worker is reported as failed. The suppression counts
+        of the workers are added to the overlap suppressor of this parser as their documents finish.
+
+        :param paths: The PDF files to parse, as accepted by extract. The iterable is consumed lazily.
+        :param workers: The number of worker processes. With 1, the documents are parsed in the current
+            process, by this parser. Defaults to 1.
+        :param pages: The pages to parse in every document, see extract. Defaults to None (every page).
+        :param max_pending: The maximum number of documents handed out to the workers and not finished yet.
+            Defaults to None (twice the number of workers).
+        :return: An iterator over the ParseResult of each document, in the order they finish.
+        """
+        if not isinstance(workers, int) or workers < 1:
+            raise ValueError("workers must be an integer greater than or equal to 1")
+        if max_pending is not None and (not isinstance(max_pending, int) or max_pending < workers):
+            raise ValueError("max_pending must be an integer greater than or equal to workers or None")
+
+        # Parse in the current process, isolating the errors of each document
+        if workers == 1:
+            for index, path in enumerate(paths):
+                try:
+                    document = self.extract(path, pages)
+                except Exception as error:
+                    yield ParseResult(index, path, error=error)
+                else:
+                    yield ParseResult(index, path, document=document)
+            return
+
+        max_pending = max_pending or 2 * workers
+        inputs = enumerate(paths)
+        pending = {}
+        suspects = deque()
+        executor = self._start_workers(workers)
+        try:
+            while True:
+                # Hand out documents, but only one at a time while documents lost in a crash are parsed again
+                if suspects:
+                    if not pending:
+                        index, path = suspects.popleft()
+                        pending[self._submit(executor, path, pages)] = (index, path)
+                else:
+                    for index, path in itertools.islice(inputs, max_pending - len(pending)):
+                        pending[self._submit(executor, path, pages)] = (index, path)
+                if not pending:
+                    break
+
+                done, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                crashed = []
+                for future in done:
+                    index, path = pending.pop(future)
+                    error = future.exception()
+                    if isinstance(error, BrokenProcessPool):
+                        crashed.append((index, path, error))
+                    elif error is not None:
+                        yield ParseResult(index, path, error=error)
+                    else:
+                        yield self._worker_result(index, path, future)
+                if not crashed:
+                    continue
+
+                # A worker died: wait for the pool to settle, keep what finished and restart the workers
+                executor.shutdown(wait=True, cancel_futures=True)
+                for future, (index, path) in pending.items():
+                    error = future.exception() if not future.cancelled() else BrokenProcessPool("cancelled")
+                    if isinstance(error, BrokenProcessPool):
+                        crashed.append((index, path, error))
+                    elif error is not None:
+                        yield ParseResult(index, path, error=error)
+                    else:
+                        yield self._worker_result(index, path, future)
+                pending.clear()
+
+                # Alone in flight, the document is the one that killed the worker. Otherwise, parse each again
+                if len(crashed) == 1:
+                    index, path, error = crashed[0]
+                    yield ParseResult(index, path, error=error)
+                else:
+                    suspects.extend((index, path) for index, path, _ in sorted(crashed, key=lambda item: item[0]))
+                executor = self._start_workers(workers)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _start_workers(self, workers: int) -> concurrent.futures.ProcessPoolExecutor:
+        """
+        Start the worker processes of extract_many, each one building a parser with the settings of this one.
+
+        The processes are spawned rather than forked, which is required by CUDA. The workers share the thread
+        budget of the inference profile (InferenceProfile.auto() without a profile, since the worker processes
+        belong to the parser), so that together they do not oversubscribe the CPUs.
+
+        :param workers: The number of worker processes.
+        :return: The pool of worker processes.
+        """
+        profile = self.profile if self._config['profile'] is not None else InferenceProfile.auto()
+        config = dict(self._config, profile=profile.split(workers))
+        return concurrent.futures.ProcessPoolExecutor(max_workers=workers,
+                                                      mp_context=multiprocessing.get_context('spawn'),
+                                                      initializer=_initialize_parse_worker,
+                                                      initargs=(config,))
+
+    @staticmethod
+    def _submit(executor: concurrent.futures.ProcessPoolExecutor, path: PDFInput,
+                pages: PageSelection) -> concurrent.futures.Future:
+        """
+        Hand a document out to the worker processes.
+
+        :param executor: The pool of worker processes.
+        :param path: The PDF file. Inputs other than paths are sent as a copy of their bytes.
+        :param pages: The pages to parse.
+        :return: The future of the parsed Document.
+        """
+        if isinstance(path, (str, os.PathLike, bytes, PDFSource)):
+            return executor.submit(_parse_in_worker, path, pages)
+
+        # The submitted arguments are pickled later by the pool, so copy the bytes and close the source now
+        source = PDFSource(path)
+        try:
+            data = source.buffer.tobytes()
+        finally:
+            source.close()
+        return executor.submit(_parse_in_worker, data, pages)
+
+    def _worker_result(self, index: int, path: PDFInput, future: concurrent.futures.Future) -> ParseResult:
+        """
+        Get the result of a document parsed by a worker process, adding its suppression counts to this parser.
+
+        :param index: The position of the document in the corpus.
+        :param path: The document as it was given.
+        :param future: The finished future of the document.
+        :return: The ParseResult of the document.
+        """
+        document, suppressor = future.result()
+        if suppressor is not None and self.overlap_suppressor is not None:
+            self.overlap_suppressor.add_counts(suppressor)
+        return ParseResult(index, path, document=document)
+
+    def _batches(self, pages: Iterable[PDFPage]) -> Iterator[List[PDFPage]]:
+        """
+        Group consecutive pages into batches of at most batch_size pages.
+
+        :param pages: The pages to group, typically a PDFDocument being iterated.
+        :return: An iterator over the batches of pages, in order.
+        """
+        # Iterate only once: iterating a PDFDocument again restarts it from its first page
+        batch = []
+        for page in pages:
+            batch.append(page)
+            if len(batch) == self.batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def _render_stage(self, batches: Iterator[List[PDFPage]], cached_pages: dict) -> Iterator[List[PDFPage]]:
+        """
+        Rasterize the pages of each batch, and look their results up in the result cache.
+
+        :param batches: The batches of pages.
+        :param cached_pages: Filled with the key of each page in the result cache and its cached results
+            (None if the page is not cached), by page number. The pages it already holds (the finished
+            pages of a checkpoint) are not rendered.
+        :return: An iterator over the same batches, with their page images rendered.
+        """
+        for batch in batches:
+            for page in batch:
+                if page.page_number in cached_pages:
+                    continue
+                page.get_image()
+                # Hashing reads the pdfplumber characters into the character index of the page, which the
+                # extract stage then reuses: pdfplumber is not thread-safe, and the stages run in parallel
+                if self.result_cache is not None:
+                    key = ResultCache.key(self._fingerprint, page.content_hash())
+                    cached_pages[page.page_number] = (key, self.result_cache.get_page(key))
+            yield batch
+
+    @staticmethod
+    def _cached_result(cached_pages: dict, page: PDFPage) -> Union[Tuple[List, List], None]:
+        """
+        Get the results of a page found in the result cache.
+
+        :param cached_pages: The keys and cached results of the pages, see _render_stage.
+        :param page: The page.
+        :return: The cached elements and equations of the page, or None if the page has to be parsed.
+        """
+        return cached_pages.get(page.page_number, (None, None))[1]
+
+    def _detect_stage(self, batches: Iterator[List[PDFPage]], cached_pages: dict) -> Iterator[ParsedPage]:
+        """
+        Detect the elements and equations of each batch of pages, and mark the elements containing an equation.
+
+        :param batches: The batches of pages, with their images rendered.
+        :param cached_pages: The keys and cached results of the pages, see _render_stage.
+        :return: An iterator over the pages with their detected (still empty) elements and equations, in order.
+            The pages found in the result cache come without elements.
+        """
+        for batch in batches:
+            # Detect the elements of the pages not cached at once and their equations page by page, skipping
+            # the disabled detectors
+            detected = [page for page in batch if self._cached_result(cached_pages, page) is None]
+            images = [page.get_image() for page in detected]
+            batch_elements = self.layout_detector(images) if images and self._runs_layout() else [[] for _ in detected]
+            batch_equations = [self.equation_finder(image) if 'equation' in self.elements else [] for image in images]
+            del images
+            detections = {page.page_number: (elements, equations)
+                          for page, elements, equations in zip(detected, batch_elements, batch_equations)}
+
+            for page in batch:
+                if page.page_number not in detections:
+                    yield page, [], []
+                    continue
+                elements, equations = detections[page.page_number]
+                logging.info(f'Detected {len(elements)} elements and {len(equations)} equations')
+                elements = self._select_elements(elements)
+
+                # Drop the duplicate and nested elements before they are extracted
+                if self.overlap_suppressor is not None:
+                    detected_count = len(elements)
+                    elements = self.overlap_suppressor(elements)
+                    logging.info(f'Suppressed {detected_count - len(elements)} overlapping elements')
+
+                self._assign_equations(elements, equations)
+
+                yield page, elements, equations
+
+    @staticmethod
+    def _assign_equations(elements: List, equations: List[EquationElement]) -> None:
+        """
+        Add each equation inside text to every element containing it (see Element.is_in), computing the
+        intersections of all the equations with all the elements of the page at once.
+
+        :param elements: The detected elements of a page.
+        :param equations: The detected equations of the page.
+        """
+        inline_equations = [equation for equation in equations if equation.is_inside_text]
+        inside = geometry.is_in(inline_equations, elements)
+
+        # Walk the containing pairs equation by equation, so each element gets its equations in detection order
+        for equation_index, element_index in zip(*np.nonzero(inside)):
+            elements[element_index].add_equation_inside(inline_equations[equation_index])
+
+    def _select_elements(self, elements: List) -> List:
+        """
+        Keep the detected elements of the enabled types, turning the tables into images or dropping them
+        when tables are disabled, see table_fallback.
+
+        :param elements: The detected elements of a page.
+        :return: The elements to extract, in the same order.
+        """
+        selected = []
+        for element in elements:
+            if isinstance(element, TableElement) and 'table' not in self.elements:
+                if self.table_fallback == 'skip':
+                    continue
+                element = ImageElement(element.x_min, element.y_min, element.x_max, element.y_max,
+                                       element.pipeline_step, element.page_number)
+            elif _ELEMENT_TYPES.get(type(element)) not in self.elements:
+                continue
+            selected.append(element)
+        return selected
+
+    def _extract_stage(self, parsed_pages: Iterator[ParsedPage], image_extractor: ImageExtractor,
+                       image_numbers: Iterator[int], cached_pages: dict) -> Iterator[ParsedPage]:
+        """
+        Extract the content of the text, title, table and image elements of each page.
+
+        :param parsed_pages: The pages with their detected elements and equations.
+        :param image_extractor: The extractor of the images of the document, keeping their keys unique.
+        :param image_numbers: The numbers given to the images of the document, in order.
+        :param cached_pages: The keys and cached results of the pages, see _render_stage.
+        :return: An iterator over the pages with their extracted elements. The pages found in the result
+            cache come with their cached elements and equations.
+        """
+        for page, elements, equations in parsed_pages:
+            # Take the cached results, numbering their images and pages as if they were just extracted
+            cached_result = self._cached_result(cached_pages, page)
+            if cached_result is not None:
+                elements, equations = cached_result
+                for element in [*elements, *equations]:
+                    element.page_number = page.page_number
+                    if isinstance(element, ImageElement):
+                        element.unique_key = str(next(image_numbers))
+                yield page, elements, equations
+                continue
+
+            extracted_elements = []
             for element in elements:
                 if isinstance(element, TextElement):
                     element = self.text_extractor.extract(page, element)
@@ -61,14 +916,57 @@ class Parser:
                 elif isinstance(element, TitleElement):
                     element = self.title_extractor.extract(page, element)
                 elif isinstance(element, ImageElement):
-                    element = self.image_extractor.extract(page, element, unique_key=str(image_number))
-                    image_number += 1
+                    element = image_extractor.extract(page, element, unique_key=str(next(image_numbers)))
+                extracted_elements.append(element)
+
+            yield page, extracted_elements, equations
 
-                document.add_element(page.page_number, element)
-            for equation in equations:
-                equation = self.equation_extractor.extract(page, equation)
-                document.add_element(page.page_number, equation)
-            elements_h[page.page_number] = [*elements,*equations]
+    def _equation_stage(self, parsed_pages: Iterator[ParsedPage], cached_pages: dict) -> Iterator[ParsedPage]:
+        """
+        Convert the equations of each page to LaTeX, and store the results of the pages in the result cache.
 
-        return document #elements_h
-        
+        :param parsed_pages: The pages with their extracted elements and detected equations.
+        :param cached_pages: The keys and cached results of the pages, see _render_stage.
+        :return: An iterator over the fully parsed pages.
+        """
+        for page, elements, equations in parsed_pages:
+            key, cached_result = cached_pages.get(page.page_number, (None, None))
+            if cached_result is None:
+                equations = [self.equation_extractor.extract(page, equation) for equation in equations]
+                if key is not None:
+                    self.result_cache.put_page(key, elements, equations)
+            yield page, elements, equations
+
+
+# Parser built by each worker process of Parser.extract_many
+_worker_parser = None
+
+def _initialize_parse_worker(config: dict) -> None:
+    """
+    Build the parser of a worker process, shared by all the documents of the worker: each model is loaded on
+    its first use and kept for the next documents.
+
+    :param config: The settings of the parser, see Parser._config.
+    """
+    global _worker_parser
+    _worker_parser = Parser(**config)
+
+def _parse_in_worker(path: Union[PDFInput, PDFSource],
+                     pages: PageSelection) -> Tuple[Document, Union[OverlapSuppressor, None]]:
+    """
+    Parse a document with the parser of the current worker process.
+
+    :param path: The PDF file.
+    :param pages: The pages to parse.
+    :return: The Document with the extracted elements, and the overlap suppressor holding the counts of this
+        document only (None without suppressor), to add to the counts of the parser of extract_many.
+    """
+    suppressor = _worker_parser.overlap_suppressor
+    if suppressor is not None:
+        suppressor.reset()
+    try:
+        return _worker_parser.extract(path, pages), suppressor
+    finally:
+        # A source sent by the parent process is a copy owned by this process, not closed by the document
+        if isinstance(path, PDFSource):
+            path.close()
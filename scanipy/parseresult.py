@@ -0,0 +1,66 @@
+from typing import Any, Union
+from .document import Document
+
+
+class ParseResult:
+    """
+    The outcome of parsing one document of a corpus: its Document, or the error that stopped its parsing.
+
+    Attributes:
+        index (int): The position of the document in the corpus given to Parser.extract_many.
+        source (Any): The document as it was given (a path, bytes...).
+        document (Union[Document, None]): The parsed document, or None if parsing failed.
+        error (Union[BaseException, None]): The error raised while parsing the document, or None if it succeeded.
+    """
+
+    def __init__(self, index: int, source: Any, document: Union[Document, None] = None,
+                 error: Union[BaseException, None] = None):
+        """
+        Initialize the result of a document.
+
+        Args:
+            index (int): The position of the document in the corpus.
+            source (Any): The document as it was given.
+            document (Union[Document, None], optional): The parsed document. Defaults to None.
+            error (Union[BaseException, None], optional): The error raised while parsing the document. Defaults to None.
+
+        Raises:
+            ValueError: If neither or both of document and error are given.
+        """
+        if (document is None) == (error is None):
+            raise ValueError("A result needs either a document or an error")
+
+        self.index = index
+        self.source = source
+        self.document = document
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        """
+        Whether the document was parsed successfully.
+
+        Returns:
+            bool: True if the result holds a document, False if it holds an error.
+        """
+        return self.error is None
+
+    def __repr__(self) -> str:
+        """
+        Returns the official string representation of the ParseResult object.
+
+        Returns:
+            str: A string representation of the object.
+        """
+        source = self.source if isinstance(self.source, str) else type(self.source).__name__
+        outcome = 'ok' if self.ok else f'error={self.error!r}'
+        return f"ParseResult(index={self.index}, source={source!r}, {outcome})"
+
+    def __str__(self) -> str:
+        """
+        Returns a string representation of the ParseResult object, which is the same as its official representation.
+
+        Returns:
+            str: A string representation of the object.
+        """
+        return self.__repr__()
@@ -1,7 +1,21 @@
+import hashlib
+import itertools
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from PIL import Image, ImageDraw
 import pdfplumber
+import pdfplumber.pdf
 import pdfplumber.page
-from typing import Tuple, Iterator, List
+from typing import Tuple, Iterator, List, Union, Iterable
+from .renderers import RENDERERS, Renderer, PdfPlumberRenderer, CachedRenderer, LockedRenderer
+from .renderers.renderer import Region
+from .cache import RenderCache
+from .charindex import CharIndex
+from .pdfsource import PDFInput, PDFSource
+
+# A page selection: a page number, a range, an iterable of page numbers/ranges or a string like "1,3,5-9,20-40:2"
+PageSelection = Union[int, range, str, Iterable[Union[int, range]], None]
 
 def draw_rectangle(image: Image.Image, coordinates: Tuple[float, float, float, float]) -> Image.Image:
     """
@@ -41,20 +55,210 @@ def draw_rectangle(image: Image.Image, coordinates: Tuple[float, float, float, f
 
     return modified_image
 
+def parse_page_selection(selection: PageSelection, page_count: int) -> List[int]:
+    """
+    Convert a page selection into a sorted list of unique page numbers.
+
+    Page numbers start at 1, as in PDFPage.page_number. The selection can be:
+        - None: every page of the document.
+        - int: a single page.
+        - range: the page numbers produced by the range (e.g. range(40, 46) or range(1, 100, 2)).
+        - str: comma-separated items like "7", "40-45", "10-" (open end) or "1-99:2" (step).
+        - An iterable of ints and ranges.
+
+    Args:
+        selection (PageSelection): The pages to select.
+        page_count (int): The number of pages in the document.
+
+    Returns:
+        List[int]: The selected page numbers, sorted in ascending order.
+
+    Raises:
+        TypeError: If the selection type is not supported.
+        ValueError: If the selection is malformed or refers to pages outside the document.
+    """
+    if selection is None:
+        return list(range(1, page_count + 1))
+
+    # Collect the page numbers from each item of the selection
+    numbers = []
+    if isinstance(selection, str):
+        for item in selection.split(','):
+            item = item.strip()
+            if not item:
+                continue
+            step = 1
+            if ':' in item:
+                item, step_text = item.split(':', 1)
+                if not step_text.strip().isdigit() or int(step_text) < 1:
+                    raise ValueError(f"Invalid step in page selection: '{step_text}'")
+                step = int(step_text)
+            if '-' in item:
+                start_text, end_text = (part.strip() for part in item.split('-', 1))
+                start = int(start_text) if start_text else 1
+                end = int(end_text) if end_text else page_count
+            else:
+                if not item.strip().isdigit():
+                    raise ValueError(f"Invalid item in page selection: '{item}'")
+                start = end = int(item)
+            if start > end:
+                raise ValueError(f"Invalid range in page selection: {start}-{end}")
+            numbers.extend(range(start, end + 1, step))
+    elif isinstance(selection, bool):
+        raise TypeError("selection must be an int, a range, a string or an iterable of ints and ranges")
+    elif isinstance(selection, int):
+        numbers.append(selection)
+    elif isinstance(selection, range):
+        numbers.extend(selection)
+    else:
+        try:
+            items = list(selection)
+        except TypeError:
+            raise TypeError("selection must be an int, a range, a string or an iterable of ints and ranges")
+        for item in items:
+            if isinstance(item, range):
+                numbers.extend(item)
+            elif isinstance(item, int) and not isinstance(item, bool):
+                numbers.append(item)
+            else:
+                raise TypeError("selection items must be ints or ranges")
+
+    # Verify that every selected page exists
+    for number in numbers:
+        if not 1 <= number <= page_count:
+            raise ValueError(f"Page {number} is out of range: the document has {page_count} pages")
+
+    return sorted(set(numbers))
+
+def select_pages(source: PDFSource, selection: PageSelection) -> List[int]:
+    """
+    Get the page numbers a page selection refers to in a PDF file, see parse_page_selection.
+
+    Equivalent selections, e.g. None, "1-" and range(1, page_count + 1), give the same page numbers.
+
+    Args:
+        source (PDFSource): The PDF file.
+        selection (PageSelection): The pages to select.
+
+    Returns:
+        List[int]: The selected page numbers, sorted in ascending order.
+    """
+    with pdfplumber.open(source.open()) as pdf_file:
+        return parse_page_selection(selection, len(pdf_file.pages))
+
+def open_renderer(renderer_name: str, source: PDFSource, render_cache: Union[RenderCache, None] = None,
+                  pdf_hash: Union[str, None] = None, pdf_file: Union[pdfplumber.pdf.PDF, None] = None) -> Renderer:
+    """
+    Open a rasterization backend for a PDF file.
+
+    Args:
+        renderer_name (str): The name of the rasterization backend, see scanipy.renderers.RENDERERS.
+        source (PDFSource): The PDF file.
+        render_cache (Union[RenderCache, None], optional): A cache of page images to read from and write to. Defaults to None.
+        pdf_hash (Union[str, None], optional): The hash of the PDF content, required with a render cache. Defaults to None.
+        pdf_file (Union[pdfplumber.pdf.PDF, None], optional): An opened pdfplumber PDF to share with the
+            pdfplumber backend. Defaults to None.
+
+    Returns:
+        Renderer: The renderer.
+    """
+    if renderer_name == 'pdfplumber':
+        renderer = PdfPlumberRenderer(source, pdf_file=pdf_file)
+    else:
+        renderer = RENDERERS[renderer_name](source)
+    if render_cache is not None:
+        renderer = CachedRenderer(renderer, render_cache, pdf_hash)
+    return renderer
+
+# Renderer opened by each rasterization worker process
+_worker_renderer = None
+
+def _initialize_render_worker(renderer_name: str, source: PDFSource, render_cache: Union[RenderCache, None],
+                              pdf_hash: Union[str, None]) -> None:
+    """
+    Open the PDF file once in a rasterization worker process.
+
+    Args:
+        renderer_name (str): The name of the rasterization backend, see scanipy.renderers.RENDERERS.
+        source (PDFSource): The PDF file. An in-memory PDF is received as a copy of its bytes.
+        render_cache (Union[RenderCache, None]): A cache of page images shared with the other processes.
+        pdf_hash (Union[str, None]): The hash of the PDF content, required with a render cache.
+    """
+    global _worker_renderer
+    _worker_renderer = open_renderer(renderer_name, source, render_cache, pdf_hash)
+
+def _render_page_in_worker(page_number: int, resolution: int) -> Image.Image:
+    """
+    Rasterize a page of the PDF opened by the current worker process.
+
+    Args:
+        page_number (int): The number of the page to render, starting at 1.
+        resolution (int): The resolution (DPI) of the image.
+
+    Returns:
+        PIL.Image.Image: The rendered page.
+    """
+    return _worker_renderer.render(page_number, resolution)
+
 class PDFPage:
-    def __init__(self, image: Image.Image, pdf_page: pdfplumber.page.Page, page_number: int) -> None:
-        self.image: Image.Image = image
+    def __init__(self, image: Union[Image.Image, None], pdf_page: pdfplumber.page.Page, page_number: int,
+                 resolution: int = 200, renderer: Union[Renderer, None] = None,
+                 region_resolution: Union[int, None] = None) -> None:
+        self.image: Union[Image.Image, None] = image
         self.pdf_page: pdfplumber.page.Page = pdf_page
         self.page_number: int = page_number
+        self.resolution: int = resolution
+        self.renderer: Union[Renderer, None] = renderer
+        self.region_resolution: Union[int, None] = region_resolution
+        self._char_index: Union[CharIndex, None] = None
 
     def get_image(self) -> Image.Image:
         """Get an image of the page.
 
+        The page is rasterized on demand if it was not rendered yet or if it was released.
+
         Returns:
             PIL.Image.Image: A PIL.Image.Image object.
         """
+        if self.image is None:
+            if self.renderer is None:
+                self.image = PdfPlumberRenderer.render_page(self.pdf_page, self.resolution)
+            else:
+                self.image = self.renderer.render(self.page_number, self.resolution)
         return self.image
 
+    def get_region_image(self, region: Region, margin: int = 0) -> Image.Image:
+        """Get an image of a region of the page, for the extractors.
+
+        Without a region resolution (or with the same resolution as the page image), the region is cropped
+        from the page image. Otherwise, only the region is rendered again from the PDF at the region resolution.
+
+        Args:
+            region (Region): The normalized coordinates (x_min, y_min, x_max, y_max) of the region.
+            margin (int, optional): A margin added around the region, in pixels of the returned image. Defaults to 0.
+
+        Returns:
+            PIL.Image.Image: The image of the region.
+        """
+        resolution = self.region_resolution or self.resolution
+
+        # Expand the region by the margin, converted to normalized coordinates
+        if margin:
+            width, height = Renderer.page_image_size(self.pdf_page.width, self.pdf_page.height, resolution)
+            x_min, y_min, x_max, y_max = region
+            region = (max(0.0, x_min - margin / width), max(0.0, y_min - margin / height),
+                      min(1.0, x_max + margin / width), min(1.0, y_max + margin / height))
+
+        # Crop the page image when it already has the requested resolution
+        if resolution == self.resolution:
+            page_image = self.get_image()
+            return page_image.crop(Renderer.region_pixel_box(region, page_image.size))
+
+        # Render the region straight from the PDF
+        if self.renderer is None:
+            return PdfPlumberRenderer.render_page(self.pdf_page, resolution, region)
+        return self.renderer.render(self.page_number, resolution, region)
+
     def get_pdf(self) -> pdfplumber.page.Page:
         """Get the pdfplumber Page object representing a page of the PDF.
 
@@ -62,6 +266,51 @@ class PDFPage:
             pdfplumber.page.Page: A pdfplumber Page object.
         """
         return self.pdf_page
+
+    def get_char_index(self) -> CharIndex:
+        """Get the spatial index over the characters of the page, built on first use.
+
+        Returns:
+            CharIndex: The index used to extract the text of the regions of the page.
+        """
+        if self._char_index is None:
+            self._char_index = CharIndex(self.pdf_page.chars)
+        return self._char_index
+
+    def content_hash(self) -> str:
+        """Compute the hash identifying the content of the page: its image, its characters and the resolutions
+        at which it is rendered.
+
+        Two pages with the same hash are parsed into the same elements, even in different PDF files. The
+        characters are read through the character index, which is kept for the extractors, so a parser that
+        hashes the pages reads the pdfplumber characters only once, in the stage that hashes them.
+
+        Returns:
+            str: The hexadecimal SHA-256 digest of the page content.
+        """
+        image = self.get_image()
+        digest = hashlib.sha256(f'{image.mode}:{image.size}:{self.pdf_page.width}:{self.pdf_page.height}:'
+                                f'{self.resolution}:{self.region_resolution}'.encode())
+        digest.update(image.tobytes())
+        for char in self.get_char_index().chars:
+            digest.update(f"{char['text']}:{char['fontname']}:{char['size']}:{char['x0']}:{char['top']}:"
+                          f"{char['x1']}:{char['bottom']}\n".encode())
+        return digest.hexdigest()
+
+    def release(self) -> None:
+        """
+        Release the page image, the character index and the objects cached by pdfplumber for this page.
+
+        The page stays usable: the image is rendered again and the PDF objects are parsed
+        again if they are requested after a release.
+        """
+        self.image = None
+        self._char_index = None
+        self.pdf_page.flush_cache()
+        # The text maps memoized by pdfplumber hold every character of the page. Only clear the memo of this page,
+        # set on the page itself since pdfplumber 0.10, never a memo shared by the pages of every document
+        if 'get_textmap' in vars(self.pdf_page):
+            self.pdf_page.get_textmap.cache_clear()
     
     def draw_rectangle(self, coordinates: Tuple[float, float, float, float]) -> Image.Image:
         """
@@ -74,7 +323,7 @@ class PDFPage:
         Returns:
             PIL.Image.Image: A modified PIL.Image.Image object with the rectangle drawn.
         """
-        modified_image = draw_rectangle(self.image, coordinates)
+        modified_image = draw_rectangle(self.get_image(), coordinates)
         return modified_image
 
 
@@ -82,28 +331,184 @@ class PDFDocument:
     """Represents a PDF document.
 
     Args:
-        filepath (str): The path to the PDF file.
+        filepath (PDFInput): The PDF file: a path, bytes, a bytearray, a memoryview, an mmap or a seekable
+            binary file object. In-memory PDFs are parsed and rendered from the caller's buffer without
+            being copied, except once per render worker process. A PDFSource may be given too: it is not
+            closed with the document.
+        resolution (int): The resolution (DPI) used to rasterize the pages. Defaults to 200.
+        lazy (bool): If True, pages are rasterized on demand while iterating instead of all up front. Defaults to False.
+        window_size (int): In lazy mode, the number of most recently visited pages kept resident in memory.
+            Older pages are released as the iterator advances. With None, pages are never released automatically
+            and the caller releases them once done with them. Defaults to 2.
+        pages (PageSelection): The pages to load, see parse_page_selection. Pages outside the selection
+            are never rasterized. Defaults to None (every page).
+        render_workers (int): The number of worker processes used to rasterize pages. Each worker opens the
+            PDF itself. With 1, pages are rendered in the current process. Defaults to 1.
+        max_pending_pages (Union[int, None]): The maximum number of pages rendered ahead by the workers and
+            not consumed yet. Defaults to None (twice the number of workers).
+        renderer (str): The rasterization backend, 'pdfplumber' or 'pymupdf'. Both produce images with the
+            same geometry. Defaults to 'pdfplumber'.
+        region_resolution (Union[int, None]): The resolution (DPI) at which the regions given to the extractors
+            are rendered again from the PDF, see PDFPage.get_region_image. This allows a cheap low resolution
+            for the page images seen by the detectors. Defaults to None (regions are cropped from the page image).
+        render_cache (Union[RenderCache, None]): A persistent cache of page images, shared by the render
+            workers. Pages found in it are not rasterized again. Defaults to None.
+        threaded (bool): If True, the pages may be used from several threads at once: the renderer gets its own
+            handle on the PDF file and its calls are serialized, since neither pdfium nor MuPDF is thread-safe.
+            Defaults to False.
+        unrendered_pages (Iterable[int]): The numbers of selected pages that are iterated but neither rendered up
+            front nor by the render workers, e.g. pages whose results are already known. They are still rendered
+            on demand by PDFPage.get_image. Defaults to () (every page).
+
+    The document holds a file handle (or a memory mapping) and, while iterating with several render workers,
+    a process pool. Call close() or use the document as a context manager to release them deterministically:
+
+        with PDFDocument("paper.pdf", lazy=True) as document:
+            for page in document:
+                ...
 
     Attributes:
+        source (PDFSource): The PDF file.
         pdf_file (pdfplumber.pdf.PDF): A pdfplumber PDF object representing the PDF file.
-        pages (List[PDFPage]): A list of PDFPage objects representing pages in the PDF.
+        renderer (Renderer): The backend used to rasterize the pages in the current process.
+        pages (List[PDFPage]): A list of PDFPage objects representing the selected pages in the PDF.
     """
-    def __init__(self, filepath: str):
-        self.pdf_file = pdfplumber.open(filepath)
-        self.pages = self._initialize_pages()
+    def __init__(self, filepath: Union[PDFInput, PDFSource], resolution: int = 200, lazy: bool = False, window_size: Union[int, None] = 2,
+                 pages: PageSelection = None, render_workers: int = 1, max_pending_pages: Union[int, None] = None,
+                 renderer: str = 'pdfplumber', region_resolution: Union[int, None] = None,
+                 render_cache: Union[RenderCache, None] = None, threaded: bool = False,
+                 unrendered_pages: Iterable[int] = ()):
+        # Verify the input variable types
+        if not isinstance(resolution, int) or resolution <= 0:
+            raise ValueError("resolution must be a positive integer")
+        if not isinstance(lazy, bool):
+            raise TypeError("lazy must be a boolean")
+        if window_size is not None and (not isinstance(window_size, int) or window_size < 1):
+            raise ValueError("window_size must be an integer greater than or equal to 1 or None")
+        if not isinstance(render_workers, int) or render_workers < 1:
+            raise ValueError("render_workers must be an integer greater than or equal to 1")
+        if max_pending_pages is not None and (not isinstance(max_pending_pages, int) or max_pending_pages < 1):
+            raise ValueError("max_pending_pages must be an integer greater than or equal to 1 or None")
+        if region_resolution is not None and (not isinstance(region_resolution, int) or region_resolution <= 0):
+            raise ValueError("region_resolution must be a positive integer or None")
+        if renderer not in RENDERERS:
+            raise ValueError(f"renderer must be one of {list(RENDERERS)}")
+        if render_cache is not None and not isinstance(render_cache, RenderCache):
+            raise TypeError("render_cache must be a RenderCache or None")
+        if not isinstance(threaded, bool):
+            raise TypeError("threaded must be a boolean")
+
+        # The document only closes the source it creates, not a PDFSource given by the caller
+        self.source = PDFSource.of(filepath)
+        self._owns_source = self.source is not filepath
+        self.filepath = self.source.path
+        self.renderer_name = renderer
+        self.render_cache = render_cache
+        self.resolution = resolution
+        self.region_resolution = region_resolution
+        self.lazy = lazy
+        self.window_size = window_size
+        self.threaded = threaded
+        self.render_workers = render_workers
+        self.max_pending_pages = max_pending_pages or 2 * render_workers
+        self.pdf_file = None
+        self.renderer = None
+        self.pages = []
+        self._rendered_images = None
+        self.closed = False
+
+        # Release whatever was opened if the document cannot be initialized, e.g. for an invalid page selection
+        try:
+            self.pdf_file = pdfplumber.open(self.source.open())
+            self.pdf_hash = self.source.hash() if render_cache is not None else None
+            # A threaded renderer does not share the pdfplumber file, whose stream is read by pdfminer in other threads
+            if threaded:
+                self.renderer = LockedRenderer(open_renderer(renderer, self.source, render_cache, self.pdf_hash))
+            else:
+                self.renderer = open_renderer(renderer, self.source, render_cache, self.pdf_hash, pdf_file=self.pdf_file)
+            self.page_numbers = parse_page_selection(pages, len(self.pdf_file.pages))
+            self.unrendered_pages = frozenset(unrendered_pages)
+            self.pages = self._initialize_pages()
+        except BaseException:
+            self.close()
+            raise
 
     def _initialize_pages(self) -> List[PDFPage]:
-        """Initialize and return a list of PDFPage objects for each page in the PDF.
+        """Initialize and return a list of PDFPage objects for each selected page in the PDF.
+
+        In lazy mode the pages are not rasterized here, only when they are iterated over.
 
         Returns:
             List[PDFPage]: A list of PDFPage objects.
         """
         pages = []
-        for page_number, pdf_page in enumerate(self.pdf_file.pages):
-            image = pdf_page.to_image(resolution=200).original.copy()
-            pages.append(PDFPage(image, pdf_page, page_number + 1))
+        for page_number in self.page_numbers:
+            pdf_page = self.pdf_file.pages[page_number - 1]
+            pages.append(PDFPage(None, pdf_page, page_number, self.resolution, self.renderer, self.region_resolution))
+
+        # Rasterize every page up front when not in lazy mode
+        if not self.lazy:
+            rendered_pages = self._pages_to_render(pages)
+            for page, image in zip(rendered_pages, self._render_images(rendered_pages)):
+                page.image = image
         return pages
 
+    def _pages_to_render(self, pages: List[PDFPage]) -> List[PDFPage]:
+        """Get the pages rendered up front or by the render workers, leaving out the unrendered pages.
+
+        Args:
+            pages (List[PDFPage]): The pages.
+
+        Returns:
+            List[PDFPage]: The pages to rasterize, in the same order.
+        """
+        return [page for page in pages if page.page_number not in self.unrendered_pages]
+
+    def _render_images(self, pages: List[PDFPage]) -> Iterator[Image.Image]:
+        """Rasterize the given pages and yield their images in order.
+
+        With several render workers, the pages are fanned out to a process pool and at most
+        max_pending_pages rendered images wait to be consumed at any time.
+
+        Args:
+            pages (List[PDFPage]): The pages to rasterize.
+
+        Returns:
+            Iterator[PIL.Image.Image]: An iterator over the page images, in the order of the pages.
+        """
+        if self.render_workers == 1:
+            for page in pages:
+                yield self.renderer.render(page.page_number, self.resolution)
+            return
+
+        # Spawn the workers rather than forking a process that may hold torch, pdfium and thread state
+        executor = ProcessPoolExecutor(max_workers=self.render_workers,
+                                       mp_context=multiprocessing.get_context('spawn'),
+                                       initializer=_initialize_render_worker,
+                                       initargs=(self.renderer_name, self.source, self.render_cache, self.pdf_hash))
+        pending = deque()
+        try:
+            # Submit the first pages, then one new page each time a rendered page is consumed
+            page_iterator = iter(pages)
+            for page in itertools.islice(page_iterator, self.max_pending_pages):
+                pending.append(executor.submit(_render_page_in_worker, page.page_number, self.resolution))
+            while pending:
+                image = pending.popleft().result()
+                next_page = next(page_iterator, None)
+                if next_page is not None:
+                    pending.append(executor.submit(_render_page_in_worker, next_page.page_number, self.resolution))
+                yield image
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def __len__(self) -> int:
+        """Get the number of selected pages in the PDF.
+
+        Returns:
+            int: The number of selected pages.
+        """
+        return len(self.pages)
+
     def __iter__(self) -> Iterator[PDFPage]:
         """Iterator method to iterate over pages in the PDF.
 
@@ -111,11 +516,25 @@ class PDFDocument:
             Iterator[PDFPage]: An iterator over PDFPage objects.
         """
         self.current_page_index = 0
+
+        # Stop the workers of a previous iteration before starting new ones
+        self._stop_rendering()
+        if self.lazy and self.render_workers > 1:
+            self._rendered_images = self._render_images(self._pages_to_render(self.pages))
         return self
 
+    def _stop_rendering(self) -> None:
+        """Stop rendering pages ahead: closing the generator shuts its process pool down."""
+        if self._rendered_images is not None:
+            self._rendered_images.close()
+            self._rendered_images = None
+
     def __next__(self) -> PDFPage:
         """Get the next page in the PDF.
 
+        In lazy mode, the page that falls out of the resident window is released and, with several
+        render workers, the image rendered ahead for the next page is attached to it.
+
         Returns:
             PDFPage: The next page in the PDF.
 
@@ -123,8 +542,56 @@ class PDFDocument:
             StopIteration: If there are no more pages to iterate.
         """
         if self.current_page_index < len(self.pages):
+            if self.lazy and self.window_size is not None and self.current_page_index >= self.window_size:
+                self.pages[self.current_page_index - self.window_size].release()
             current_page = self.pages[self.current_page_index]
+            if self._rendered_images is not None and current_page.page_number not in self.unrendered_pages:
+                current_page.image = next(self._rendered_images)
             self.current_page_index += 1
             return current_page
         else:
-            raise StopIteration
\ No newline at end of file
+            self._stop_rendering()
+            raise StopIteration
+
+    def close(self) -> None:
+        """Release every resource held by the document.
+
+        The render workers are shut down, the page images and the objects cached by pdfplumber are released,
+        and the PDF file is closed. A PDFSource given by the caller is left open, for the caller to close.
+        Closing a document twice has no effect.
+        """
+        if self.closed:
+            return
+        self.closed = True
+
+        # Stop rendering ahead
+        self._stop_rendering()
+
+        # Release the pages, then close the backends and the file they read, as far as they were opened
+        for page in self.pages:
+            page.release()
+        if self.renderer is not None:
+            self.renderer.close()
+        if self.pdf_file is not None:
+            self.pdf_file.close()
+        self.pages = []
+        if self._owns_source:
+            self.source.close()
+
+    def __enter__(self) -> 'PDFDocument':
+        """Use the document as a context manager, closing it on exit.
+
+        Returns:
+            PDFDocument: The document itself.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Close the document when leaving the context.
+
+        Args:
+            exc_type: The type of the exception raised in the context, if any.
+            exc_value: The exception raised in the context, if any.
+            traceback: The traceback of the exception, if any.
+        """
+        self.close()
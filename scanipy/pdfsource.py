@@ -0,0 +1,249 @@
+import hashlib
+import io
+import mmap
+import os
+from typing import BinaryIO, Union
+from .cache import RenderCache
+
+# The inputs accepted as a PDF file: a path, an in-memory buffer or a seekable binary file object
+PDFInput = Union[str, os.PathLike, bytes, bytearray, memoryview, mmap.mmap, BinaryIO]
+
+
+class BufferReader(io.RawIOBase):
+    """
+    A seekable, read-only binary stream over a memory buffer.
+
+    Unlike io.BytesIO(data), which copies anything that is not a bytes object, the reader only copies
+    the bytes actually read, so pdfminer and pdfium can parse a PDF straight from the buffer.
+
+    Attributes:
+        buffer (memoryview): The bytes of the PDF file.
+    """
+
+    def __init__(self, buffer: memoryview):
+        """
+        Initialize the reader at the start of the buffer.
+
+        Args:
+            buffer (memoryview): The bytes of the PDF file.
+        """
+        super().__init__()
+        self.buffer = buffer
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, destination) -> int:
+        """
+        Copy the next bytes of the buffer into a pre-allocated, writable bytes-like object.
+
+        Args:
+            destination: The bytes-like object to fill.
+
+        Returns:
+            int: The number of bytes copied, 0 at the end of the buffer.
+        """
+        destination = memoryview(destination).cast('B')
+        count = max(0, min(len(destination), len(self.buffer) - self._position))
+        destination[:count] = self.buffer[self._position:self._position + count]
+        self._position += count
+        return count
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        """
+        Move to a new position in the buffer.
+
+        Args:
+            offset (int): The offset, relative to the position given by whence.
+            whence (int): io.SEEK_SET, io.SEEK_CUR or io.SEEK_END. Defaults to io.SEEK_SET.
+
+        Returns:
+            int: The new absolute position.
+
+        Raises:
+            ValueError: If whence is invalid or the new position is negative.
+        """
+        match whence:
+            case io.SEEK_SET:
+                position = offset
+            case io.SEEK_CUR:
+                position = self._position + offset
+            case io.SEEK_END:
+                position = len(self.buffer) + offset
+            case _:
+                raise ValueError(f"Invalid whence: {whence}")
+        if position < 0:
+            raise ValueError(f"Negative seek position: {position}")
+        self._position = position
+        return position
+
+    def tell(self) -> int:
+        return self._position
+
+
+class PDFSource:
+    """
+    A PDF file given as a path or held in memory, to open with every PDF backend without extra full copies.
+
+    In-memory inputs (bytes, bytearray, memoryview, mmap and io.BytesIO) are wrapped in a memoryview of
+    their own storage. Binary files backed by a file descriptor are memory-mapped. Other seekable file
+    objects are read once into memory.
+
+    Attributes:
+        path (Union[str, None]): The path to the PDF file, or None for an in-memory PDF.
+        buffer (Union[memoryview, None]): The bytes of the PDF file, or None for a path.
+    """
+
+    def __init__(self, source: PDFInput):
+        """
+        Initialize the source of a PDF file.
+
+        Args:
+            source (PDFInput): A path, bytes, a bytearray, a memoryview, an mmap or a seekable binary file object.
+
+        Raises:
+            TypeError: If the source is not one of the accepted types.
+            ValueError: If a memoryview is not contiguous or a file object is not seekable.
+        """
+        self.path = None
+        self.buffer = None
+        self._mmap = None
+
+        # Keep paths as they are, the backends open them efficiently
+        if isinstance(source, (str, os.PathLike)):
+            self.path = os.fspath(source)
+        # Share the storage of in-memory buffers
+        elif isinstance(source, (bytes, bytearray, memoryview, mmap.mmap)):
+            self.buffer = self._as_bytes_view(memoryview(source))
+        elif isinstance(source, io.BytesIO):
+            self.buffer = source.getbuffer()
+        # Memory-map files backed by a file descriptor, read the others into memory
+        elif hasattr(source, 'read') and hasattr(source, 'seek'):
+            if not source.seekable():
+                raise ValueError("file objects must be seekable")
+            try:
+                fileno = source.fileno()
+            except (AttributeError, OSError):
+                fileno = None
+            if fileno is not None:
+                self._mmap = mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+                self.buffer = memoryview(self._mmap)
+            else:
+                source.seek(0)
+                self.buffer = memoryview(source.read())
+        else:
+            raise TypeError("source must be a path, bytes, a bytearray, a memoryview, an mmap or a seekable binary file object")
+
+    @classmethod
+    def of(cls, source: Union[PDFInput, 'PDFSource']) -> 'PDFSource':
+        """
+        Get the source of a PDF file, reusing it if it is already a PDFSource.
+
+        Args:
+            source (Union[PDFInput, PDFSource]): The PDF file.
+
+        Returns:
+            PDFSource: The source of the PDF file.
+        """
+        return source if isinstance(source, PDFSource) else cls(source)
+
+    @staticmethod
+    def _as_bytes_view(view: memoryview) -> memoryview:
+        """
+        Get a flat view of unsigned bytes over a memoryview, without copying it.
+
+        Args:
+            view (memoryview): A memoryview of any format.
+
+        Returns:
+            memoryview: The same memory, as unsigned bytes.
+
+        Raises:
+            ValueError: If the memoryview is not contiguous.
+        """
+        if not view.contiguous:
+            raise ValueError("memoryview sources must be contiguous")
+        if view.format == 'B' and view.ndim == 1:
+            return view
+        return view.cast('B')
+
+    def open(self) -> Union[str, BufferReader]:
+        """
+        Get an input for pdfplumber.open: the path, or a new stream over the buffer.
+
+        Returns:
+            Union[str, BufferReader]: The path to the PDF file or a stream over its bytes.
+        """
+        return self.path if self.buffer is None else BufferReader(self.buffer)
+
+    def hash(self) -> str:
+        """
+        Compute the hash identifying the content of the PDF file, see RenderCache.hash_file.
+
+        Returns:
+            str: The hexadecimal SHA-256 digest of the PDF file.
+        """
+        if self.buffer is None:
+            return RenderCache.hash_file(self.path)
+        return hashlib.sha256(self.buffer).hexdigest()
+
+    def close(self) -> None:
+        """
+        Release the buffer and unmap the file mapped by the source.
+        """
+        if self.buffer is not None:
+            self.buffer.release()
+            self.buffer = None
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                # A backend still holds a view of the mapping, it is unmapped when the view is collected
+                pass
+            self._mmap = None
+
+    def __getstate__(self) -> dict:
+        """
+        Get the state sent to worker processes: the path, or a copy of the bytes for an in-memory PDF.
+
+        Returns:
+            dict: The picklable state of the source.
+        """
+        return {'path': self.path, 'data': None if self.buffer is None else self.buffer.tobytes()}
+
+    def __setstate__(self, state: dict) -> None:
+        """
+        Restore a source sent to a worker process.
+
+        Args:
+            state (dict): The state returned by __getstate__.
+        """
+        self.path = state['path']
+        self.buffer = None if state['data'] is None else memoryview(state['data'])
+        self._mmap = None
+
+    def __repr__(self) -> str:
+        """
+        Returns the official string representation of the PDFSource object.
+
+        Returns:
+            str: A string representation of the object.
+        """
+        if self.buffer is not None:
+            return f"PDFSource(buffer={self.buffer.nbytes} bytes)"
+        if self.path is None:
+            return "PDFSource(closed)"
+        return f"PDFSource(path='{self.path}')"
+
+    def __str__(self) -> str:
+        """
+        Returns a string representation of the PDFSource object, which is the same as its official representation.
+
+        Returns:
+            str: A string representation of the object.
+        """
+        return self.__repr__()
@@ -0,0 +1,212 @@
+import queue
+import threading
+from typing import Any, Callable, Iterable, Iterator, List
+
+# A stage of a pipeline: a function that consumes the items of the previous stage and yields its own
+Stage = Callable[[Iterator[Any]], Iterator[Any]]
+
+# Marks the end of the items sent through a queue
+_END = object()
+
+
+class _Failure:
+    """
+    An exception raised by a stage, sent downstream so that it is raised again by the consumer.
+
+    Attributes:
+        exception (BaseException): The exception raised by the stage.
+    """
+
+    def __init__(self, exception: BaseException):
+        self.exception = exception
+
+
+class _Stopped(Exception):
+    """
+    Raised in the threads of a pipeline to unwind them when the pipeline is stopped.
+    """
+
+
+class Pipeline:
+    """
+    Run a sequence of stages in threads connected by bounded queues, so that they overlap on successive items.
+
+    Each stage runs in its own thread and handles the items one at a time, in order, so the pipeline yields
+    the same items in the same order as chaining the stages in a single thread. The queues bound the number
+    of items waiting between two stages, which bounds the memory held by the pipeline.
+
+    If a stage raises an exception, the pipeline stops and the consumer gets the exception. If the consumer
+    stops iterating, every thread is stopped before run() returns.
+
+    Example:
+        >>> pipeline = Pipeline([render, detect, extract], queue_size=2)
+        >>> for result in pipeline.run(pages):
+        ...     print(result)
+
+    Attributes:
+        stages (List[Stage]): The stages, in order.
+        queue_size (int): The maximum number of items waiting between two stages.
+    """
+
+    # How often (in seconds) blocked threads check whether the pipeline was stopped
+    _POLL_INTERVAL = 0.1
+
+    def __init__(self, stages: List[Stage], queue_size: int = 2):
+        """
+        Initialize the pipeline.
+
+        Args:
+            stages (List[Stage]): The stages, in order. Each one is called once, with an iterator over the items
+                of the previous stage, and yields the items of the next one.
+            queue_size (int): The maximum number of items waiting between two stages. Defaults to 2.
+
+        Raises:
+            TypeError: If a stage is not callable.
+            ValueError: If there is no stage or if queue_size is not a positive integer.
+        """
+        # Verify the input variable types
+        if not stages:
+            raise ValueError("A pipeline needs at least one stage")
+        for stage in stages:
+            if not callable(stage):
+                raise TypeError("Every stage must be callable")
+        if not isinstance(queue_size, int) or queue_size < 1:
+            raise ValueError("queue_size must be an integer greater than or equal to 1")
+
+        self.stages = stages
+        self.queue_size = queue_size
+
+    def run(self, items: Iterable[Any]) -> Iterator[Any]:
+        """
+        Run the items through every stage.
+
+        The items are read from the iterable in a thread of their own, which is the first stage of the pipeline.
+
+        Args:
+            items (Iterable[Any]): The items given to the first stage.
+
+        Returns:
+            Iterator[Any]: An iterator over the items yielded by the last stage.
+        """
+        stop = threading.Event()
+        queues = [queue.Queue(maxsize=self.queue_size) for _ in range(len(self.stages) + 1)]
+
+        # The first thread reads the items, then each stage reads the queue of the previous one
+        threads = [threading.Thread(target=self._feed, args=(items, queues[0], stop), daemon=True)]
+        for stage, input_queue, output_queue in zip(self.stages, queues, queues[1:]):
+            threads.append(threading.Thread(target=self._run_stage, args=(stage, input_queue, output_queue, stop),
+                                            daemon=True))
+        for thread in threads:
+            thread.start()
+
+        try:
+            for item in self._receive(queues[-1], stop):
+                yield item
+        finally:
+            # Stop the threads, whether the items are exhausted, a stage failed or the consumer stopped
+            stop.set()
+            for thread in threads:
+                thread.join()
+
+    def _feed(self, items: Iterable[Any], output_queue: queue.Queue, stop: threading.Event) -> None:
+        """
+        Send the items to the first stage.
+
+        Args:
+            items (Iterable[Any]): The items.
+            output_queue (queue.Queue): The input queue of the first stage.
+            stop (threading.Event): Set when the pipeline is stopped.
+        """
+        self._run_stage(lambda _: iter(items), None, output_queue, stop)
+
+    def _run_stage(self, stage: Stage, input_queue: queue.Queue, output_queue: queue.Queue,
+                   stop: threading.Event) -> None:
+        """
+        Run a stage, reading its input queue and writing its output queue, then mark the end of its output.
+
+        Args:
+            stage (Stage): The stage.
+            input_queue (queue.Queue): The queue of the previous stage, or None for the first thread.
+            output_queue (queue.Queue): The queue of the next stage.
+            stop (threading.Event): Set when the pipeline is stopped.
+        """
+        try:
+            inputs = None if input_queue is None else self._receive(input_queue, stop)
+            for item in stage(inputs):
+                self._send(output_queue, item, stop)
+            self._send(output_queue, _END, stop)
+        except _Stopped:
+            return
+        except BaseException as exception:
+            # Forward the failure to the consumer, unless the pipeline is being stopped anyway
+            try:
+                self._send(output_queue, _Failure(exception), stop)
+            except _Stopped:
+                return
+
+    def _send(self, output_queue: queue.Queue, item: Any, stop: threading.Event) -> None:
+        """
+        Put an item in a queue, waiting for room unless the pipeline is stopped.
+
+        Args:
+            output_queue (queue.Queue): The queue.
+            item (Any): The item.
+            stop (threading.Event): Set when the pipeline is stopped.
+
+        Raises:
+            _Stopped: If the pipeline was stopped.
+        """
+        while not stop.is_set():
+            try:
+                output_queue.put(item, timeout=self._POLL_INTERVAL)
+                return
+            except queue.Full:
+                continue
+        raise _Stopped()
+
+    def _receive(self, input_queue: queue.Queue, stop: threading.Event) -> Iterator[Any]:
+        """
+        Get the items of a queue until the end of the items.
+
+        Args:
+            input_queue (queue.Queue): The queue.
+            stop (threading.Event): Set when the pipeline is stopped.
+
+        Returns:
+            Iterator[Any]: An iterator over the items of the queue.
+
+        Raises:
+            _Stopped: If the pipeline was stopped.
+            BaseException: The exception raised by a previous stage, if any.
+        """
+        while True:
+            try:
+                item = input_queue.get(timeout=self._POLL_INTERVAL)
+            except queue.Empty:
+                if stop.is_set():
+                    raise _Stopped()
+                continue
+            if item is _END:
+                return
+            if isinstance(item, _Failure):
+                raise item.exception
+            yield item
+
+    def __repr__(self) -> str:
+        """
+        Returns the official string representation of the Pipeline object.
+
+        Returns:
+            str: A string representation of the object.
+        """
+        stages = ', '.join(getattr(stage, '__name__', type(stage).__name__) for stage in self.stages)
+        return f"Pipeline(stages=[{stages}], queue_size={self.queue_size})"
+
+    def __str__(self) -> str:
+        """
+        Returns a string representation of the Pipeline object, which is the same as its official representation.
+
+        Returns:
+            str: A string representation of the object.
+        """
+        return self.__repr__()
@@ -0,0 +1,11 @@
+from .renderer import Renderer
+from .plumber import PdfPlumberRenderer
+from .mupdf import PyMuPDFRenderer
+from .cached import CachedRenderer
+from .locked import LockedRenderer
+
+# Renderers available by name
+RENDERERS = {
+    'pdfplumber': PdfPlumberRenderer,
+    'pymupdf': PyMuPDFRenderer,
+}
@@ -0,0 +1,76 @@
+from PIL import Image
+from typing import Union
+from scanipy.cache import RenderCache
+from .renderer import Renderer, Region
+
+
+class CachedRenderer(Renderer):
+    """
+    Serve full page images from a RenderCache, and render (then store) the pages that are not cached.
+
+    Regions are always rendered by the wrapped renderer.
+
+    Attributes:
+        renderer (Renderer): The renderer used for the pages missing from the cache.
+        cache (RenderCache): The cache of page images.
+        pdf_hash (str): The hash of the PDF content, see RenderCache.hash_file.
+    """
+
+    def __init__(self, renderer: Renderer, cache: RenderCache, pdf_hash: str):
+        """
+        Initialize the cached renderer.
+
+        Args:
+            renderer (Renderer): The renderer used for the pages missing from the cache.
+            cache (RenderCache): The cache of page images.
+            pdf_hash (str): The hash of the PDF content, see RenderCache.hash_file.
+        """
+        super().__init__(renderer.source)
+        self.renderer = renderer
+        self.cache = cache
+        self.pdf_hash = pdf_hash
+
+    def page_count(self) -> int:
+        """
+        Get the number of pages in the PDF file.
+
+        Returns:
+            int: The number of pages.
+        """
+        return self.renderer.page_count()
+
+    def render(self, page_number: int, resolution: int, region: Union[Region, None] = None) -> Image.Image:
+        """
+        Rasterize a page of the PDF file, or only a region of it.
+
+        Args:
+            page_number (int): The number of the page to render, starting at 1.
+            resolution (int): The resolution (DPI) of the image.
+            region (Union[Region, None], optional): The normalized region of the page to render. Defaults to None (full page).
+
+        Returns:
+            PIL.Image.Image: The rendered page or region, in RGB mode.
+        """
+        if region is not None:
+            return self.renderer.render(page_number, resolution, region)
+
+        image = self.cache.get(self.pdf_hash, page_number, resolution)
+        if image is None:
+            image = self.renderer.render(page_number, resolution)
+            self.cache.put(self.pdf_hash, page_number, resolution, image)
+        return image
+
+    def close(self) -> None:
+        """
+        Release the resources held by the wrapped renderer.
+        """
+        self.renderer.close()
+
+    def __repr__(self) -> str:
+        """
+        Returns the official string representation of the CachedRenderer object.
+
+        Returns:
+            str: A string that can be used to recreate the CachedRenderer object.
+        """
+        return f"CachedRenderer(renderer={self.renderer}, cache={self.cache}, pdf_hash='{self.pdf_hash}')"
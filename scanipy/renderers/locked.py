@@ -0,0 +1,69 @@
+import threading
+from PIL import Image
+from typing import Union
+from .renderer import Renderer, Region
+
+# Neither pdfium nor MuPDF may be called from several threads at once, even for different documents
+_RENDER_LOCK = threading.Lock()
+
+class LockedRenderer(Renderer):
+    """
+    Serialize the calls to a renderer, so that pages can be rendered from several threads.
+
+    Neither pdfium nor MuPDF may be called from several threads at once, even for different documents, so
+    the calls of every locked renderer of the process are serialized by the same lock.
+
+    Attributes:
+        renderer (Renderer): The renderer whose calls are serialized.
+    """
+
+    def __init__(self, renderer: Renderer):
+        """
+        Initialize the locked renderer.
+
+        Args:
+            renderer (Renderer): The renderer whose calls are serialized.
+        """
+        super().__init__(renderer.source)
+        self.renderer = renderer
+
+    def page_count(self) -> int:
+        """
+        Get the number of pages in the PDF file.
+
+        Returns:
+            int: The number of pages.
+        """
+        with _RENDER_LOCK:
+            return self.renderer.page_count()
+
+    def render(self, page_number: int, resolution: int, region: Union[Region, None] = None) -> Image.Image:
+        """
+        Rasterize a page of the PDF file, or only a region of it, once no other thread is rendering.
+
+        Args:
+            page_number (int): The number of the page to render, starting at 1.
+            resolution (int): The resolution (DPI) of the image.
+            region (Union[Region, None], optional): The normalized region of the page to render. Defaults to None (full page).
+
+        Returns:
+            PIL.Image.Image: The rendered page or region, in RGB mode.
+        """
+        with _RENDER_LOCK:
+            return self.renderer.render(page_number, resolution, region)
+
+    def close(self) -> None:
+        """
+        Release the resources held by the wrapped renderer.
+        """
+        with _RENDER_LOCK:
+            self.renderer.close()
+
+    def __repr__(self) -> str:
+        """
+        Returns the official string representation of the LockedRenderer object.
+
+        Returns:
+            str: A string that can be used to recreate the LockedRenderer object.
+        """
+        return f"LockedRenderer(renderer={self.renderer})"
@@ -0,0 +1,77 @@
+import fitz
+from PIL import Image
+from typing import Union
+from scanipy.pdfsource import PDFInput, PDFSource
+from .renderer import Renderer, Region
+
+
+class PyMuPDFRenderer(Renderer):
+    """
+    Rasterize pages with PyMuPDF (fitz), using MuPDF's native pixmap rendering.
+
+    The images are adjusted to the geometry of PdfPlumberRenderer when MuPDF rounds the page size differently.
+
+    Attributes:
+        document (fitz.Document): The PyMuPDF document used to render the pages.
+    """
+
+    def __init__(self, source: Union[PDFInput, PDFSource]):
+        """
+        Initialize the renderer for a PDF file.
+
+        Args:
+            source (Union[PDFInput, PDFSource]): The PDF file, as a path, an in-memory buffer or a file object.
+        """
+        super().__init__(source)
+
+        # MuPDF reads an in-memory PDF straight from the buffer
+        if self.source.path is not None:
+            self.document = fitz.open(self.source.path)
+        else:
+            self.document = fitz.open(stream=self.source.buffer, filetype='pdf')
+
+    def page_count(self) -> int:
+        """
+        Get the number of pages in the PDF file.
+
+        Returns:
+            int: The number of pages.
+        """
+        return self.document.page_count
+
+    def render(self, page_number: int, resolution: int, region: Union[Region, None] = None) -> Image.Image:
+        """
+        Rasterize a page of the PDF file, or only a region of it.
+
+        A region is rendered straight from the vector data of the page: only its pixels are computed.
+
+        Args:
+            page_number (int): The number of the page to render, starting at 1.
+            resolution (int): The resolution (DPI) of the image.
+            region (Union[Region, None], optional): The normalized region of the page to render. Defaults to None (full page).
+
+        Returns:
+            PIL.Image.Image: The rendered page or region, in RGB mode.
+        """
+        page = self.document[page_number - 1]
+        scale = resolution / 72
+
+        # Clip the rendering to the pixel box of the region, expressed in page coordinates
+        clip = None
+        if region is not None:
+            size = self.page_image_size(page.rect.width, page.rect.height, resolution)
+            left, upper, right, lower = self.region_pixel_box(region, size)
+            clip = fitz.Rect(page.rect.x0 + left / scale, page.rect.y0 + upper / scale,
+                             page.rect.x0 + right / scale, page.rect.y0 + lower / scale)
+
+        # Render the page without alpha channel, so the samples are packed RGB
+        pixmap = page.get_pixmap(matrix=fitz.Matrix(scale, scale), clip=clip, alpha=False)
+        image = Image.frombytes('RGB', (pixmap.width, pixmap.height), pixmap.samples)
+
+        return self._fit_page_geometry(image, page.rect.width, page.rect.height, resolution, region)
+
+    def close(self) -> None:
+        """
+        Close the PyMuPDF document.
+        """
+        self.document.close()
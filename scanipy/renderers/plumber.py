@@ -0,0 +1,83 @@
+import pdfplumber
+import pdfplumber.pdf
+import pdfplumber.page
+from PIL import Image
+from typing import Union
+from scanipy.pdfsource import PDFInput, PDFSource
+from .renderer import Renderer, Region
+
+
+class PdfPlumberRenderer(Renderer):
+    """
+    Rasterize pages with pdfplumber, which renders them with pdfium.
+
+    Its output is the reference geometry of all the renderers.
+
+    Attributes:
+        pdf_file (pdfplumber.pdf.PDF): The pdfplumber PDF object used to render the pages.
+    """
+
+    def __init__(self, source: Union[PDFInput, PDFSource], pdf_file: Union[pdfplumber.pdf.PDF, None] = None):
+        """
+        Initialize the renderer for a PDF file.
+
+        Args:
+            source (Union[PDFInput, PDFSource]): The PDF file, as a path, an in-memory buffer or a file object.
+            pdf_file (Union[pdfplumber.pdf.PDF, None], optional): An already opened pdfplumber PDF to share.
+                If None, the renderer opens (and closes) its own. Defaults to None.
+        """
+        super().__init__(source)
+        self._owns_pdf_file = pdf_file is None
+        self.pdf_file = pdfplumber.open(self.source.open()) if pdf_file is None else pdf_file
+
+    @staticmethod
+    def render_page(pdf_page: pdfplumber.page.Page, resolution: int, region: Union[Region, None] = None) -> Image.Image:
+        """
+        Rasterize a pdfplumber page, or only a region of it.
+
+        pdfium always rasterizes the whole page, so a region is cropped from the full page image.
+
+        Args:
+            pdf_page (pdfplumber.page.Page): The page to rasterize.
+            resolution (int): The resolution (DPI) of the image.
+            region (Union[Region, None], optional): The normalized region of the page to render. Defaults to None (full page).
+
+        Returns:
+            PIL.Image.Image: The rendered page or region, in RGB mode.
+        """
+        image = pdf_page.to_image(resolution=resolution).original
+        if region is not None:
+            return image.crop(Renderer.region_pixel_box(region, image.size)).convert('RGB')
+        if image.mode != 'RGB':
+            return image.convert('RGB')
+        return image.copy()
+
+    def page_count(self) -> int:
+        """
+        Get the number of pages in the PDF file.
+
+        Returns:
+            int: The number of pages.
+        """
+        return len(self.pdf_file.pages)
+
+    def render(self, page_number: int, resolution: int, region: Union[Region, None] = None) -> Image.Image:
+        """
+        Rasterize a page of the PDF file, or only a region of it.
+
+        Args:
+            page_number (int): The number of the page to render, starting at 1.
+            resolution (int): The resolution (DPI) of the image.
+            region (Union[Region, None], optional): The normalized region of the page to render. Defaults to None (full page).
+
+        Returns:
+            PIL.Image.Image: The rendered page or region, in RGB mode.
+        """
+        return self.render_page(self.pdf_file.pages[page_number - 1], resolution, region)
+
+    def close(self) -> None:
+        """
+        Close the pdfplumber PDF if it was opened by the renderer.
+        """
+        if self._owns_pdf_file:
+            self.pdf_file.close()
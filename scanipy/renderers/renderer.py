@@ -0,0 +1,134 @@
+import math
+from PIL import Image
+from typing import Tuple, Union
+from scanipy.pdfsource import PDFInput, PDFSource
+
+# A region of a page, as normalized coordinates (x_min, y_min, x_max, y_max) in the range [0, 1]
+Region = Tuple[float, float, float, float]
+
+class Renderer:
+    """
+    Base class of the backends that rasterize the pages of a PDF file.
+
+    Every backend must return images with the same geometry for a given page and resolution, so that
+    the normalized coordinates of the elements map to the same regions whatever the backend.
+
+    Attributes:
+        source (PDFSource): The PDF file.
+        filepath (Union[str, None]): The path to the PDF file, or None for an in-memory PDF.
+    """
+
+    def __init__(self, source: Union[PDFInput, PDFSource]):
+        """
+        Initialize the renderer for a PDF file.
+
+        Args:
+            source (Union[PDFInput, PDFSource]): The PDF file, as a path, an in-memory buffer or a file object.
+        """
+        self.source = PDFSource.of(source)
+        self.filepath = self.source.path
+
+    def page_count(self) -> int:
+        """
+        Get the number of pages in the PDF file.
+
+        Returns:
+            int: The number of pages.
+        """
+        raise NotImplementedError
+
+    def render(self, page_number: int, resolution: int, region: Union[Region, None] = None) -> Image.Image:
+        """
+        Rasterize a page of the PDF file, or only a region of it.
+
+        Args:
+            page_number (int): The number of the page to render, starting at 1.
+            resolution (int): The resolution (DPI) of the image.
+            region (Union[Region, None], optional): The normalized region of the page to render. The image is
+                the same as the crop of the full page image given by region_pixel_box. Defaults to None (full page).
+
+        Returns:
+            PIL.Image.Image: The rendered page or region, in RGB mode.
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """
+        Release the resources held by the renderer.
+        """
+        pass
+
+    @staticmethod
+    def page_image_size(width: float, height: float, resolution: int) -> Tuple[int, int]:
+        """
+        Compute the size of the image of a page, as rendered by pdfium through pdfplumber.
+
+        Args:
+            width (float): The width of the page, in PDF points.
+            height (float): The height of the page, in PDF points.
+            resolution (int): The resolution (DPI) of the image.
+
+        Returns:
+            Tuple[int, int]: The width and height of the image, in pixels.
+        """
+        scale = resolution / 72
+        return math.ceil(width * scale), math.ceil(height * scale)
+
+    @staticmethod
+    def region_pixel_box(region: Region, image_size: Tuple[int, int]) -> Tuple[int, int, int, int]:
+        """
+        Convert a normalized region to the pixel box cropped from a page image.
+
+        Args:
+            region (Region): The normalized coordinates (x_min, y_min, x_max, y_max) of the region.
+            image_size (Tuple[int, int]): The width and height of the page image, in pixels.
+
+        Returns:
+            Tuple[int, int, int, int]: The pixel box (left, upper, right, lower).
+        """
+        x_min, y_min, x_max, y_max = region
+        width, height = image_size
+        return int(x_min * width), int(y_min * height), int(x_max * width), int(y_max * height)
+
+    def _fit_page_geometry(self, image: Image.Image, width: float, height: float, resolution: int,
+                           region: Union[Region, None] = None) -> Image.Image:
+        """
+        Make sure the image of a page (or of a region of it) has the reference geometry and is in RGB mode.
+
+        Args:
+            image (PIL.Image.Image): The rendered page or region.
+            width (float): The width of the page, in PDF points.
+            height (float): The height of the page, in PDF points.
+            resolution (int): The resolution (DPI) of the image.
+            region (Union[Region, None], optional): The normalized region rendered. Defaults to None (full page).
+
+        Returns:
+            PIL.Image.Image: The image, resized if its size differs from the reference one.
+        """
+        if image.mode != 'RGB':
+            image = image.convert('RGB')
+        size = self.page_image_size(width, height, resolution)
+        if region is not None:
+            left, upper, right, lower = self.region_pixel_box(region, size)
+            size = (right - left, lower - upper)
+        if image.size != size:
+            image = image.resize(size, Image.BILINEAR)
+        return image
+
+    def __repr__(self) -> str:
+        """
+        Returns the official string representation of the Renderer object.
+
+        Returns:
+            str: A string that can be used to recreate the Renderer object.
+        """
+        return f"{type(self).__name__}(source={self.source})"
+
+    def __str__(self) -> str:
+        """
+        Returns a string representation of the Renderer object, which is the same as its official representation.
+
+        Returns:
+            str: A string that can be used to recreate the Renderer object.
+        """
+        return self.__repr__()
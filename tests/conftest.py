@@ -0,0 +1,18 @@
+import fitz
+import pytest
+
+
+@pytest.fixture(scope='session')
+def pdf_bytes() -> bytes:
+    """
+    A three-page PDF with two columns of text lines on each page.
+    """
+    document = fitz.open()
+    for page_number in range(1, 4):
+        page = document.new_page(width=595, height=842)
+        for line in range(20):
+            page.insert_text((50, 60 + line * 14), f"Page {page_number} left line {line}", fontsize=10)
+            page.insert_text((320, 60 + line * 14), f"right line {line} of page {page_number}", fontsize=10)
+    data = document.tobytes()
+    document.close()
+    return data
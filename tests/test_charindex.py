@@ -0,0 +1,60 @@
+import io
+import pdfplumber
+import pytest
+from scanipy.charindex import CharIndex
+
+# Regions of an A4 page: inside a column, across both, over cell boundaries, cutting lines, empty and the page
+REGIONS = [
+    (40, 50, 300, 200),
+    (40, 50, 560, 340),
+    (99.5, 99.5, 150.5, 150.5),
+    (100, 0, 400, 842),
+    (60, 100, 340, 103),
+    (400, 500, 550, 800),
+    (0, 0, 595, 842),
+]
+
+
+@pytest.fixture
+def pdf_page(pdf_bytes):
+    with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf_file:
+        yield pdf_file.pages[1]
+
+
+@pytest.mark.parametrize('cell_size', [7.0, 50.0, 1000.0])
+@pytest.mark.parametrize('bbox', REGIONS)
+def test_extract_text_matches_crop(pdf_page, bbox, cell_size):
+    index = CharIndex(pdf_page.chars, cell_size=cell_size)
+    assert index.extract_text(bbox) == pdf_page.crop(bbox).extract_text()
+
+
+@pytest.mark.parametrize('bbox', REGIONS)
+def test_extract_text_matches_crop_with_settings(pdf_page, bbox):
+    index = CharIndex(pdf_page.chars)
+    settings = dict(x_tolerance=1.5, y_tolerance=2, layout=True)
+    assert index.extract_text(bbox, **settings) == pdf_page.crop(bbox).extract_text(**settings)
+
+
+def test_crop_keeps_page_order(pdf_page):
+    chars = CharIndex(pdf_page.chars, cell_size=20.0).crop((40, 50, 560, 340))
+    expected = pdf_page.crop((40, 50, 560, 340)).chars
+    assert [(char['text'], char['x0'], char['top']) for char in chars] == \
+           [(char['text'], char['x0'], char['top']) for char in expected]
+
+
+def test_nested_crops(pdf_page):
+    # Nested pdfplumber crops are the crop of the intersection of the regions
+    outer, inner = (40, 50, 300, 400), (200, 100, 560, 800)
+    bbox = CharIndex.intersect(outer, inner)
+    assert bbox == (200, 100, 300, 400)
+    assert CharIndex(pdf_page.chars).extract_text(bbox) == pdf_page.crop(outer).crop(inner, strict=False).extract_text()
+
+
+def test_intersect_disjoint():
+    assert CharIndex.intersect((0, 0, 10, 10), (20, 20, 30, 30)) is None
+
+
+@pytest.mark.parametrize('cell_size', [0, -1.0])
+def test_invalid_cell_size(cell_size):
+    with pytest.raises(ValueError):
+        CharIndex([], cell_size=cell_size)
@@ -0,0 +1,77 @@
+import logging
+import os
+import pickle
+import pytest
+from scanipy.checkpoint import Checkpoint
+from scanipy.elements import EquationElement, TextElement
+
+KEY = '1a' * 32
+
+
+def page_results(page_number):
+    text = TextElement(0.1, 0.1, 0.5, 0.2, page_number=page_number)
+    text.text_content = f"Page {page_number}"
+    return [text], [EquationElement(0.2, 0.3, 0.4, 0.35, page_number=page_number)]
+
+
+def test_round_trip(tmp_path):
+    checkpoint = Checkpoint(tmp_path, KEY)
+    assert checkpoint.load() == {}
+    checkpoint.save(1, *page_results(1))
+    checkpoint.save(3, *page_results(3))
+
+    # Another run of the same document finds the finished pages
+    pages = Checkpoint(tmp_path, KEY).load()
+    assert sorted(pages) == [1, 3]
+    elements, equations = pages[3]
+    assert elements[0].text_content == "Page 3"
+    assert equations[0].page_number == 3
+
+
+def test_documents_are_separate(tmp_path):
+    Checkpoint(tmp_path, KEY).save(1, *page_results(1))
+    assert Checkpoint(tmp_path, '2b' * 32).load() == {}
+
+
+def test_overwrites_a_page(tmp_path):
+    checkpoint = Checkpoint(tmp_path, KEY)
+    checkpoint.save(2, *page_results(1))
+    checkpoint.save(2, *page_results(2))
+    assert checkpoint.load()[2][0][0].text_content == "Page 2"
+    assert os.listdir(checkpoint.directory) == ['page-000002.pkl']
+
+
+def test_skips_forged_and_corrupt_pages(tmp_path, caplog):
+    checkpoint = Checkpoint(tmp_path, KEY)
+    checkpoint.save(1, *page_results(1))
+    with open(os.path.join(checkpoint.directory, 'page-000002.pkl'), 'wb') as file:
+        pickle.dump((os.system, ('true',)), file)
+    with open(os.path.join(checkpoint.directory, 'page-000003.pkl'), 'wb') as file:
+        file.write(b'truncated')
+
+    # The unreadable pages are parsed again
+    with caplog.at_level(logging.WARNING):
+        assert list(checkpoint.load()) == [1]
+    assert caplog.text.count("Ignoring the unreadable checkpoint") == 2
+
+
+def test_ignores_other_files(tmp_path):
+    checkpoint = Checkpoint(tmp_path, KEY)
+    checkpoint.save(1, *page_results(1))
+    open(os.path.join(checkpoint.directory, 'leftover.tmp'), 'wb').close()
+    assert list(checkpoint.load()) == [1]
+
+
+def test_remove(tmp_path):
+    checkpoint = Checkpoint(tmp_path, KEY)
+    checkpoint.save(1, *page_results(1))
+    checkpoint.remove()
+    assert not os.path.exists(checkpoint.directory)
+    assert checkpoint.load() == {}
+    checkpoint.remove()
+
+
+@pytest.mark.parametrize('root, key', [(1, KEY), ('checkpoints', 1)])
+def test_invalid_arguments(root, key):
+    with pytest.raises(TypeError):
+        Checkpoint(root, key)
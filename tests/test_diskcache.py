@@ -0,0 +1,85 @@
+import hashlib
+import os
+import numpy as np
+import pytest
+from PIL import Image
+from scanipy.cache import DiskCache, RenderCache
+
+PDF_HASH = 'ab' * 32
+
+
+def page_image(value):
+    return Image.fromarray(np.full((100, 100, 3), value, dtype=np.uint8))
+
+
+def test_round_trip(tmp_path):
+    cache = RenderCache(tmp_path)
+    image = Image.fromarray(np.arange(60 * 80 * 3, dtype=np.uint8).reshape(60, 80, 3))
+    cache.put(PDF_HASH, 1, 200, image)
+    assert np.array_equal(np.asarray(cache.get(PDF_HASH, 1, 200)), np.asarray(image))
+    assert cache.get_array(PDF_HASH, 1, 200).flags.writeable is False
+
+
+def test_missing_entries(tmp_path):
+    cache = RenderCache(tmp_path)
+    cache.put(PDF_HASH, 1, 200, page_image(0))
+    assert cache.get(PDF_HASH, 2, 200) is None
+    assert cache.get(PDF_HASH, 1, 100) is None
+    assert cache.get(PDF_HASH, 1, 200, mode='L') is None
+
+
+def test_shared_directory(tmp_path):
+    RenderCache(tmp_path).put(PDF_HASH, 3, 200, page_image(7))
+    assert np.asarray(RenderCache(tmp_path).get(PDF_HASH, 3, 200))[0, 0].tolist() == [7, 7, 7]
+
+
+def test_evicts_the_least_recently_used(tmp_path):
+    # Three page images fit in the budget, a fourth one does not
+    cache = RenderCache(tmp_path, max_bytes=110_000)
+    for page_number in (1, 2, 3):
+        cache.put(PDF_HASH, page_number, 200, page_image(page_number))
+    for age, page_number in enumerate((3, 2, 1)):
+        timestamp = 1_000_000 - age * 1000
+        os.utime(cache._entry_path(PDF_HASH, page_number, 200, 'RGB'), (timestamp, timestamp))
+
+    # Reading page 1 makes page 2 the least recently used
+    assert cache.get(PDF_HASH, 1, 200) is not None
+    cache.put(PDF_HASH, 4, 200, page_image(4))
+    assert [cache.get(PDF_HASH, page_number, 200) is not None for page_number in (1, 2, 3, 4)] == \
+           [True, False, True, True]
+    assert cache.size() <= cache.max_bytes
+
+
+def test_no_temporary_files_left(tmp_path):
+    cache = RenderCache(tmp_path)
+    cache.put(PDF_HASH, 1, 200, page_image(1))
+    cache.put(PDF_HASH, 1, 200, page_image(2))
+    filenames = [filename for _, _, filenames in os.walk(tmp_path) for filename in filenames]
+    assert not [filename for filename in filenames if filename.endswith('.tmp')]
+    assert np.asarray(cache.get(PDF_HASH, 1, 200))[0, 0].tolist() == [2, 2, 2]
+
+
+def test_clear(tmp_path):
+    cache = RenderCache(tmp_path)
+    cache.put(PDF_HASH, 1, 200, page_image(1))
+    assert cache.size() > 0
+    cache.clear()
+    assert cache.size() == 0
+    assert cache.get(PDF_HASH, 1, 200) is None
+
+
+def test_hash_file(tmp_path, pdf_bytes):
+    path = tmp_path / 'document.pdf'
+    path.write_bytes(pdf_bytes)
+    assert RenderCache.hash_file(str(path)) == hashlib.sha256(pdf_bytes).hexdigest()
+
+
+@pytest.mark.parametrize('kwargs, error', [
+    (dict(directory=1, max_bytes=10), TypeError),
+    (dict(max_bytes=10.0), TypeError),
+    (dict(max_bytes=0), ValueError),
+    (dict(max_bytes=10, rescan_interval=0), ValueError),
+])
+def test_invalid_arguments(tmp_path, kwargs, error):
+    with pytest.raises(error):
+        DiskCache(**{'directory': tmp_path, **kwargs})
@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+from scanipy.elements import Element, TextElement, geometry
+
+
+def random_elements(count, seed):
+    # Boxes of every size, often overlapping, within the page
+    rng = np.random.default_rng(seed)
+    elements = []
+    for _ in range(count):
+        x_min, y_min = rng.uniform(0, 0.7, size=2)
+        width, height = rng.uniform(0.01, 0.3, size=2)
+        elements.append(TextElement(float(x_min), float(y_min), float(x_min + width), float(y_min + height)))
+    return elements
+
+
+@pytest.fixture
+def elements():
+    return random_elements(30, seed=0)
+
+
+@pytest.fixture
+def other_elements():
+    return random_elements(20, seed=1)
+
+
+def test_element_boxes(elements):
+    boxes = geometry.element_boxes(elements)
+    assert boxes.shape == (30, 4)
+    assert boxes[3].tolist() == [elements[3].x_min, elements[3].y_min, elements[3].x_max, elements[3].y_max]
+    assert geometry.element_boxes([]).shape == (0, 4)
+
+
+def test_intersection_areas_match_elements(elements, other_elements):
+    areas = geometry.intersection_areas(geometry.element_boxes(elements), geometry.element_boxes(other_elements))
+    expected = [[element._intersection_area(other) for other in other_elements] for element in elements]
+    np.testing.assert_allclose(areas, expected)
+
+
+def test_intersection_percentages_match_elements(elements, other_elements):
+    percentages = geometry.intersection_percentages(geometry.element_boxes(elements),
+                                                    geometry.element_boxes(other_elements))
+    expected = [[element._intersection_percentage(other) for other in other_elements] for element in elements]
+    np.testing.assert_allclose(percentages, expected)
+
+
+def test_intersection_over_union():
+    boxes = np.array([[0.0, 0.0, 0.2, 0.2], [0.5, 0.5, 0.6, 0.6]])
+    other_boxes = np.array([[0.0, 0.0, 0.2, 0.2], [0.1, 0.0, 0.3, 0.2], [0.7, 0.7, 0.8, 0.8]])
+    expected = [[1.0, 1 / 3, 0.0], [0.0, 0.0, 0.0]]
+    np.testing.assert_allclose(geometry.intersection_over_union(boxes, other_boxes), expected)
+
+
+def test_touching_boxes_do_not_intersect():
+    boxes = np.array([[0.0, 0.0, 0.5, 0.5]])
+    other_boxes = np.array([[0.5, 0.0, 1.0, 0.5], [0.0, 0.5, 0.5, 1.0]])
+    assert geometry.intersection_areas(boxes, other_boxes).tolist() == [[0.0, 0.0]]
+
+
+def test_is_in_matches_elements(elements, other_elements):
+    # Each element is inside another above its own threshold
+    inner = [Element(0.1, 0.1, 0.2, 0.12, intersection_percentage_threshold=40),
+             Element(0.1, 0.1, 0.2, 0.12, intersection_percentage_threshold=60), *random_elements(10, seed=2)]
+    blocks = [*other_elements, TextElement(0.05, 0.05, 0.15, 0.15)]
+    expected = [[element.is_in(block) for block in blocks] for element in inner]
+    assert expected[0][-1] and not expected[1][-1]
+    assert geometry.is_in(inner, blocks).tolist() == expected
+    assert geometry.is_in(elements, other_elements).tolist() == \
+           [[element.is_in(other) for other in other_elements] for element in elements]
+
+
+def test_is_in_empty(elements):
+    assert geometry.is_in([], elements).shape == (0, 30)
+    assert geometry.is_in(elements, []).shape == (30, 0)
+
+
+def test_normalize_boxes():
+    boxes = np.array([[10, 20, 110, 220], [-5, 0, 300, 500]])
+    expected = [[0.05, 0.05, 0.55, 0.55], [0.0, 0.0, 1.0, 1.0]]
+    np.testing.assert_allclose(geometry.normalize_boxes(boxes, 200, 400), expected)
+
+
+def test_normalize_boxes_invalid():
+    with pytest.raises(ValueError):
+        geometry.normalize_boxes(np.array([[50, 20, 50, 60]]), 200, 400)
@@ -0,0 +1,91 @@
+import pytest
+from scanipy.elements import OverlapSuppressor, TextElement, TitleElement
+
+
+def element(element_type, x_min, y_min, x_max, y_max, score=None):
+    result = element_type(x_min, y_min, x_max, y_max)
+    result.score = score
+    return result
+
+
+def boxes(elements):
+    return [(type(e).__name__, e.x_min, e.y_min, e.x_max, e.y_max) for e in elements]
+
+
+def test_keeps_distinct_elements():
+    elements = [element(TextElement, 0.1, 0.1, 0.4, 0.2), element(TextElement, 0.1, 0.3, 0.4, 0.4)]
+    suppressor = OverlapSuppressor()
+    assert suppressor(elements) == elements
+    assert suppressor.suppressed_count == 0
+
+
+def test_drops_the_duplicate_with_the_lower_score():
+    low = element(TextElement, 0.1, 0.1, 0.5, 0.3, score=0.6)
+    high = element(TextElement, 0.1, 0.1, 0.5, 0.31, score=0.9)
+    other = element(TextElement, 0.6, 0.6, 0.9, 0.9)
+    suppressor = OverlapSuppressor(iou_threshold=0.8)
+    assert suppressor([low, high, other]) == [high, other]
+    assert suppressor.suppressed == {'TextElement': 1}
+    assert suppressor.suppressed_area == pytest.approx(0.4 * 0.2)
+
+
+def test_drops_nested_elements():
+    outer = element(TextElement, 0.1, 0.1, 0.6, 0.6)
+    inner = element(TextElement, 0.2, 0.2, 0.3, 0.3)
+    partly_inside = element(TextElement, 0.55, 0.2, 0.7, 0.3)
+    suppressor = OverlapSuppressor(containment_threshold=90)
+    assert suppressor([inner, outer, partly_inside]) == [outer, partly_inside]
+
+
+def test_across_types():
+    text = element(TextElement, 0.1, 0.1, 0.5, 0.3, score=0.9)
+    title = element(TitleElement, 0.1, 0.1, 0.5, 0.3, score=0.8)
+    assert OverlapSuppressor(across_types=True)([text, title]) == [text]
+    assert OverlapSuppressor(across_types=False)([text, title]) == [text, title]
+
+
+def test_merges_duplicates_into_their_union():
+    first = element(TextElement, 0.1, 0.1, 0.5, 0.3, score=0.9)
+    second = element(TextElement, 0.12, 0.1, 0.52, 0.31, score=0.7)
+    result = OverlapSuppressor(iou_threshold=0.7, merge=True)([first, second])
+    assert boxes(result) == [('TextElement', 0.1, 0.1, 0.52, 0.31)]
+    assert result[0].score == 0.9
+
+
+def test_merge_only_joins_the_same_type():
+    text = element(TextElement, 0.1, 0.1, 0.5, 0.3, score=0.9)
+    title = element(TitleElement, 0.1, 0.1, 0.52, 0.31, score=0.7)
+    assert OverlapSuppressor(merge=True)([text, title]) == [text]
+
+
+def test_nesting_is_checked_against_the_merged_box():
+    # The small element sticks out of the kept box, but not out of its union with the duplicate
+    kept = element(TextElement, 0.0, 0.0, 0.5, 0.5, score=0.9)
+    duplicate = element(TextElement, 0.0, 0.0, 0.55, 0.5, score=0.8)
+    small = element(TextElement, 0.49, 0.1, 0.54, 0.2)
+    assert OverlapSuppressor(merge=False)([kept, duplicate, small]) == [kept, small]
+    assert boxes(OverlapSuppressor(merge=True)([kept, duplicate, small])) == [('TextElement', 0.0, 0.0, 0.55, 0.5)]
+
+
+def test_counts_and_report():
+    suppressor = OverlapSuppressor()
+    suppressor([element(TextElement, 0.1, 0.1, 0.5, 0.3), element(TextElement, 0.1, 0.1, 0.5, 0.3)])
+    suppressor([element(TextElement, 0.1, 0.1, 0.5, 0.3)])
+    other = OverlapSuppressor()
+    other([element(TitleElement, 0.1, 0.1, 0.5, 0.3), element(TitleElement, 0.2, 0.15, 0.3, 0.2)])
+    suppressor.add_counts(other)
+    assert (suppressor.detected, suppressor.suppressed_count) == (5, 2)
+    assert suppressor.report().startswith("Suppressed 2 of 5 detected elements (40.0%; TextElement: 1, TitleElement: 1)")
+    suppressor.reset()
+    assert (suppressor.detected, suppressor.suppressed_count, suppressor.suppressed_area) == (0, 0, 0.0)
+
+
+@pytest.mark.parametrize('kwargs, error', [
+    (dict(iou_threshold=1.5), ValueError),
+    (dict(containment_threshold=-1), ValueError),
+    (dict(across_types=1), TypeError),
+    (dict(merge='yes'), TypeError),
+])
+def test_invalid_arguments(kwargs, error):
+    with pytest.raises(error):
+        OverlapSuppressor(**kwargs)
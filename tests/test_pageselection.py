@@ -0,0 +1,50 @@
+import pytest
+from scanipy.pdfhandler import parse_page_selection, select_pages
+from scanipy.pdfsource import PDFSource
+
+
+@pytest.mark.parametrize('selection, expected', [
+    (None, [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]),
+    (7, [7]),
+    (range(4, 7), [4, 5, 6]),
+    (range(1, 10, 3), [1, 4, 7]),
+    ("3", [3]),
+    ("1,3,5-7", [1, 3, 5, 6, 7]),
+    ("8-", [8, 9, 10]),
+    ("-3", [1, 2, 3]),
+    ("1-10:3", [1, 4, 7, 10]),
+    (" 2 , 4 ,", [2, 4]),
+    ([5, 1, range(2, 4)], [1, 2, 3, 5]),
+    ((9, 9, 2), [2, 9]),
+    ("1-4,3-5", [1, 2, 3, 4, 5]),
+])
+def test_parse_page_selection(selection, expected):
+    assert parse_page_selection(selection, 10) == expected
+
+
+@pytest.mark.parametrize('selection', [0, 11, "9-12", [1, 11], range(0, 3)])
+def test_parse_page_selection_out_of_range(selection):
+    with pytest.raises(ValueError, match="out of range"):
+        parse_page_selection(selection, 10)
+
+
+@pytest.mark.parametrize('selection', ["a", "1-b", "5-2", "1-4:0", "1-4:x"])
+def test_parse_page_selection_malformed(selection):
+    with pytest.raises(ValueError):
+        parse_page_selection(selection, 10)
+
+
+@pytest.mark.parametrize('selection', [True, 1.0, object(), [1, "2"], [1, None]])
+def test_parse_page_selection_invalid_type(selection):
+    with pytest.raises(TypeError):
+        parse_page_selection(selection, 10)
+
+
+def test_select_pages(pdf_bytes):
+    # Equivalent selections give the same page numbers, which key the cached documents
+    source = PDFSource(pdf_bytes)
+    selections = [None, "1-", "1-3", range(1, 4), [3, 2, 1], [range(1, 3), 3]]
+    assert [select_pages(source, selection) for selection in selections] == [[1, 2, 3]] * len(selections)
+    with pytest.raises(ValueError):
+        select_pages(source, 4)
+    source.close()
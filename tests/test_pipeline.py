@@ -0,0 +1,108 @@
+import threading
+import pytest
+from scanipy.pipeline import Pipeline
+
+
+def double(items):
+    for item in items:
+        yield item * 2
+
+
+def increment(items):
+    for item in items:
+        yield item + 1
+
+
+def fail_after(count):
+    def stage(items):
+        for index, item in enumerate(items):
+            if index == count:
+                raise KeyError(item)
+            yield item
+    return stage
+
+
+def test_same_items_as_chaining_the_stages():
+    results = list(Pipeline([double, increment, double], queue_size=1).run(range(50)))
+    assert results == list(double(increment(double(range(50)))))
+
+
+def test_stage_changing_the_number_of_items():
+    def pairs(items):
+        for item in items:
+            yield item
+            yield -item
+    assert list(Pipeline([pairs, double]).run([1, 2])) == [2, -2, 4, -4]
+
+
+@pytest.mark.parametrize('failing_stage, failing_item', [(0, 5), (1, 10), (2, 11), (3, 22)])
+def test_forwards_a_stage_failure(failing_stage, failing_item):
+    # The items before the failure come out, then the exception raised by the stage
+    stages = [double, increment, double]
+    stages.insert(failing_stage, fail_after(5))
+    threads = threading.active_count()
+    results = []
+    with pytest.raises(KeyError) as error:
+        for item in Pipeline(stages).run(range(20)):
+            results.append(item)
+    assert error.value.args == (failing_item,)
+    assert results == [2 * (2 * item) + 2 for item in range(5)]
+    assert threading.active_count() == threads
+
+
+def test_forwards_a_failure_of_the_items():
+    def items():
+        yield 1
+        raise ValueError("unreadable page")
+    with pytest.raises(ValueError, match="unreadable page"):
+        list(Pipeline([double]).run(items()))
+
+
+def test_forwards_the_same_exception_object():
+    failure = RuntimeError("model failed")
+    def stage(items):
+        for _ in items:
+            raise failure
+        yield
+    with pytest.raises(RuntimeError) as error:
+        list(Pipeline([double, stage, increment]).run([1]))
+    assert error.value is failure
+
+
+def test_consumer_stopping_early_stops_the_threads():
+    produced = []
+    def items():
+        for item in range(1000):
+            produced.append(item)
+            yield item
+    threads = threading.active_count()
+    results = Pipeline([double, increment], queue_size=2).run(items())
+    assert [next(results) for _ in range(3)] == [1, 3, 5]
+    results.close()
+    assert threading.active_count() == threads
+    assert len(produced) < 1000
+
+
+def test_queues_bound_the_items_in_flight():
+    produced, consumed = [], []
+    def items():
+        for item in range(100):
+            produced.append(item)
+            yield item
+    pipeline = Pipeline([double, increment], queue_size=2)
+    for item in pipeline.run(items()):
+        consumed.append(item)
+        # Each of the 3 queues holds at most 2 items, and each of the 3 threads at most one more
+        assert len(produced) - len(consumed) <= 3 * 2 + 3 + 1
+    assert len(consumed) == 100
+
+
+@pytest.mark.parametrize('stages, queue_size, error', [
+    ([], 2, ValueError),
+    ([double, 'stage'], 2, TypeError),
+    ([double], 0, ValueError),
+    ([double], 1.5, ValueError),
+])
+def test_invalid_arguments(stages, queue_size, error):
+    with pytest.raises(error):
+        Pipeline(stages, queue_size=queue_size)
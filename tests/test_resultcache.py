@@ -0,0 +1,103 @@
+import logging
+import os
+import pickle
+import numpy as np
+import pandas as pd
+import pytest
+from PIL import Image
+from scanipy.cache import ResultCache
+from scanipy.cache.restrictedpickle import restricted_load
+from scanipy.document import Document
+from scanipy.elements import EquationElement, ImageElement, TableElement, TextElement
+
+
+class Payload:
+    """
+    A pickle running a command when it is loaded.
+    """
+
+    def __reduce__(self):
+        return os.system, ('true',)
+
+
+def parsed_page():
+    # The elements of a page, with every kind of content a parsing result holds
+    text = TextElement(0.1, 0.1, 0.5, 0.2, page_number=1)
+    text.text_content = "Some text"
+    equation = EquationElement(0.2, 0.12, 0.3, 0.18, page_number=1, is_inside_text=True)
+    equation.latex_content = r"x^2"
+    equation.score = float(np.float32(0.75))
+    text.add_equation_inside(equation)
+    table = TableElement(0.1, 0.3, 0.9, 0.6, page_number=1)
+    table.table_data = pd.DataFrame({'a': [1, 2], 'b': ['x', 'y']})
+    image = ImageElement(0.1, 0.7, 0.5, 0.9, page_number=1)
+    image.image_content = Image.fromarray(np.zeros((4, 6, 3), dtype=np.uint8))
+    return [text, table, image], [equation]
+
+
+def test_document_round_trip(tmp_path):
+    cache = ResultCache(tmp_path)
+    elements, equations = parsed_page()
+    document = Document()
+    for element in [*elements, *equations]:
+        document.add_element(1, element)
+    cache.put_document('0a' * 32, document)
+
+    cached = cache.get_document('0a' * 32)
+    text, table, image, equation = cached.elements[1]
+    assert text.text_content == "Some text"
+    assert text.equations_inside == [equation]
+    assert (equation.latex_content, equation.score) == (r"x^2", 0.75)
+    pd.testing.assert_frame_equal(table.table_data, elements[1].table_data)
+    assert image.image_content.size == (6, 4)
+
+
+def test_page_round_trip(tmp_path):
+    cache = ResultCache(tmp_path)
+    cache.put_page('0b' * 32, *parsed_page())
+    elements, equations = cache.get_page('0b' * 32)
+    assert [type(element).__name__ for element in elements] == ['TextElement', 'TableElement', 'ImageElement']
+    assert equations[0].is_inside_text
+
+
+def test_missing_entries(tmp_path):
+    cache = ResultCache(tmp_path)
+    cache.put_page('0c' * 32, [], [])
+    assert cache.get_document('0c' * 32) is None
+    assert cache.get_page('0d' * 32) is None
+
+
+def test_rejects_forged_entries(tmp_path, caplog):
+    cache = ResultCache(tmp_path)
+    cache._put('0e' * 32, '.page.pkl', Payload())
+    with caplog.at_level(logging.WARNING):
+        assert cache.get_page('0e' * 32) is None
+    assert "posix.system is not allowed" in caplog.text or "nt.system is not allowed" in caplog.text
+
+
+def test_ignores_corrupt_entries(tmp_path, caplog):
+    cache = ResultCache(tmp_path)
+    cache.put_page('0f' * 32, *parsed_page())
+    with open(cache._path('0f' * 32, '.page.pkl'), 'wb') as file:
+        file.write(b'not a pickle')
+    with caplog.at_level(logging.WARNING):
+        assert cache.get_page('0f' * 32) is None
+    assert "Ignoring the unreadable cached result" in caplog.text
+
+
+@pytest.mark.parametrize('value', [pickle.loads, print, __import__('subprocess').Popen, Payload])
+def test_restricted_load_rejects_other_globals(tmp_path, value):
+    path = tmp_path / 'entry.pkl'
+    path.write_bytes(pickle.dumps(value))
+    with open(path, 'rb') as file:
+        with pytest.raises(pickle.UnpicklingError, match="is not allowed in a parsing result"):
+            restricted_load(file)
+
+
+def test_key_and_fingerprint():
+    assert ResultCache.key('a', 1, [2, 3]) == ResultCache.key('a', 1, [2, 3])
+    assert ResultCache.key('a', 1, [2, 3]) != ResultCache.key('a', 1, [2, 4])
+    fingerprint = ResultCache.fingerprint({'resolution': 200}, packages=['numpy'])
+    assert fingerprint == ResultCache.fingerprint({'resolution': 200}, packages=['numpy'])
+    assert fingerprint != ResultCache.fingerprint({'resolution': 300}, packages=['numpy'])
+    assert fingerprint != ResultCache.fingerprint({'resolution': 200}, packages=['numpy', 'pandas'])